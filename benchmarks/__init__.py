@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+# Offline benchmarks of the hot paths, run with `python -m benchmarks [--output FILE] [--filter GLOB]`;
+# the JSON report can be kept and compared across revisions and secp256k1 backends.
+
+from typing import (
+    Any, Callable, Dict
+)
+
+# name -> zero-argument callable timed by the runner, built once by each module's benchmarks()
+Benchmarks = Dict[str, Callable[[], Any]]
+
+SEED: str = (
+    "5eb00bbddcf069084889a8ab9155568165f5c453ccb85e70811aaed6f6da5fc1"
+    "9a5ac40b389cd370d086206dec8aa6c43daea6690f20ad3d8d48b2d2ce9e38e4"
+)
+MNEMONIC: str = (
+    "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+)
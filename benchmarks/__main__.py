@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    List, Optional
+)
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import timeit
+
+from hdwallet import __version__
+from hdwallet.eccs import (
+    SLIP10Nist256p1ECC, SLIP10Secp256k1ECC
+)
+
+from . import (
+    Benchmarks, addresses, eccs, hds, mnemonics, seeds
+)
+
+
+def measure(name: str, benchmark, repeat: int) -> dict:
+    """
+    Time one benchmark, keeping the best of several runs.
+
+    :param name: The benchmark name.
+    :type name: str
+    :param benchmark: The zero-argument callable to time.
+    :type benchmark: Callable[[], Any]
+    :param repeat: The number of timed runs.
+    :type repeat: int
+
+    :return: The benchmark result.
+    :rtype: dict
+    """
+
+    timer: timeit.Timer = timeit.Timer(benchmark)
+    number, _ = timer.autorange()
+    seconds_per_op: float = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {
+        "name": name,
+        "number": number,
+        "repeat": repeat,
+        "seconds_per_op": seconds_per_op,
+        "ops_per_second": (1 / seconds_per_op) if seconds_per_op else None
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the offline hdwallet benchmarks and report them as JSON."
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="File to write the JSON report to, default stdout"
+    )
+    parser.add_argument(
+        "-f", "--filter", action="append", default=None,
+        help="Only run benchmarks whose name matches this glob pattern, may be repeated"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="Number of timed runs per benchmark, default 5"
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be a positive integer")
+
+    benchmarks: Benchmarks = { }
+    for module in [addresses, eccs, hds, mnemonics, seeds]:
+        benchmarks.update(module.benchmarks())
+
+    results: List[dict] = [ ]
+    for name, benchmark in benchmarks.items():
+        if args.filter and not any(fnmatch.fnmatchcase(name, pattern) for pattern in args.filter):
+            continue
+        results.append(measure(name=name, benchmark=benchmark, repeat=args.repeat))
+        print(f"{name}: {results[-1]['seconds_per_op'] * 1e6:.2f} us/op", file=sys.stderr)
+
+    report: dict = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "hdwallet": __version__,
+        "secp256k1": SLIP10Secp256k1ECC.BACKEND,
+        "nist256p1": SLIP10Nist256p1ECC.BACKEND,
+        "benchmarks": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=4)
+            output.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
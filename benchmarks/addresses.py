@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Dict, Tuple, Type
+)
+
+from hdwallet.eccs import (
+    IEllipticCurveCryptography, KholawEd25519ECC, SLIP10Ed25519ECC, SLIP10Ed25519Blake2bECC,
+    SLIP10Ed25519MoneroECC, SLIP10Nist256p1ECC, SLIP10Secp256k1ECC
+)
+from hdwallet.addresses import (
+    IAddress, ADDRESSES
+)
+from hdwallet.cryptocurrencies import Cardano
+from hdwallet.utils import get_bytes
+
+from . import Benchmarks
+
+# Compressed public keys of the fixtures, by ECC
+PUBLIC_KEYS: Dict[str, str] = {
+    KholawEd25519ECC.NAME: "00e55487c92c1913439f336b1b2dc316da6e88c02a157208f98781494b87f27eb8",
+    SLIP10Ed25519ECC.NAME: "00d14696583ee9144878635b557d515a502b04366818dfe7765737746b4f57978d",
+    SLIP10Ed25519Blake2bECC.NAME: "006aea61eeed872052377ab16b0fc5d9b9f142be59ac1488e6610645dedb4da45c",
+    SLIP10Nist256p1ECC.NAME: "02e4bd97a82a8f3e575a9a35b7cca19cd730addd499a2bd4e9a9811df8bfc35e51",
+    SLIP10Secp256k1ECC.NAME: "0374a436044b4904bbd7a074b098d65fad39fc5b66f28da8440f10dbcf86568429"
+}
+
+# Address name -> (ECC of its public key, extra encode keyword arguments)
+ADDRESS_ARGUMENTS: Dict[str, Tuple[Type[IEllipticCurveCryptography], dict]] = {
+    "Algorand": (SLIP10Ed25519ECC, { }),
+    "Aptos": (SLIP10Ed25519ECC, { }),
+    "Avalanche": (SLIP10Secp256k1ECC, { }),
+    "Cardano": (KholawEd25519ECC, {
+        "encode_type": Cardano.TYPES.BYRON_ICARUS, "chain_code": "d537f39c41f0f781f543c4c512cac38927e5ebd3cd82b870dd7ce94de9e510b4"
+    }),
+    "Cosmos": (SLIP10Secp256k1ECC, { }),
+    "EOS": (SLIP10Secp256k1ECC, { }),
+    "Ergo": (SLIP10Secp256k1ECC, {
+        "network_type": "mainnet"
+    }),
+    "Ethereum": (SLIP10Secp256k1ECC, { }),
+    "Filecoin": (SLIP10Secp256k1ECC, { }),
+    "Harmony": (SLIP10Secp256k1ECC, { }),
+    "Icon": (SLIP10Secp256k1ECC, { }),
+    "Injective": (SLIP10Secp256k1ECC, { }),
+    "Monero": (SLIP10Ed25519MoneroECC, {
+        "spend_public_key": "628247d3de93857cdd360fee4aef9a67ecfebedfe8eaec9cf6be35eacc895ca7",
+        "view_public_key": "1bc7b28fdaec0ec300c8c2759b1bf01f5300bb8465f736c55d64c5d87ec5e311"
+    }),
+    "MultiversX": (SLIP10Ed25519ECC, { }),
+    "Nano": (SLIP10Ed25519Blake2bECC, { }),
+    "Near": (SLIP10Ed25519ECC, { }),
+    "Neo": (SLIP10Nist256p1ECC, { }),
+    "OKT-Chain": (SLIP10Secp256k1ECC, { }),
+    "P2PKH": (SLIP10Secp256k1ECC, { }),
+    "P2SH": (SLIP10Secp256k1ECC, { }),
+    "P2TR": (SLIP10Secp256k1ECC, { }),
+    "P2WPKH": (SLIP10Secp256k1ECC, { }),
+    "P2WPKH-In-P2SH": (SLIP10Secp256k1ECC, { }),
+    "P2WSH": (SLIP10Secp256k1ECC, { }),
+    "P2WSH-In-P2SH": (SLIP10Secp256k1ECC, { }),
+    "Ripple": (SLIP10Secp256k1ECC, { }),
+    "Solana": (SLIP10Ed25519ECC, { }),
+    "Stellar": (SLIP10Ed25519ECC, { }),
+    "Sui": (SLIP10Ed25519ECC, { }),
+    "Tezos": (SLIP10Ed25519ECC, { }),
+    "Tron": (SLIP10Secp256k1ECC, { }),
+    "XinFin": (SLIP10Secp256k1ECC, { }),
+    "Zilliqa": (SLIP10Secp256k1ECC, { })
+}
+
+
+def benchmarks() -> Benchmarks:
+    """
+    Build the IAddress.encode benchmarks, one per registered address.
+
+    :return: The benchmarks, by name.
+    :rtype: Benchmarks
+    """
+
+    benchmarks: Benchmarks = { }
+    for name in ADDRESSES.names():
+        address: Type[IAddress] = ADDRESSES.address(name=name)
+        ecc, kwargs = ADDRESS_ARGUMENTS[name]
+        if ecc.NAME in PUBLIC_KEYS:
+            kwargs = dict(public_key=get_bytes(PUBLIC_KEYS[ecc.NAME]), **kwargs)
+        benchmarks[f"{address.__name__}.encode"] = (
+            lambda address=address, kwargs=kwargs: address.encode(**kwargs)
+        )
+    return benchmarks
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from hashlib import sha256
+from typing import List
+
+from hdwallet.eccs import (
+    KholawEd25519ECC, SLIP10Ed25519ECC, SLIP10Ed25519Blake2bECC, SLIP10Ed25519MoneroECC
+)
+from hdwallet.eccs.slip10.nist256p1 import SLIP10_NIST256P1_BACKENDS
+from hdwallet.eccs.slip10.secp256k1 import SLIP10_SECP256K1_BACKENDS
+from hdwallet.libs.ed25519 import scalar_reduce
+
+from . import Benchmarks
+
+# Private keys per batch, every one valid on every curve once reduced
+BATCH: List[bytes] = [
+    sha256(index.to_bytes(4, "big")).digest() for index in range(100)
+]
+
+
+def benchmarks() -> Benchmarks:
+    """
+    Build the batched public key generation and decoding benchmarks, 100 keys per call.
+
+    :return: The benchmarks, by name.
+    :rtype: Benchmarks
+    """
+
+    benchmarks: Benchmarks = { }
+    for ecc, backend, batch in [
+        *((ecc, backend, BATCH) for backend, ecc in SLIP10_SECP256K1_BACKENDS.items()),
+        *((ecc, backend, BATCH) for backend, ecc in SLIP10_NIST256P1_BACKENDS.items()),
+        (SLIP10Ed25519ECC, "pynacl", BATCH),
+        (SLIP10Ed25519Blake2bECC, "pynacl", BATCH),
+        (SLIP10Ed25519MoneroECC, "pynacl", [scalar_reduce(private_key) for private_key in BATCH]),
+        (KholawEd25519ECC, "pynacl", [private_key + private_key for private_key in BATCH])
+    ]:
+        benchmarks[f"{ecc.NAME}.public_keys_from_private_bytes[{backend},100]"] = (
+            lambda ecc=ecc, batch=batch: ecc.public_keys_from_private_bytes(batch)
+        )
+        if ecc.NAME in ["SLIP10-Secp256k1", "SLIP10-Ed25519"]:
+            public_keys: bytes = b"".join(ecc.public_keys_from_private_bytes(batch))
+            benchmarks[f"{ecc.NAME}.from_bytes_many[{backend},100]"] = (
+                lambda ecc=ecc, public_keys=public_keys: ecc.PUBLIC_KEY.from_bytes_many(public_keys, compressed=False)
+            )
+    return benchmarks
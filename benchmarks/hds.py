@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, Callable, Type
+)
+
+from hdwallet.eccs import (
+    IEllipticCurveCryptography, SLIP10Ed25519ECC
+)
+from hdwallet.eccs.slip10.nist256p1 import (
+    SLIP10_NIST256P1_BACKENDS
+)
+from hdwallet.eccs.slip10.secp256k1 import (
+    SLIP10Secp256k1ECCCoincurve, SLIP10Secp256k1ECCECDSA
+)
+from hdwallet.hds import (
+    BIP32HD, CardanoHD, ElectrumV1HD, MoneroHD
+)
+from hdwallet.derivations import CustomDerivation
+from hdwallet.cryptocurrencies import Cardano
+from hdwallet.seeds import (
+    CardanoSeed, MoneroSeed
+)
+
+from . import (
+    Benchmarks, SEED, MNEMONIC
+)
+
+HARDENED: int = 0x80000000
+
+
+def drive_from(hd: BIP32HD, index: int) -> Callable[[], Any]:
+    """
+    Build a callable that derives one child of the current node of a BIP32HD instance.
+
+    :param hd: The HD instance, already driven to the parent node.
+    :type hd: BIP32HD
+    :param index: The child index to derive.
+    :type index: int
+
+    :return: The callable to time.
+    :rtype: Callable[[], Any]
+    """
+
+    node: tuple = hd._node()
+
+    def drive() -> Any:
+        hd._restore_node(node)
+        return hd.drive(index)
+    return drive
+
+
+def bip32_benchmarks(ecc: Type[IEllipticCurveCryptography], backend: str) -> Benchmarks:
+    """
+    Build the BIP32HD.drive benchmarks of one ECC.
+
+    :param ecc: The ECC class to derive with.
+    :type ecc: Type[IEllipticCurveCryptography]
+    :param backend: The backend label of the ECC.
+    :type backend: str
+
+    :return: The benchmarks, by name.
+    :rtype: Benchmarks
+    """
+
+    private_hd: BIP32HD = BIP32HD(ecc=ecc).from_seed(seed=SEED)
+    private_hd.from_derivation(derivation=CustomDerivation(path="m/44'/0'/0'"))
+
+    benchmarks: Benchmarks = {
+        f"BIP32HD.drive[{ecc.NAME}:{backend},private,hardened]": drive_from(private_hd, HARDENED),
+    }
+    if ecc.NAME in ["SLIP10-Secp256k1", "SLIP10-Nist256p1"]:
+        public_hd: BIP32HD = BIP32HD(ecc=ecc).from_xpublic_key(xpublic_key=private_hd.xpublic_key())
+        benchmarks.update({
+            f"BIP32HD.drive[{ecc.NAME}:{backend},private,non-hardened]": drive_from(private_hd, 0),
+            f"BIP32HD.drive[{ecc.NAME}:{backend},public,non-hardened]": drive_from(public_hd, 0)
+        })
+    return benchmarks
+
+
+def benchmarks() -> Benchmarks:
+    """
+    Build the HD derivation benchmarks.
+
+    :return: The benchmarks, by name.
+    :rtype: Benchmarks
+    """
+
+    benchmarks: Benchmarks = { }
+    for ecc, backend in [
+        (SLIP10Secp256k1ECCCoincurve, "coincurve"),
+        (SLIP10Secp256k1ECCECDSA, "ecdsa"),
+        *((ecc, backend) for backend, ecc in SLIP10_NIST256P1_BACKENDS.items()),
+        (SLIP10Ed25519ECC, "pynacl")
+    ]:
+        benchmarks.update(bip32_benchmarks(ecc=ecc, backend=backend))
+
+    cardano_hd: CardanoHD = CardanoHD(cardano_type=Cardano.TYPES.SHELLEY_ICARUS).from_seed(
+        seed=CardanoSeed.from_mnemonic(mnemonic=MNEMONIC, cardano_type=Cardano.TYPES.SHELLEY_ICARUS)
+    )
+    cardano_hd.from_derivation(derivation=CustomDerivation(path="m/1852'/1815'/0'"))
+    benchmarks.update({
+        "CardanoHD.drive[private,hardened]": drive_from(cardano_hd, HARDENED),
+        "CardanoHD.drive[private,non-hardened]": drive_from(cardano_hd, 0)
+    })
+
+    monero_hd: MoneroHD = MoneroHD().from_seed(seed=MoneroSeed(SEED[:64]))
+    benchmarks["MoneroHD.drive"] = lambda: monero_hd.drive(minor_index=1, major_index=0)
+
+    electrum_v1_hd: ElectrumV1HD = ElectrumV1HD().from_seed(seed=SEED[:64])
+    benchmarks["ElectrumV1HD.drive"] = lambda: electrum_v1_hd.drive(change_index=0, address_index=1)
+
+    return benchmarks
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from hdwallet.mnemonics import (
+    BIP39Mnemonic, BIP39_MNEMONIC_LANGUAGES
+)
+
+from . import (
+    Benchmarks, MNEMONIC
+)
+
+
+def benchmarks() -> Benchmarks:
+    """
+    Build the mnemonic decode benchmarks.
+
+    :return: The benchmarks, by name.
+    :rtype: Benchmarks
+    """
+
+    mnemonic_24: str = BIP39Mnemonic.from_entropy(
+        entropy="ff" * 32, language=BIP39_MNEMONIC_LANGUAGES.ENGLISH
+    )
+    return {
+        "BIP39Mnemonic.decode[12-words]": lambda: BIP39Mnemonic.decode(mnemonic=MNEMONIC),
+        "BIP39Mnemonic.decode[24-words]": lambda: BIP39Mnemonic.decode(mnemonic=mnemonic_24),
+        "BIP39Mnemonic.decode[12-words,language]": lambda: BIP39Mnemonic.decode(
+            mnemonic=MNEMONIC, language=BIP39_MNEMONIC_LANGUAGES.ENGLISH
+        )
+    }
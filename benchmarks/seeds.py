@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from hdwallet.seeds import BIP39Seed
+
+from . import (
+    Benchmarks, MNEMONIC
+)
+
+
+def benchmarks() -> Benchmarks:
+    """
+    Build the seed generation benchmarks.
+
+    :return: The benchmarks, by name.
+    :rtype: Benchmarks
+    """
+
+    return {
+        "BIP39Seed.from_mnemonic": lambda: BIP39Seed.from_mnemonic(mnemonic=MNEMONIC),
+        "BIP39Seed.from_mnemonic[passphrase]": lambda: BIP39Seed.from_mnemonic(
+            mnemonic=MNEMONIC, passphrase="talonlab"
+        )
+    }
@@ -11,11 +11,11 @@ from typing import (
 from ..libs.base58 import (
     ensure_string, encode, decode
 )
-from ..libs.ripemd160 import ripemd160
 from ..eccs import (
     IPublicKey, SLIP10Secp256k1PublicKey, validate_and_get_public_key
 )
 from ..cryptocurrencies import EOS
+from ..crypto import ripemd160
 from ..utils import bytes_to_string
 from .iaddress import IAddress
 
@@ -163,6 +163,13 @@ def cli_mnemonic(**kwargs) -> None:
 @click.option(
     "-mt", "--mnemonic-type", type=str, default="standard", help="Set Mnemonic type for Electrum-V2", show_default=True
 )
+@click.option(
+    "-mf", "--mnemonics-file", type=click.File("r"), default=None,
+    help="Set a file ('-' for stdin) of mnemonics, one per line, for batch BIP39/Electrum-V2 seed generation"
+)
+@click.option(
+    "-w", "--workers", type=click.IntRange(min=1), default=None, help="Set number of threads for batch seed generation"
+)
 def cli_seed(**kwargs) -> None:
     return generate_seed(**process_kwargs(kwargs))
 
@@ -4,6 +4,8 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from typing import List
+
 import json
 import click
 import sys
@@ -14,7 +16,67 @@ from ...seeds import (
 )
 
 
+def generate_seeds(**kwargs) -> None:
+    try:
+        if kwargs.get("client") not in [BIP39Seed.name(), ElectrumV2Seed.name()]:
+            click.echo(click.style(
+                f"Wrong batch seed client, (expected={[BIP39Seed.name(), ElectrumV2Seed.name()]}, got='{kwargs.get('client')}')"
+            ), err=True)
+            sys.exit()
+
+        mnemonics: List[str] = [
+            line.strip() for line in kwargs.get("mnemonics_file") if line.strip()
+        ]
+        for index, mnemonic in enumerate(mnemonics):
+            if kwargs.get("client") == ElectrumV2Seed.name():
+                valid: bool = MNEMONICS.mnemonic(name="Electrum-V2").is_valid(
+                    mnemonic=mnemonic, mnemonic_type=kwargs.get("mnemonic_type")
+                )
+            else:
+                valid: bool = MNEMONICS.mnemonic(name="BIP39").is_valid(
+                    mnemonic=mnemonic, language=kwargs.get("language")
+                )
+            if not valid:
+                click.echo(click.style(f"Invalid {kwargs.get('client')} mnemonic on line {index + 1}"), err=True)
+                sys.exit()
+
+        if kwargs.get("client") == BIP39Seed.name():
+            seeds: List[str] = BIP39Seed.from_mnemonics(
+                mnemonics=mnemonics,
+                passphrases=kwargs.get("passphrase"),
+                language=kwargs.get("language"),
+                workers=kwargs.get("workers")
+            )
+        else:
+            seeds: List[str] = ElectrumV2Seed.from_mnemonics(
+                mnemonics=mnemonics,
+                passphrases=kwargs.get("passphrase"),
+                language=kwargs.get("language"),
+                mnemonic_type=kwargs.get("mnemonic_type"),
+                workers=kwargs.get("workers")
+            )
+
+        outputs: List[dict] = []
+        for seed in seeds:
+            output: dict = {
+                "client": kwargs.get("client"),
+                "seed": seed
+            }
+            if kwargs.get("client") == ElectrumV2Seed.name():
+                output["mnemonic_type"] = kwargs.get("mnemonic_type")
+            outputs.append(output)
+        click.echo(json.dumps(
+            outputs, indent=kwargs.get("indent", 4), ensure_ascii=kwargs.get("ensure_ascii", False)
+        ))
+
+    except Exception as exception:
+        click.echo(click.style(f"Error: {str(exception)}"), err=True)
+        sys.exit()
+
+
 def generate_seed(**kwargs) -> None:
+    if kwargs.get("mnemonics_file"):
+        return generate_seeds(**kwargs)
     try:
         if not kwargs.get("mnemonic"):
             click.echo(click.style(f"Mnemonic is required for {kwargs.get('client')} client"), err=True)
@@ -92,7 +92,7 @@ class SLIP10_SECP256K1_CONST:
     +-------------------------------------+-------------+
     | Name                                | Value       |
     +=====================================+=============+
-    | USE                                 | 'coincurve' |
+    | USE                                 | 'auto'      |
     +-------------------------------------+-------------+
     | POINT_COORDINATE_BYTE_LENGTH        | 32          |
     +-------------------------------------+-------------+
@@ -106,7 +106,7 @@ class SLIP10_SECP256K1_CONST:
     +-------------------------------------+-------------+
     """
 
-    USE: Literal["coincurve", "ecdsa"] = "coincurve"
+    USE: Literal["auto", "coincurve", "ecdsa"] = "auto"
     POINT_COORDINATE_BYTE_LENGTH: int = 32
     PRIVATE_KEY_BYTE_LENGTH: int = 32
     PRIVATE_KEY_UNCOMPRESSED_PREFIX: int = 0x00
@@ -117,6 +117,35 @@ class SLIP10_SECP256K1_CONST:
     CHECKSUM_BYTE_LENGTH: int = 4
 
 
+class SLIP10_NIST256P1_CONST:
+    """
+    ``SLIP10-NIST256P1`` Constants.
+
+    +-------------------------------------+-------------+
+    | Name                                | Value       |
+    +=====================================+=============+
+    | USE                                 | 'ecdsa'     |
+    +-------------------------------------+-------------+
+    | POINT_COORDINATE_BYTE_LENGTH        | 32          |
+    +-------------------------------------+-------------+
+    | PRIVATE_KEY_BYTE_LENGTH             | 32          |
+    +-------------------------------------+-------------+
+    | PUBLIC_KEY_PREFIX                   | ``0x04``    |
+    +-------------------------------------+-------------+
+    | PUBLIC_KEY_COMPRESSED_BYTE_LENGTH   | 33          |
+    +-------------------------------------+-------------+
+    | PUBLIC_KEY_UNCOMPRESSED_BYTE_LENGTH | 65          |
+    +-------------------------------------+-------------+
+    """
+
+    USE: Literal["auto", "cryptography", "ecdsa"] = "ecdsa"
+    POINT_COORDINATE_BYTE_LENGTH: int = 32
+    PRIVATE_KEY_BYTE_LENGTH: int = 32
+    PUBLIC_KEY_UNCOMPRESSED_PREFIX: bytes = b"\x04"
+    PUBLIC_KEY_COMPRESSED_BYTE_LENGTH: int = 33
+    PUBLIC_KEY_UNCOMPRESSED_BYTE_LENGTH: int = 65
+
+
 class Info(NestedNamespace):
 
     SOURCE_CODE: Optional[str]
@@ -5,13 +5,14 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, Tuple
+    Any, Optional, Union, Tuple, Callable, Iterable, List
 )
 from Crypto.Hash import (
-    SHA512, SHA3_256, keccak
+    SHA512, SHA3_256, RIPEMD160, keccak
 )
 from Crypto.Cipher import ChaCha20_Poly1305
 from Crypto.Protocol.KDF import PBKDF2
+from concurrent.futures import ThreadPoolExecutor
 
 import binascii
 import crcmod.predefined
@@ -25,6 +26,42 @@ from .utils import (
 )
 
 
+def _hashlib_ripemd160(data: bytes) -> bytes:
+    return hashlib.new("ripemd160", data).digest()
+
+
+def _pycryptodome_ripemd160(data: bytes) -> bytes:
+    return RIPEMD160.new(data).digest()
+
+
+def _select_ripemd160() -> Tuple[str, Callable[[bytes], bytes]]:
+    """
+    Select the fastest available RIPEMD-160 implementation.
+
+    hashlib (OpenSSL) is tried first, since OpenSSL 3 may list RIPEMD-160 in
+    ``hashlib.algorithms_available`` but refuse it without the legacy provider;
+    then pycryptodome, then the pure-Python fallback.
+
+    :return: The backend name and its RIPEMD-160 function.
+    :rtype: Tuple[str, Callable[[bytes], bytes]]
+    """
+
+    try:
+        hashlib.new("ripemd160", b"")
+        return "hashlib", _hashlib_ripemd160
+    except ValueError:
+        pass
+    try:
+        RIPEMD160.new(b"")
+        return "pycryptodome", _pycryptodome_ripemd160
+    except Exception:
+        pass
+    return "python", r160
+
+
+RIPEMD160_BACKEND, _ripemd160 = _select_ripemd160()
+
+
 def hmac_sha256(key: Union[bytes, str], data: Union[bytes, str]) -> bytes:
     """
     Generate an HMAC-SHA256 hash of the given data using the provided key.
@@ -292,7 +329,7 @@ def hash160(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    return ripemd160(sha256(data))
+    return _ripemd160(sha256(data))
 
 
 def crc32(data: Union[bytes, str]) -> bytes:
@@ -378,9 +415,18 @@ def ripemd160(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    if "ripemd160" in hashlib.algorithms_available:
-        hashlib.new("ripemd160", get_bytes(data)).digest()
-    return r160(get_bytes(data))
+    return _ripemd160(get_bytes(data))
+
+
+def ripemd160_backend() -> str:
+    """
+    Get the name of the active RIPEMD-160 backend, selected once at import time.
+
+    :return: One of "hashlib", "pycryptodome" or "python".
+    :rtype: str
+    """
+
+    return RIPEMD160_BACKEND
 
 
 def get_checksum(data: Union[str, bytes]) -> bytes:
@@ -444,3 +490,187 @@ def sha3_256(data: Union[str, bytes]) -> bytes:
     if "sha3_256" in hashlib.algorithms_available:
         return hashlib.new("sha3_256", encode(data)).digest()
     return SHA3_256.new(encode(data)).digest()
+
+
+def _map_many(function: Callable[[Any], bytes], datas: Iterable[Any], workers: Optional[int] = None) -> List[bytes]:
+    """
+    Apply a single-buffer hash function across many buffers, optionally on a thread pool.
+
+    hashlib releases the GIL while hashing large buffers, so ``workers`` pays off for
+    big inputs or very large batches; small batches always run inline.
+
+    :param function: The hash function applied to each buffer.
+    :type function: Callable[[Any], bytes]
+    :param datas: The buffers to hash.
+    :type datas: Iterable[Any]
+    :param workers: Optional number of threads to spread the batch over.
+    :type workers: Optional[int]
+
+    :return: The digests, in input order.
+    :rtype: List[bytes]
+    """
+
+    datas = list(datas)
+    if workers is None or workers < 2 or len(datas) < 2:
+        return [function(data) for data in datas]
+
+    size: int = -(-len(datas) // workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [
+            digest for digests in executor.map(
+                lambda chunk: [function(data) for data in chunk],
+                [datas[index:index + size] for index in range(0, len(datas), size)]
+            ) for digest in digests
+        ]
+
+
+def sha256_many(datas: Iterable[bytes], prefix: bytes = b"", workers: Optional[int] = None) -> List[bytes]:
+    """
+    Calculate the SHA-256 hash of many buffers sharing an optional common prefix.
+
+    The prefix is absorbed once and the hash state copied per buffer, which also
+    covers BIP340 tagged hashes (``prefix=sha256(tag) * 2``). Buffers must be bytes.
+
+    :param datas: The buffers to hash.
+    :type datas: Iterable[bytes]
+    :param prefix: Optional bytes prepended to every buffer.
+    :type prefix: bytes
+    :param workers: Optional number of threads to spread the batch over.
+    :type workers: Optional[int]
+
+    :return: The SHA-256 digests, in input order.
+    :rtype: List[bytes]
+    """
+
+    state = hashlib.sha256(prefix)
+
+    def _sha256(data: bytes) -> bytes:
+        _state = state.copy()
+        _state.update(data)
+        return _state.digest()
+
+    return _map_many(_sha256, datas, workers)
+
+
+def double_sha256_many(datas: Iterable[bytes], workers: Optional[int] = None) -> List[bytes]:
+    """
+    Calculate the double SHA-256 hash of many buffers.
+
+    :param datas: The buffers to hash.
+    :type datas: Iterable[bytes]
+    :param workers: Optional number of threads to spread the batch over.
+    :type workers: Optional[int]
+
+    :return: The double SHA-256 digests, in input order.
+    :rtype: List[bytes]
+    """
+
+    return _map_many(
+        lambda data: hashlib.sha256(hashlib.sha256(data).digest()).digest(), datas, workers
+    )
+
+
+def hash160_many(datas: Iterable[bytes], workers: Optional[int] = None) -> List[bytes]:
+    """
+    Calculate the HASH160 hash (RIPEMD-160 of SHA-256) of many buffers.
+
+    :param datas: The buffers to hash.
+    :type datas: Iterable[bytes]
+    :param workers: Optional number of threads to spread the batch over.
+    :type workers: Optional[int]
+
+    :return: The HASH160 digests, in input order.
+    :rtype: List[bytes]
+    """
+
+    return _map_many(
+        lambda data: _ripemd160(hashlib.sha256(data).digest()), datas, workers
+    )
+
+
+def kekkak256_many(datas: Iterable[bytes], prefix: bytes = b"", workers: Optional[int] = None) -> List[bytes]:
+    """
+    Calculate the Keccak-256 hash of many buffers sharing an optional common prefix,
+    such as Monero's ``b"SubAddr\\x00" + view_private_key``.
+
+    :param datas: The buffers to hash.
+    :type datas: Iterable[bytes]
+    :param prefix: Optional bytes prepended to every buffer.
+    :type prefix: bytes
+    :param workers: Optional number of threads to spread the batch over.
+    :type workers: Optional[int]
+
+    :return: The Keccak-256 digests, in input order.
+    :rtype: List[bytes]
+    """
+
+    return _map_many(
+        lambda data: keccak.new(data=prefix + data, digest_bits=256).digest(), datas, workers
+    )
+
+
+def blake2b_many(
+    datas: Iterable[bytes], digest_size: int, key: bytes = b"", salt: bytes = b"", workers: Optional[int] = None
+) -> List[bytes]:
+    """
+    Calculate the BLAKE2b hash of many buffers, keying and salting the hash state once.
+
+    :param datas: The buffers to hash.
+    :type datas: Iterable[bytes]
+    :param digest_size: The size of each resulting digest in bytes.
+    :type digest_size: int
+    :param key: Optional key for keyed hashing.
+    :type key: bytes
+    :param salt: Optional salt.
+    :type salt: bytes
+    :param workers: Optional number of threads to spread the batch over.
+    :type workers: Optional[int]
+
+    :return: The BLAKE2b digests, in input order.
+    :rtype: List[bytes]
+    """
+
+    state = hashlib.blake2b(digest_size=digest_size, key=key, salt=salt)
+
+    def _blake2b(data: bytes) -> bytes:
+        _state = state.copy()
+        _state.update(data)
+        return _state.digest()
+
+    return _map_many(_blake2b, datas, workers)
+
+
+def pbkdf2_hmac_sha512_many(
+    passwords: Iterable[Union[bytes, str]],
+    salts: Iterable[Union[bytes, str]],
+    iteration_num: int,
+    derived_key_length: Optional[int] = None,
+    workers: Optional[int] = None
+) -> List[bytes]:
+    """
+    Derive many keys using PBKDF2-HMAC-SHA512, pairing each password with its salt.
+
+    ``hashlib.pbkdf2_hmac`` releases the GIL for the whole stretch, so ``workers``
+    threads run the derivations in parallel.
+
+    :param passwords: The passwords to derive keys from, as bytes or strings.
+    :type passwords: Iterable[Union[bytes, str]]
+    :param salts: The salt for each password, as bytes or strings.
+    :type salts: Iterable[Union[bytes, str]]
+    :param iteration_num: The number of iterations of the HMAC-SHA512 hashing to apply.
+    :type iteration_num: int
+    :param derived_key_length: Optional. The desired length of each derived key in bytes.
+    :type derived_key_length: Optional[int]
+    :param workers: Optional number of threads to spread the batch over.
+    :type workers: Optional[int]
+
+    :return: The derived keys, in input order.
+    :rtype: List[bytes]
+    """
+
+    return _map_many(
+        lambda password_salt: pbkdf2_hmac_sha512(
+            password=password_salt[0], salt=password_salt[1],
+            iteration_num=iteration_num, derived_key_length=derived_key_length
+        ), zip(passwords, salts), workers
+    )
@@ -25,6 +25,12 @@ from .slip10 import (  # noqa: F401
 from .iecc import (  # noqa: F401
     IPoint, IPublicKey, IPrivateKey, IEllipticCurveCryptography
 )
+from .slip10.nist256p1 import (  # noqa: F401
+    use as use_nist256p1
+)
+from .slip10.secp256k1 import (  # noqa: F401
+    use as use_secp256k1
+)
 
 
 class ECCS:
@@ -158,7 +164,7 @@ __all__: List[str] = [
     "SLIP10Ed25519MoneroPoint", "SLIP10Ed25519MoneroPublicKey", "SLIP10Ed25519MoneroPrivateKey",
     "SLIP10Nist256p1Point", "SLIP10Nist256p1PublicKey", "SLIP10Nist256p1PrivateKey",
     "SLIP10Secp256k1Point", "SLIP10Secp256k1PublicKey", "SLIP10Secp256k1PrivateKey",
-    "ECCS", "validate_and_get_public_key"
+    "ECCS", "validate_and_get_public_key", "use_nist256p1", "use_secp256k1"
 ] + [
     cls.__name__ for cls in ECCS.classes()
 ]
@@ -4,6 +4,10 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from typing import (
+    Iterable, List
+)
+
 from .ipoint import IPoint
 from .ipublic_key import IPublicKey
 from .iprivate_key import IPrivateKey
@@ -24,3 +28,20 @@ class IEllipticCurveCryptography:
     POINT: IPoint
     PUBLIC_KEY: IPublicKey
     PRIVATE_KEY: IPrivateKey
+
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, with the fastest primitive
+        of this curve's private key class.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        return cls.PRIVATE_KEY.public_keys_from_private_bytes(batch, compressed=compressed)
@@ -6,7 +6,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import (
+    Any, Iterable, List
+)
 from abc import (
     ABC, abstractmethod
 )
@@ -76,6 +78,38 @@ class IPrivateKey(ABC):
         :rtype: int
         """
 
+    def __reduce__(self) -> tuple:
+        """
+        Reduce the private key to its raw bytes, so it can be pickled across processes.
+
+        :return: The callable and arguments that recreate this private key.
+        :rtype: tuple
+        """
+
+        return self.__class__.from_bytes, (self.raw(),)
+
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once.
+
+        Implementations override this to skip the per-key private and public key objects.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        public_keys: List[bytes] = []
+        for private_key in batch:
+            public_key: IPublicKey = cls.from_bytes(private_key).public_key()
+            public_keys.append(public_key.raw_compressed() if compressed else public_key.raw_uncompressed())
+        return public_keys
+
     @classmethod
     def is_valid_bytes(cls, private_key: bytes) -> bool:
         """
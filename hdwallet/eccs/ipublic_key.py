@@ -6,11 +6,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import (
+    Any, List, Optional, Union
+)
 from abc import (
     ABC, abstractmethod
 )
 
+from ..utils import bytes_to_integer
 from .ipoint import IPoint
 
 
@@ -108,6 +111,85 @@ class IPublicKey(ABC):
         :rtype: int
         """
 
+    def add_tweak(self, tweak: bytes) -> "IPublicKey":
+        """
+        Add the generator multiple ``tweak * G`` to the public key point, as used by
+        non-hardened BIP32 public key derivation. Backends with a native tweak override this
+        point arithmetic.
+
+        :param tweak: The big-endian scalar tweak bytes.
+        :type tweak: bytes
+
+        :return: The tweaked public key.
+        :rtype: IPublicKey
+        """
+
+        from . import ECCS  # The ECC classes import this interface
+
+        return self.from_point(
+            self.point() + (ECCS.ecc(name=self.name()).GENERATOR * bytes_to_integer(tweak))
+        )
+
+    def __reduce__(self) -> tuple:
+        """
+        Reduce the public key to its compressed bytes, so it can be pickled across processes.
+
+        :return: The callable and arguments that recreate this public key.
+        :rtype: tuple
+        """
+
+        return self.__class__.from_bytes, (self.raw_compressed(),)
+
+    @classmethod
+    def _records(cls, public_keys: Union[bytes, bytearray, memoryview], length: Optional[int] = None) -> memoryview:
+        """
+        Check a buffer of fixed length public key records and view it as bytes.
+
+        :param public_keys: The public keys, back to back in ``length`` byte records.
+        :type public_keys: Union[bytes, bytearray, memoryview]
+        :param length: The byte length of every record, defaults to the compressed length.
+        :type length: Optional[int]
+
+        :return: The buffer as a flat byte view.
+        :rtype: memoryview
+        """
+
+        view: memoryview = memoryview(public_keys).cast("B")
+        if length is None:
+            length = cls.compressed_length()
+        if length < 1 or len(view) % length:
+            raise ValueError("Invalid public keys buffer length")
+        return view
+
+    @classmethod
+    def from_bytes_many(
+        cls, public_keys: Union[bytes, bytearray, memoryview], length: Optional[int] = None, compressed: bool = True
+    ) -> List[bytes]:
+        """
+        Validate, decompress and normalize many public keys in one pass.
+
+        Implementations override this to skip the per-key public key objects.
+
+        :param public_keys: The public keys, back to back in ``length`` byte records.
+        :type public_keys: Union[bytes, bytearray, memoryview]
+        :param length: The byte length of every record, defaults to the compressed length.
+        :type length: Optional[int]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of the records.
+        :rtype: List[bytes]
+        """
+
+        if length is None:
+            length = cls.compressed_length()
+        view: memoryview = cls._records(public_keys, length)
+        normalized: List[bytes] = []
+        for offset in range(0, len(view), length):
+            public_key: IPublicKey = cls.from_bytes(bytes(view[offset:offset + length]))
+            normalized.append(public_key.raw_compressed() if compressed else public_key.raw_uncompressed())
+        return normalized
+
     @classmethod
     def is_valid_bytes(cls, public_key: bytes) -> bool:
         """
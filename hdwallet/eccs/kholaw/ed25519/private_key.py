@@ -4,10 +4,14 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, Iterable, List
+)
 from nacl.signing import VerifyKey
 
-from ....consts import KHOLAW_ED25519_CONST
+from ....consts import (
+    KHOLAW_ED25519_CONST, SLIP10_ED25519_CONST
+)
 from ....libs.ed25519 import point_scalar_mul_base
 from ...slip10.ed25519 import SLIP10Ed25519PrivateKey
 from ...iecc import (
@@ -115,3 +119,29 @@ class KholawEd25519PrivateKey(IPrivateKey):
         return KholawEd25519PublicKey(VerifyKey(
             point_scalar_mul_base(bytes(self.signing_key.underlying_object()))
         ))
+
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, straight from libsodium.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        public_keys: List[bytes] = []
+        for private_key in batch:
+            if len(private_key) != cls.length():
+                raise ValueError("Invalid private key bytes")
+            try:
+                public_keys.append(
+                    SLIP10_ED25519_CONST.PUBLIC_KEY_PREFIX + point_scalar_mul_base(private_key[:SLIP10Ed25519PrivateKey.length()])
+                )
+            except RuntimeError as ex:
+                raise ValueError("Invalid private key bytes") from ex
+        return public_keys
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Dict, Optional, Type
+)
+
+import sys
+import time
+
+from ...exceptions import ECCError
+from ..iecc import IEllipticCurveCryptography
+
+
+def calibrate_backends(backends: Dict[str, Type[IEllipticCurveCryptography]], rounds: int = 8) -> str:
+    """
+    Time a few scalar multiplications on every backend of one curve.
+
+    An arbitrary point is multiplied, so generator tables built on first use stay out of
+    the measurement, and a backend is dropped as soon as it falls behind the fastest one.
+
+    :param backends: The curve's backend ECC classes by name.
+    :type backends: Dict[str, Type[IEllipticCurveCryptography]]
+    :param rounds: The number of multiplications timed per backend, defaults to 8.
+    :type rounds: int
+
+    :return: The name of the fastest backend.
+    :rtype: str
+    """
+
+    timings: Dict[str, float] = {}
+    for name, ecc in backends.items():
+        fastest: Optional[float] = min(timings.values(), default=None)
+        point = ecc.POINT.from_coordinates(ecc.GENERATOR.x(), ecc.GENERATOR.y())
+        started: float = time.perf_counter()
+        for index in range(rounds):
+            point = point * (ecc.ORDER - 2 - index)
+            timings[name] = time.perf_counter() - started
+            if fastest is not None and timings[name] > fastest:
+                break
+    return min(timings, key=timings.get)
+
+
+def use_backend(
+    ecc: Type[IEllipticCurveCryptography],
+    backends: Dict[str, Type[IEllipticCurveCryptography]],
+    backend: str,
+    aliases: Dict[str, str]
+) -> str:
+    """
+    Point a curve's ECC class, and the module level aliases of its classes, at one backend.
+
+    ``ecc`` is updated in place, and every loaded ``hdwallet`` module's ``aliases`` names bound
+    to one of the backends' classes are rebound to the selected backend's; modules outside the
+    package keep whatever they imported.
+
+    :param ecc: The curve's ECC class shared by all importers.
+    :type ecc: Type[IEllipticCurveCryptography]
+    :param backends: The curve's backend ECC classes by name.
+    :type backends: Dict[str, Type[IEllipticCurveCryptography]]
+    :param backend: A name from ``backends``, or ``"auto"`` to calibrate.
+    :type backend: str
+    :param aliases: The alias names to rebind, mapped to the ECC attribute each follows.
+    :type aliases: Dict[str, str]
+
+    :return: The name of the backend now in use.
+    :rtype: str
+    """
+
+    if backend == "auto":
+        backend = calibrate_backends(backends) if len(backends) > 1 else next(iter(backends))
+    if backend not in backends:
+        raise ECCError(
+            f"Invalid {ecc.NAME} backend", expected=["auto"] + list(backends.keys()), got=backend
+        )
+
+    selected: Type[IEllipticCurveCryptography] = backends[backend]
+    ecc.BACKEND = backend
+    for attribute in ("GENERATOR", "POINT", "PUBLIC_KEY", "PRIVATE_KEY"):
+        setattr(ecc, attribute, getattr(selected, attribute))
+
+    for alias, attribute in aliases.items():
+        candidates = {getattr(other, attribute) for other in backends.values()}
+        for name, module in list(sys.modules.items()):
+            if name != "hdwallet" and not name.startswith("hdwallet."):
+                continue
+            namespace = getattr(module, "__dict__", None)
+            if isinstance(namespace, dict) and namespace.get(alias) in candidates:
+                namespace[alias] = getattr(selected, attribute)
+    return backend
@@ -4,10 +4,14 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, Iterable, List
+)
+from hashlib import blake2b
 from ed25519_blake2b import SigningKey
 
 from .....consts import SLIP10_ED25519_CONST
+from .....libs.ed25519 import point_scalar_mul_base
 from ....iecc import (
     IPublicKey, IPrivateKey
 )
@@ -96,3 +100,30 @@ class SLIP10Ed25519Blake2bPrivateKey(IPrivateKey):
         """
 
         return SLIP10Ed25519Blake2bPublicKey(self.signing_key.get_verifying_key())
+
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, multiplying the clamped
+        BLAKE2b digests of the seeds in libsodium.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        public_keys: List[bytes] = []
+        for private_key in batch:
+            if len(private_key) != cls.length():
+                raise ValueError("Invalid private key bytes")
+            scalar: bytearray = bytearray(blake2b(private_key, digest_size=64).digest()[:32])
+            scalar[0] &= 248
+            scalar[31] = (scalar[31] & 127) | 64
+            public_keys.append(
+                SLIP10_ED25519_CONST.PUBLIC_KEY_PREFIX + point_scalar_mul_base(bytes(scalar))
+            )
+        return public_keys
@@ -4,6 +4,9 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from typing import (
+    Iterable, List
+)
 from nacl.signing import VerifyKey
 
 from ....iecc import (
@@ -58,3 +61,27 @@ class SLIP10Ed25519MoneroPrivateKey(SLIP10Ed25519PrivateKey):
                 point_scalar_mul_base(bytes(self.signing_key))
             )
         )
+
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, straight from libsodium.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        public_keys: List[bytes] = []
+        for private_key in batch:
+            if len(private_key) != cls.length() or not scalar_is_valid(private_key):
+                raise ValueError("Invalid private key bytes")
+            try:
+                public_keys.append(point_scalar_mul_base(private_key))
+            except RuntimeError as ex:
+                raise ValueError("Invalid private key bytes") from ex
+        return public_keys
@@ -4,8 +4,11 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, Iterable, List
+)
 from nacl.signing import SigningKey
+from nacl.bindings import crypto_sign_seed_keypair
 from nacl import exceptions
 
 from ....consts import SLIP10_ED25519_CONST
@@ -97,3 +100,26 @@ class SLIP10Ed25519PrivateKey(IPrivateKey):
         """
 
         return SLIP10Ed25519PublicKey(self.signing_key.verify_key)
+
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, straight from libsodium.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        public_keys: List[bytes] = []
+        for private_key in batch:
+            if len(private_key) != cls.length():
+                raise ValueError("Invalid private key bytes")
+            public_keys.append(
+                SLIP10_ED25519_CONST.PUBLIC_KEY_PREFIX + crypto_sign_seed_keypair(private_key)[0]
+            )
+        return public_keys
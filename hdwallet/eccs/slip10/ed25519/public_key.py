@@ -4,8 +4,11 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, List, Optional, Union
+)
 from nacl.signing import VerifyKey
+from nacl.bindings import crypto_core_ed25519_is_valid_point
 from nacl import exceptions
 
 from ....consts import SLIP10_ED25519_CONST
@@ -67,6 +70,47 @@ class SLIP10Ed25519PublicKey(IPublicKey):
         except (exceptions.RuntimeError, exceptions.ValueError) as ex:
             raise ValueError("Invalid public key bytes") from ex
 
+    @classmethod
+    def from_bytes_many(
+        cls, public_keys: Union[bytes, bytearray, memoryview], length: Optional[int] = None, compressed: bool = True
+    ) -> List[bytes]:
+        """
+        Validate and normalize many public keys in one pass. libsodium accepts the canonical
+        points of the main subgroup, and only the points it rejects get the slower on-curve
+        check ``from_bytes`` applies.
+
+        :param public_keys: The public keys, back to back in ``length`` byte records.
+        :type public_keys: Union[bytes, bytearray, memoryview]
+        :param length: The byte length of every record, defaults to the compressed length.
+        :type length: Optional[int]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of the records.
+        :rtype: List[bytes]
+        """
+
+        if length is None:
+            length = cls.compressed_length()
+        view: memoryview = cls._records(public_keys, length)
+        prefix: bytes = (
+            SLIP10_ED25519_CONST.PUBLIC_KEY_PREFIX
+            if cls.compressed_length() > SLIP10_ED25519_CONST.PUBLIC_KEY_BYTE_LENGTH else b""
+        )
+
+        normalized: List[bytes] = []
+        for offset in range(0, len(view), length):
+            public_key: bytes = bytes(view[offset:offset + length])
+            if (len(public_key) == SLIP10_ED25519_CONST.PUBLIC_KEY_BYTE_LENGTH + len(SLIP10_ED25519_CONST.PUBLIC_KEY_PREFIX)
+                    and public_key[0] == bytes_to_integer(SLIP10_ED25519_CONST.PUBLIC_KEY_PREFIX)):
+                public_key = public_key[1:]
+            if len(public_key) != SLIP10_ED25519_CONST.PUBLIC_KEY_BYTE_LENGTH:
+                raise ValueError("Invalid public key bytes")
+            if not crypto_core_ed25519_is_valid_point(public_key) and not point_is_on_curve(public_key):
+                raise ValueError("Invalid public key bytes")
+            normalized.append(prefix + public_key)
+        return normalized
+
     @classmethod
     def from_point(cls, point: IPoint) -> IPublicKey:
         """
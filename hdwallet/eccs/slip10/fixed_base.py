@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from hashlib import sha1
+from typing import (
+    Iterable, List, Optional, Tuple
+)
+
+import inspect
+
+from ecdsa import (
+    SigningKey, VerifyingKey, ecdsa, keys
+)
+from ecdsa.curves import Curve
+from ecdsa.ellipticcurve import (
+    PointJacobi, INFINITY
+)
+
+from ...utils import (
+    bytes_to_integer, integer_to_bytes
+)
+
+# The table leans on python-ecdsa internals; without them it falls back to the public API
+_JACOBIAN_INTERNALS: bool = all(
+    callable(getattr(PointJacobi, name, None)) for name in ("_add", "_double")
+)
+_SIGNING_KEY_INTERNALS: bool = (
+    "_error__please_use_generate" in inspect.signature(SigningKey.__init__).parameters
+    and callable(getattr(ecdsa, "Private_key", None))
+)
+
+
+class FixedBaseTable:
+    """
+    Signed fixed-window multiples of a python-ecdsa generator point.
+
+    Window ``i`` holds the affine points ``j * 2^(w*i) * G`` for ``j`` in ``1 .. 2^(w-1)``,
+    so a scalar multiplication is one mixed addition per window and no doublings; about
+    a third of the additions python-ecdsa's own generator precomputation needs for 256-bit
+    scalars. The table is built on first use.
+
+    Should python-ecdsa drop the internals this relies on, products fall back to plain
+    ``generator * scalar`` and signing keys to ``SigningKey.from_string``.
+    """
+
+    generator: PointJacobi
+    window: int
+    _table: Optional[List[List[Tuple[int, int]]]]
+
+    def __init__(self, generator: PointJacobi, window: int = 8) -> None:
+        """
+        Initialize a table for the given generator.
+
+        :param generator: The generator point, which must carry its order.
+        :type generator: PointJacobi
+        :param window: The window width in bits, defaults to 8.
+        :type window: int
+        """
+
+        self.generator = generator
+        self.window = window
+        self._table = None
+
+    def table(self) -> List[List[Tuple[int, int]]]:
+        """
+        Get the precomputed windows, building them on the first call.
+
+        :return: The affine multiples of each window.
+        :rtype: List[List[Tuple[int, int]]]
+        """
+
+        if self._table is None:
+            half: int = 1 << (self.window - 1)
+            windows: int = (self.generator.order().bit_length() + self.window - 1) // self.window + 1
+            p, a = self.generator.curve().p(), self.generator.curve().a()
+            _add, _double = self.generator._add, self.generator._double
+            table: List[List[Tuple[int, int]]] = []
+            x, y = self.generator.x(), self.generator.y()
+            for _ in range(windows):
+                jacobian: List[Tuple[int, int, int]] = [(x, y, 1)]
+                for _ in range(half - 1):
+                    jacobian.append(_add(*jacobian[-1], x, y, 1, p))
+                # Batch the conversion to affine coordinates, one inversion per window
+                products: List[int] = []
+                product: int = 1
+                for _, _, Z in jacobian:
+                    product = product * Z % p
+                    products.append(product)
+                inverse: int = pow(product, p - 2, p)
+                multiples: List[Tuple[int, int]] = [(0, 0)] * half
+                for index in range(half - 1, -1, -1):
+                    X, Y, Z = jacobian[index]
+                    z_inverse: int = inverse * products[index - 1] % p if index else inverse
+                    inverse = inverse * Z % p
+                    z_inverse_squared: int = z_inverse * z_inverse % p
+                    multiples[index] = (X * z_inverse_squared % p, Y * z_inverse_squared * z_inverse % p)
+                table.append(multiples)
+                X, Y, Z = _double(*multiples[-1], 1, p, a)  # 2^w times this window's base
+                z_inverse = pow(Z, p - 2, p)
+                x, y = X * z_inverse * z_inverse % p, Y * z_inverse * z_inverse * z_inverse % p
+            # A single assignment, so concurrent first calls at worst build it twice
+            self._table = table
+        return self._table
+
+    def _multiply(self, scalar: int) -> Tuple[int, int, int]:
+        """
+        Multiply the generator by a scalar, without wrapping the product.
+
+        :param scalar: The scalar multiplier, reduced modulo the order and not zero.
+        :type scalar: int
+
+        :return: The Jacobian coordinates of the product, Z being zero at infinity.
+        :rtype: Tuple[int, int, int]
+        """
+
+        table: List[List[Tuple[int, int]]] = self.table()
+        size, half, mask = 1 << self.window, 1 << (self.window - 1), (1 << self.window) - 1
+        p: int = self.generator.curve().p()
+        _add = self.generator._add
+        X3, Y3, Z3 = 0, 0, 0
+        for multiples in table:
+            if not scalar:
+                break
+            digit: int = scalar & mask
+            scalar >>= self.window
+            if digit > half:
+                digit -= size
+                scalar += 1
+            if digit > 0:
+                X2, Y2 = multiples[digit - 1]
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X2, Y2, 1, p)
+            elif digit < 0:
+                X2, Y2 = multiples[-digit - 1]
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X2, -Y2, 1, p)
+        return X3, Y3, Z3
+
+    def multiply(self, scalar: int) -> PointJacobi:
+        """
+        Multiply the generator by a scalar.
+
+        :param scalar: The scalar multiplier.
+        :type scalar: int
+
+        :return: The product, in Jacobian coordinates.
+        :rtype: PointJacobi
+        """
+
+        scalar %= self.generator.order()
+        if not scalar:
+            return INFINITY
+        if not _JACOBIAN_INTERNALS:
+            return self.generator * scalar
+        X, Y, Z = self._multiply(scalar)
+        if not Z:
+            return INFINITY
+        return PointJacobi(self.generator.curve(), X, Y, Z, self.generator.order())
+
+    def public_keys(self, private_keys: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the SEC1 encoded public keys of many big-endian secret exponents.
+
+        The products share a single inversion to reach affine coordinates.
+
+        :param private_keys: The big-endian secret exponent bytes.
+        :type private_keys: Iterable[bytes]
+        :param compressed: Whether to encode the points compressed, defaults to True.
+        :type compressed: bool
+
+        :return: The encoded public keys, in the order of ``private_keys``.
+        :rtype: List[bytes]
+        """
+
+        order: int = self.generator.order()
+        length: int = (order.bit_length() + 7) // 8
+        p: int = self.generator.curve().p()
+        secrets: List[int] = []
+        for private_key in private_keys:
+            secret: int = bytes_to_integer(private_key)
+            if len(private_key) != length or not 1 <= secret < order:
+                raise ValueError("Invalid private key bytes")
+            secrets.append(secret)
+
+        affine: List[Tuple[int, int]] = []
+        if _JACOBIAN_INTERNALS:
+            jacobian: List[Tuple[int, int, int]] = [self._multiply(secret) for secret in secrets]
+            products: List[int] = []
+            product: int = 1
+            for _, _, Z in jacobian:
+                product = product * Z % p
+                products.append(product)
+            inverse: int = pow(product, p - 2, p)
+            affine = [(0, 0)] * len(jacobian)
+            for index in range(len(jacobian) - 1, -1, -1):
+                X, Y, Z = jacobian[index]
+                z_inverse: int = inverse * products[index - 1] % p if index else inverse
+                inverse = inverse * Z % p
+                z_inverse_squared: int = z_inverse * z_inverse % p
+                affine[index] = (X * z_inverse_squared % p, Y * z_inverse_squared * z_inverse % p)
+        else:
+            for secret in secrets:
+                point: PointJacobi = (self.generator * secret).scale()
+                affine.append((point.x(), point.y()))
+
+        return [
+            ((b"\x03" if y & 1 else b"\x02") + integer_to_bytes(x, bytes_num=length)) if compressed else
+            (b"\x04" + integer_to_bytes(x, bytes_num=length) + integer_to_bytes(y, bytes_num=length))
+            for x, y in affine
+        ]
+
+    def signing_key(self, private_key: bytes, curve: Curve) -> SigningKey:
+        """
+        Build a python-ecdsa signing key whose public point comes from this table.
+
+        Mirrors ``SigningKey.from_string``, which would otherwise multiply the generator
+        again on its own.
+
+        :param private_key: The big-endian secret exponent bytes.
+        :type private_key: bytes
+        :param curve: The python-ecdsa curve of this generator.
+        :type curve: Curve
+
+        :return: The signing key, with its verifying key already set.
+        :rtype: SigningKey
+        """
+
+        if not _SIGNING_KEY_INTERNALS:
+            return SigningKey.from_string(private_key, curve=curve)
+        if len(private_key) != curve.baselen:
+            raise keys.MalformedPointError(
+                f"Invalid length of private key, received {len(private_key)}, expected {curve.baselen}"
+            )
+        secret: int = bytes_to_integer(private_key)
+        if not 1 <= secret < curve.order:
+            raise keys.MalformedPointError(
+                f"Invalid value for secexp, expected integer between 1 and {curve.order}"
+            )
+
+        signing_key: SigningKey = SigningKey(_error__please_use_generate=True)
+        signing_key.curve = curve
+        signing_key.default_hashfunc = sha1
+        signing_key.baselen = curve.baselen
+        signing_key.verifying_key = VerifyingKey.from_public_point(
+            self.multiply(secret).scale(), curve, signing_key.default_hashfunc, False
+        )
+        signing_key.privkey = ecdsa.Private_key(signing_key.verifying_key.pubkey, secret)
+        signing_key.privkey.order = curve.order
+        return signing_key
@@ -4,19 +4,127 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from typing import (
+    Dict, List, Optional, Type
+)
+
+import os
+
 from ecdsa.ecdsa import generator_256
 
+from ....consts import SLIP10_NIST256P1_CONST
 from ...iecc import IEllipticCurveCryptography
-from .point import SLIP10Nist256p1Point
-from .public_key import SLIP10Nist256p1PublicKey
-from .private_key import SLIP10Nist256p1PrivateKey
+from ..backend import (
+    calibrate_backends, use_backend
+)
+from . import point
+from .point import (  # noqa: F401
+    SLIP10Nist256p1Point, SLIP10Nist256p1PointECDSA, SLIP10Nist256p1PointCryptography
+)
+from .public_key import (  # noqa: F401
+    SLIP10Nist256p1PublicKey, SLIP10Nist256p1PublicKeyECDSA, SLIP10Nist256p1PublicKeyCryptography
+)
+from .private_key import (  # noqa: F401
+    SLIP10Nist256p1PrivateKey, SLIP10Nist256p1PrivateKeyECDSA, SLIP10Nist256p1PrivateKeyCryptography
+)
+
+
+class SLIP10Nist256p1ECCECDSA(IEllipticCurveCryptography):
+
+    NAME = "SLIP10-Nist256p1"
+    ORDER = generator_256.order()
+    GENERATOR = SLIP10Nist256p1PointECDSA(generator_256)
+    POINT = SLIP10Nist256p1PointECDSA
+    PUBLIC_KEY = SLIP10Nist256p1PublicKeyECDSA
+    PRIVATE_KEY = SLIP10Nist256p1PrivateKeyECDSA
+
+
+class SLIP10Nist256p1ECCCryptography(IEllipticCurveCryptography):
+
+    NAME = "SLIP10-Nist256p1"
+    ORDER = generator_256.order()
+    GENERATOR = SLIP10Nist256p1PointCryptography(generator_256)
+    POINT = SLIP10Nist256p1PointCryptography
+    PUBLIC_KEY = SLIP10Nist256p1PublicKeyCryptography
+    PRIVATE_KEY = SLIP10Nist256p1PrivateKeyCryptography
+
+
+SLIP10_NIST256P1_BACKENDS: Dict[str, Type[IEllipticCurveCryptography]] = {
+    "ecdsa": SLIP10Nist256p1ECCECDSA
+}
+
+if point.ec is not None:
+    SLIP10_NIST256P1_BACKENDS = {
+        "cryptography": SLIP10Nist256p1ECCCryptography, **SLIP10_NIST256P1_BACKENDS
+    }
 
 
 class SLIP10Nist256p1ECC(IEllipticCurveCryptography):
+    """
+    The SLIP10-Nist256p1 curve, backed by whichever implementation :func:`use` selected.
+
+    Its ``GENERATOR``, ``POINT``, ``PUBLIC_KEY`` and ``PRIVATE_KEY`` are those of the active
+    backend, named by ``BACKEND``; every importer of this class follows a switch.
+    """
 
     NAME = "SLIP10-Nist256p1"
     ORDER = generator_256.order()
-    GENERATOR = SLIP10Nist256p1Point(generator_256)
-    POINT = SLIP10Nist256p1Point
-    PUBLIC_KEY = SLIP10Nist256p1PublicKey
-    PRIVATE_KEY = SLIP10Nist256p1PrivateKey
+    BACKEND: str
+    GENERATOR = SLIP10Nist256p1ECCECDSA.GENERATOR
+    POINT = SLIP10Nist256p1ECCECDSA.POINT
+    PUBLIC_KEY = SLIP10Nist256p1ECCECDSA.PUBLIC_KEY
+    PRIVATE_KEY = SLIP10Nist256p1ECCECDSA.PRIVATE_KEY
+
+
+def backends() -> List[str]:
+    """
+    Get the names of the SLIP10-Nist256p1 backends importable here.
+
+    :return: The available backend names, fastest expected first.
+    :rtype: List[str]
+    """
+
+    return list(SLIP10_NIST256P1_BACKENDS.keys())
+
+
+def calibrate(rounds: int = 8) -> str:
+    """
+    Time a few scalar multiplications on every available SLIP10-Nist256p1 backend.
+
+    :param rounds: The number of multiplications timed per backend, defaults to 8.
+    :type rounds: int
+
+    :return: The name of the fastest backend.
+    :rtype: str
+    """
+
+    return calibrate_backends(SLIP10_NIST256P1_BACKENDS, rounds=rounds)
+
+
+def use(backend: Optional[str] = None) -> str:
+    """
+    Select the SLIP10-Nist256p1 backend used from now on.
+
+    ``SLIP10Nist256p1ECC`` is updated in place, and every loaded hdwallet module's
+    ``SLIP10Nist256p1Point``, ``SLIP10Nist256p1PublicKey`` and ``SLIP10Nist256p1PrivateKey`` names
+    bound to a backend class are rebound to the new backend's. Keys created before a switch keep their
+    original backend, so switch before deriving any.
+
+    :param backend: A name from :func:`backends`, or ``"auto"`` to :func:`calibrate`; defaults to the
+        ``HDWALLET_NIST256P1_BACKEND`` environment variable, else ``SLIP10_NIST256P1_CONST.USE``.
+    :type backend: Optional[str]
+
+    :return: The name of the backend now in use.
+    :rtype: str
+    """
+
+    if backend is None:
+        backend = os.environ.get("HDWALLET_NIST256P1_BACKEND") or SLIP10_NIST256P1_CONST.USE
+    return use_backend(SLIP10Nist256p1ECC, SLIP10_NIST256P1_BACKENDS, backend, aliases={
+        "SLIP10Nist256p1Point": "POINT",
+        "SLIP10Nist256p1PublicKey": "PUBLIC_KEY",
+        "SLIP10Nist256p1PrivateKey": "PRIVATE_KEY",
+    })
+
+
+use()
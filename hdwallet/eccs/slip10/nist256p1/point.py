@@ -5,20 +5,32 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import Any
-from ecdsa.ecdsa import curve_256
+from ecdsa.ecdsa import (
+    curve_256, generator_256
+)
 from ecdsa.ellipticcurve import (
-    Point, PointJacobi
+    Point, PointJacobi, INFINITY
 )
 from ecdsa import keys
 
-from ....consts import SLIP10_SECP256K1_CONST
+try:
+    from cryptography.hazmat.primitives.asymmetric import ec
+except ImportError:  # The ecdsa backend is always available
+    ec = None
+
+from ....consts import SLIP10_NIST256P1_CONST
 from ...iecc import IPoint
+from ..fixed_base import FixedBaseTable
 from ....utils import (
     bytes_to_integer, integer_to_bytes
 )
 
 
-class SLIP10Nist256p1Point(IPoint):
+# Multiples of the generator, built the first time it is multiplied
+GENERATOR_TABLE: FixedBaseTable = FixedBaseTable(generator_256)
+
+
+class SLIP10Nist256p1PointECDSA(IPoint):
 
     point: PointJacobi
 
@@ -65,8 +77,8 @@ class SLIP10Nist256p1Point(IPoint):
             raise ValueError("Invalid point key bytes") from ex
         except AttributeError:
             return cls.from_coordinates(
-                bytes_to_integer(point[:SLIP10_SECP256K1_CONST.POINT_COORDINATE_BYTE_LENGTH]),
-                bytes_to_integer(point[SLIP10_SECP256K1_CONST.POINT_COORDINATE_BYTE_LENGTH:])
+                bytes_to_integer(point[:SLIP10_NIST256P1_CONST.POINT_COORDINATE_BYTE_LENGTH]),
+                bytes_to_integer(point[SLIP10_NIST256P1_CONST.POINT_COORDINATE_BYTE_LENGTH:])
             )
 
     @classmethod
@@ -134,7 +146,7 @@ class SLIP10Nist256p1Point(IPoint):
         try:
             return self.point.to_bytes("compressed")
         except AttributeError:
-            x_bytes = integer_to_bytes(self.point.x(), SLIP10_SECP256K1_CONST.POINT_COORDINATE_BYTE_LENGTH)
+            x_bytes = integer_to_bytes(self.point.x(), SLIP10_NIST256P1_CONST.POINT_COORDINATE_BYTE_LENGTH)
             if self.point.y() & 1:
                 enc_bytes = b"\x03" + x_bytes
             else:
@@ -152,8 +164,8 @@ class SLIP10Nist256p1Point(IPoint):
         try:
             return self.point.to_bytes()
         except AttributeError:
-            x_bytes = integer_to_bytes(self.point.x(), SLIP10_SECP256K1_CONST.POINT_COORDINATE_BYTE_LENGTH)
-            y_bytes = integer_to_bytes(self.point.y(), SLIP10_SECP256K1_CONST.POINT_COORDINATE_BYTE_LENGTH)
+            x_bytes = integer_to_bytes(self.point.x(), SLIP10_NIST256P1_CONST.POINT_COORDINATE_BYTE_LENGTH)
+            y_bytes = integer_to_bytes(self.point.y(), SLIP10_NIST256P1_CONST.POINT_COORDINATE_BYTE_LENGTH)
 
             return x_bytes + y_bytes
 
@@ -197,6 +209,8 @@ class SLIP10Nist256p1Point(IPoint):
         :rtype: IPoint
         """
 
+        if self.point is generator_256:
+            return self.__class__(GENERATOR_TABLE.multiply(scalar))
         return self.__class__(self.point * scalar)
 
     def __rmul__(self, scalar: int) -> IPoint:
@@ -211,3 +225,70 @@ class SLIP10Nist256p1Point(IPoint):
         """
 
         return self * scalar
+
+
+class SLIP10Nist256p1PointCryptography(SLIP10Nist256p1PointECDSA):
+    """
+    SLIP10-Nist256p1 point multiplied by OpenSSL, through the ``cryptography`` package.
+
+    ``cryptography`` has no point arithmetic, so additions stay on python-ecdsa and the
+    multiples of other points than the generator are recovered from ECDH x-coordinates.
+    """
+
+    @staticmethod
+    def _exchange(scalar: int, peer: "ec.EllipticCurvePublicKey") -> int:
+        """
+        Get the x-coordinate of ``scalar`` times the peer's point.
+
+        :param scalar: The scalar, between 1 and the order.
+        :type scalar: int
+        :param peer: The point, as a public key.
+        :type peer: ec.EllipticCurvePublicKey
+
+        :return: The x-coordinate of the product.
+        :rtype: int
+        """
+
+        return bytes_to_integer(
+            ec.derive_private_key(scalar, ec.SECP256R1()).exchange(ec.ECDH(), peer)
+        )
+
+    def __mul__(self, scalar: int) -> IPoint:
+        """
+        Perform scalar multiplication of the point on the curve.
+
+        :param scalar: The scalar integer to multiply the point by.
+        :type scalar: int
+
+        :return: A new instance of the same class representing the resulting
+                 point after scalar multiplication.
+        :rtype: IPoint
+        """
+
+        order: int = generator_256.order()
+        scalar %= order
+        if not scalar or self.point == INFINITY:
+            return self.__class__(INFINITY)
+        if self.point is generator_256:
+            numbers = ec.derive_private_key(scalar, ec.SECP256R1()).public_key().public_numbers()
+            return self.from_coordinates(numbers.x, numbers.y)
+
+        p: int = curve_256.p()
+        x, y = self.point.x(), self.point.y()
+        if scalar == order - 1:
+            return self.from_coordinates(x, p - y)
+        # ECDH only yields x; y is a square root of x^3 - 3x + b (p = 3 mod 4), and the
+        # right one is where adding this point lands on the x-coordinate of (scalar + 1) times it
+        peer = ec.EllipticCurvePublicNumbers(x, y, ec.SECP256R1()).public_key()
+        product_x: int = self._exchange(scalar, peer)
+        product_y: int = pow(
+            (product_x * product_x * product_x + curve_256.a() * product_x + curve_256.b()) % p, (p + 1) // 4, p
+        )
+        product: PointJacobi = PointJacobi(curve_256, product_x, product_y, 1, order)
+        if (product + self.point).x() != self._exchange(scalar + 1, peer):
+            product = PointJacobi(curve_256, product_x, p - product_y, 1, order)
+        return self.__class__(product)
+
+
+# Rebound to the selected backend's class by hdwallet.eccs.slip10.nist256p1.use
+SLIP10Nist256p1Point = SLIP10Nist256p1PointECDSA
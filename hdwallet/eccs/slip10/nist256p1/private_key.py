@@ -4,20 +4,34 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, Iterable, List
+)
 from ecdsa import SigningKey
 from ecdsa import (
     curves, keys
 )
 
-from ....consts import SLIP10_SECP256K1_CONST
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+except ImportError:  # The ecdsa backend is always available
+    serialization = ec = None
+
+from ....consts import SLIP10_NIST256P1_CONST
 from ...iecc import (
     IPublicKey, IPrivateKey
 )
-from .public_key import SLIP10Nist256p1PublicKey
+from .point import GENERATOR_TABLE
+from ....utils import (
+    bytes_to_integer, integer_to_bytes
+)
+from .public_key import (
+    SLIP10Nist256p1PublicKeyECDSA, SLIP10Nist256p1PublicKeyCryptography
+)
 
 
-class SLIP10Nist256p1PrivateKey(IPrivateKey):
+class SLIP10Nist256p1PrivateKeyECDSA(IPrivateKey):
 
     signing_key: SigningKey
 
@@ -56,7 +70,7 @@ class SLIP10Nist256p1PrivateKey(IPrivateKey):
 
         try:
             return cls(
-                SigningKey.from_string(
+                GENERATOR_TABLE.signing_key(
                     private_key, curve=curves.NIST256p
                 )
             )
@@ -72,7 +86,7 @@ class SLIP10Nist256p1PrivateKey(IPrivateKey):
         :rtype: int
         """
 
-        return SLIP10_SECP256K1_CONST.PRIVATE_KEY_BYTE_LENGTH
+        return SLIP10_NIST256P1_CONST.PRIVATE_KEY_BYTE_LENGTH
 
     def underlying_object(self) -> Any:
         """
@@ -102,4 +116,144 @@ class SLIP10Nist256p1PrivateKey(IPrivateKey):
         :rtype: IPublicKey
         """
 
-        return SLIP10Nist256p1PublicKey(self.signing_key.get_verifying_key())
+        return SLIP10Nist256p1PublicKeyECDSA(self.signing_key.get_verifying_key())
+
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, from the generator table.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        return GENERATOR_TABLE.public_keys(batch, compressed=compressed)
+
+
+class SLIP10Nist256p1PrivateKeyCryptography(IPrivateKey):
+
+    signing_key: "ec.EllipticCurvePrivateKey"
+
+    def __init__(self, signing_key: "ec.EllipticCurvePrivateKey") -> None:
+        """
+        Initialize the private key object.
+
+        :param signing_key: The ``cryptography`` private key.
+        :type signing_key: ec.EllipticCurvePrivateKey
+        """
+
+        self.signing_key = signing_key
+
+    @staticmethod
+    def name() -> str:
+        """
+        Get the name of the ecc class.
+
+        :return: The name of the ecc class.
+        :rtype: str
+        """
+
+        return "SLIP10-Nist256p1"
+
+    @classmethod
+    def from_bytes(cls, private_key: bytes) -> IPrivateKey:
+        """
+        Create a private key object from a byte string, deriving its public key in OpenSSL.
+
+        :param private_key: The byte string representing the private key.
+        :type private_key: bytes
+
+        :return: An instance of the private key.
+        :rtype: IPrivateKey
+        """
+
+        if len(private_key) != cls.length():
+            raise ValueError("Invalid private key bytes")
+        try:
+            return cls(
+                ec.derive_private_key(bytes_to_integer(private_key), ec.SECP256R1())
+            )
+        except ValueError as ex:
+            raise ValueError("Invalid private key bytes") from ex
+
+    @staticmethod
+    def length() -> int:
+        """
+        Get the length of the private key in bytes.
+
+        :return: The private key length in bytes.
+        :rtype: int
+        """
+
+        return SLIP10_NIST256P1_CONST.PRIVATE_KEY_BYTE_LENGTH
+
+    def underlying_object(self) -> Any:
+        """
+        Retrieve the underlying private key object.
+
+        :return: The underlying ``cryptography`` private key.
+        :rtype: Any
+        """
+
+        return self.signing_key
+
+    def raw(self) -> bytes:
+        """
+        Retrieve the raw byte representation of the private key.
+
+        :return: The raw bytes of the private key.
+        :rtype: bytes
+        """
+
+        return integer_to_bytes(
+            self.signing_key.private_numbers().private_value, bytes_num=self.length()
+        )
+
+    def public_key(self) -> IPublicKey:
+        """
+        Retrieve the corresponding public key for the private key.
+
+        :return: The public key associated with the private key.
+        :rtype: IPublicKey
+        """
+
+        return SLIP10Nist256p1PublicKeyCryptography(self.signing_key.public_key())
+
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, derived and encoded in OpenSSL.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        public_format = (
+            serialization.PublicFormat.CompressedPoint if compressed else serialization.PublicFormat.UncompressedPoint
+        )
+        public_keys: List[bytes] = []
+        for private_key in batch:
+            if len(private_key) != cls.length():
+                raise ValueError("Invalid private key bytes")
+            try:
+                signing_key = ec.derive_private_key(bytes_to_integer(private_key), ec.SECP256R1())
+            except ValueError as ex:
+                raise ValueError("Invalid private key bytes") from ex
+            public_keys.append(
+                signing_key.public_key().public_bytes(serialization.Encoding.X962, public_format)
+            )
+        return public_keys
+
+
+# Rebound to the selected backend's class by hdwallet.eccs.slip10.nist256p1.use
+SLIP10Nist256p1PrivateKey = SLIP10Nist256p1PrivateKeyECDSA
@@ -6,19 +6,30 @@
 
 from typing import Any
 from ecdsa import VerifyingKey
-from ecdsa.ecdsa import curve_256
+from ecdsa.ecdsa import (
+    curve_256, generator_256
+)
 from ecdsa import (
     curves, ellipticcurve, keys
 )
 
-from ....consts import SLIP10_SECP256K1_CONST
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+except ImportError:  # The ecdsa backend is always available
+    serialization = ec = None
+
+from ....consts import SLIP10_NIST256P1_CONST
 from ...iecc import (
     IPoint, IPublicKey
 )
-from .point import SLIP10Nist256p1Point
+from ....utils import bytes_to_integer
+from .point import (
+    SLIP10Nist256p1PointECDSA, SLIP10Nist256p1PointCryptography, GENERATOR_TABLE
+)
 
 
-class SLIP10Nist256p1PublicKey(IPublicKey):
+class SLIP10Nist256p1PublicKeyECDSA(IPublicKey):
 
     verify_key: VerifyingKey
 
@@ -97,7 +108,7 @@ class SLIP10Nist256p1PublicKey(IPublicKey):
         :rtype: int
         """
 
-        return SLIP10_SECP256K1_CONST.PUBLIC_KEY_COMPRESSED_BYTE_LENGTH
+        return SLIP10_NIST256P1_CONST.PUBLIC_KEY_COMPRESSED_BYTE_LENGTH
 
     @staticmethod
     def uncompressed_length() -> int:
@@ -108,7 +119,7 @@ class SLIP10Nist256p1PublicKey(IPublicKey):
         :rtype: int
         """
 
-        return SLIP10_SECP256K1_CONST.PUBLIC_KEY_UNCOMPRESSED_BYTE_LENGTH
+        return SLIP10_NIST256P1_CONST.PUBLIC_KEY_UNCOMPRESSED_BYTE_LENGTH
 
     def underlying_object(self) -> Any:
         """
@@ -140,6 +151,29 @@ class SLIP10Nist256p1PublicKey(IPublicKey):
 
         return self.verify_key.to_string("uncompressed")
 
+    def add_tweak(self, tweak: bytes) -> IPublicKey:
+        """
+        Add the generator multiple ``tweak * G`` to the public key point, keeping the result
+        in Jacobian coordinates and using the generator's fixed-base table.
+
+        :param tweak: The big-endian scalar tweak bytes.
+        :type tweak: bytes
+
+        :return: The tweaked public key.
+        :rtype: IPublicKey
+        """
+
+        point: ellipticcurve.PointJacobi = (
+            self.verify_key.pubkey.point + GENERATOR_TABLE.multiply(bytes_to_integer(tweak))
+        )
+        if point == ellipticcurve.INFINITY:
+            raise ValueError("Invalid public key tweak")
+        return self.__class__(
+            VerifyingKey.from_public_point(
+                point, curve=curves.NIST256p, validate_point=False
+            )
+        )
+
     def point(self) -> IPoint:
         """
         Get the elliptic curve point corresponding to the public key.
@@ -148,4 +182,163 @@ class SLIP10Nist256p1PublicKey(IPublicKey):
         :rtype: IPoint
         """
 
-        return SLIP10Nist256p1Point(self.verify_key.pubkey.point)
+        return SLIP10Nist256p1PointECDSA(self.verify_key.pubkey.point)
+
+
+class SLIP10Nist256p1PublicKeyCryptography(IPublicKey):
+
+    verify_key: "ec.EllipticCurvePublicKey"
+
+    def __init__(self, verify_key: "ec.EllipticCurvePublicKey") -> None:
+        """
+        Initialize the public key with the given OpenSSL public key.
+
+        :param verify_key: The ``cryptography`` public key.
+        :type verify_key: ec.EllipticCurvePublicKey
+        """
+
+        self.verify_key = verify_key
+
+    @staticmethod
+    def name() -> str:
+        """
+        Get the name of the ecc class.
+
+        :return: The name of the ecc class.
+        :rtype: str
+        """
+
+        return "SLIP10-Nist256p1"
+
+    @classmethod
+    def from_bytes(cls, public_key: bytes) -> IPublicKey:
+        """
+        Create a public key instance from the given byte representation.
+
+        :param public_key: The compressed, uncompressed or raw 64-byte public key.
+        :type public_key: bytes
+
+        :return: An instance of IPublicKey.
+        :rtype: IPublicKey
+        """
+
+        if len(public_key) == SLIP10_NIST256P1_CONST.PUBLIC_KEY_UNCOMPRESSED_BYTE_LENGTH - 1:
+            public_key = SLIP10_NIST256P1_CONST.PUBLIC_KEY_UNCOMPRESSED_PREFIX + public_key
+        try:
+            return cls(
+                ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), public_key)
+            )
+        except ValueError as ex:
+            raise ValueError("Invalid public key bytes") from ex
+
+    @classmethod
+    def from_point(cls, point: IPoint) -> IPublicKey:
+        """
+        Create a public key instance from a given point.
+
+        :param point: The elliptic curve point representing the public key.
+        :type point: IPoint
+
+        :return: An instance of IPublicKey.
+        :rtype: IPublicKey
+        """
+
+        try:
+            return cls(
+                ec.EllipticCurvePublicNumbers(point.x(), point.y(), ec.SECP256R1()).public_key()
+            )
+        except ValueError as ex:
+            raise ValueError("Invalid public key point") from ex
+
+    @staticmethod
+    def compressed_length() -> int:
+        """
+        Get the length of the compressed public key in bytes.
+
+        :return: The length of the compressed public key.
+        :rtype: int
+        """
+
+        return SLIP10_NIST256P1_CONST.PUBLIC_KEY_COMPRESSED_BYTE_LENGTH
+
+    @staticmethod
+    def uncompressed_length() -> int:
+        """
+        Get the length of the uncompressed public key in bytes.
+
+        :return: The length of the uncompressed public key.
+        :rtype: int
+        """
+
+        return SLIP10_NIST256P1_CONST.PUBLIC_KEY_UNCOMPRESSED_BYTE_LENGTH
+
+    def underlying_object(self) -> Any:
+        """
+        Get the underlying object of the public key.
+
+        :return: The underlying ``cryptography`` public key.
+        :rtype: Any
+        """
+
+        return self.verify_key
+
+    def raw_compressed(self) -> bytes:
+        """
+        Get the compressed raw bytes representation of the public key.
+
+        :return: The compressed raw bytes of the public key.
+        :rtype: bytes
+        """
+
+        return self.verify_key.public_bytes(
+            serialization.Encoding.X962, serialization.PublicFormat.CompressedPoint
+        )
+
+    def raw_uncompressed(self) -> bytes:
+        """
+        Get the uncompressed raw bytes representation of the public key.
+
+        :return: The uncompressed raw bytes of the public key.
+        :rtype: bytes
+        """
+
+        return self.verify_key.public_bytes(
+            serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint
+        )
+
+    def add_tweak(self, tweak: bytes) -> IPublicKey:
+        """
+        Add the generator multiple ``tweak * G``, computed by OpenSSL, to the public key
+        point; the single point addition is done by python-ecdsa.
+
+        :param tweak: The big-endian scalar tweak bytes.
+        :type tweak: bytes
+
+        :return: The tweaked public key.
+        :rtype: IPublicKey
+        """
+
+        numbers = self.verify_key.public_numbers()
+        point: ellipticcurve.PointJacobi = ellipticcurve.PointJacobi(
+            curve_256, numbers.x, numbers.y, 1
+        ) + (SLIP10Nist256p1PointCryptography(generator_256) * bytes_to_integer(tweak)).underlying_object()
+        if point == ellipticcurve.INFINITY:
+            raise ValueError("Invalid public key tweak")
+        return self.__class__(
+            ec.EllipticCurvePublicNumbers(point.x(), point.y(), ec.SECP256R1()).public_key()
+        )
+
+    def point(self) -> IPoint:
+        """
+        Get the elliptic curve point corresponding to the public key.
+
+        :return: The elliptic curve point.
+        :rtype: IPoint
+        """
+
+        numbers = self.verify_key.public_numbers()
+        return SLIP10Nist256p1PointCryptography.from_coordinates(numbers.x, numbers.y)
+
+
+# Rebound to the selected backend's class by hdwallet.eccs.slip10.nist256p1.use
+SLIP10Nist256p1PublicKey = SLIP10Nist256p1PublicKeyECDSA
@@ -4,10 +4,20 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from typing import (
+    Dict, List, Optional, Type
+)
+
+import os
+
 from ecdsa.ecdsa import generator_secp256k1
 
 from ....consts import SLIP10_SECP256K1_CONST
 from ...iecc import IEllipticCurveCryptography
+from ..backend import (
+    calibrate_backends, use_backend
+)
+from . import point
 from .point import (  # noqa: F401
     SLIP10Secp256k1Point, SLIP10Secp256k1PointCoincurve, SLIP10Secp256k1PointECDSA
 )
@@ -19,19 +29,6 @@ from .private_key import (  # noqa: F401
 )
 
 
-class SLIP10Secp256k1ECCCoincurve(IEllipticCurveCryptography):
-
-    NAME = "SLIP10-Secp256k1"
-    ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
-    GENERATOR = SLIP10Secp256k1PointCoincurve.from_coordinates(
-        0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
-        0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
-    )
-    POINT = SLIP10Secp256k1PointCoincurve
-    PUBLIC_KEY = SLIP10Secp256k1PublicKeyCoincurve
-    PRIVATE_KEY = SLIP10Secp256k1PrivateKeyCoincurve
-
-
 class SLIP10Secp256k1ECCECDSA(IEllipticCurveCryptography):
 
     NAME = "SLIP10-Secp256k1"
@@ -42,11 +39,95 @@ class SLIP10Secp256k1ECCECDSA(IEllipticCurveCryptography):
     PRIVATE_KEY = SLIP10Secp256k1PrivateKeyECDSA
 
 
-if SLIP10_SECP256K1_CONST.USE == "coincurve":
-    SLIP10Secp256k1ECC = SLIP10Secp256k1ECCCoincurve
-elif SLIP10_SECP256K1_CONST.USE == "ecdsa":
-    SLIP10Secp256k1ECC = SLIP10Secp256k1ECCECDSA
-else:
-    raise Exception(
-        f"Invalid SLIP10-Secp256k1 use, (expected: 'coincurve' or 'ecdsa', got: '{SLIP10_SECP256K1_CONST.USE}')"
-    )
+SLIP10_SECP256K1_BACKENDS: Dict[str, Type[IEllipticCurveCryptography]] = {
+    "ecdsa": SLIP10Secp256k1ECCECDSA
+}
+
+if point.coincurve is not None:
+
+    class SLIP10Secp256k1ECCCoincurve(IEllipticCurveCryptography):
+
+        NAME = "SLIP10-Secp256k1"
+        ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+        GENERATOR = SLIP10Secp256k1PointCoincurve.from_coordinates(
+            0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+            0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+        )
+        POINT = SLIP10Secp256k1PointCoincurve
+        PUBLIC_KEY = SLIP10Secp256k1PublicKeyCoincurve
+        PRIVATE_KEY = SLIP10Secp256k1PrivateKeyCoincurve
+
+    SLIP10_SECP256K1_BACKENDS = {
+        "coincurve": SLIP10Secp256k1ECCCoincurve, **SLIP10_SECP256K1_BACKENDS
+    }
+
+
+class SLIP10Secp256k1ECC(IEllipticCurveCryptography):
+    """
+    The SLIP10-Secp256k1 curve, backed by whichever implementation :func:`use` selected.
+
+    Its ``GENERATOR``, ``POINT``, ``PUBLIC_KEY`` and ``PRIVATE_KEY`` are those of the active
+    backend, named by ``BACKEND``; every importer of this class follows a switch.
+    """
+
+    NAME = "SLIP10-Secp256k1"
+    ORDER = generator_secp256k1.order()
+    BACKEND: str
+    GENERATOR = SLIP10Secp256k1ECCECDSA.GENERATOR
+    POINT = SLIP10Secp256k1ECCECDSA.POINT
+    PUBLIC_KEY = SLIP10Secp256k1ECCECDSA.PUBLIC_KEY
+    PRIVATE_KEY = SLIP10Secp256k1ECCECDSA.PRIVATE_KEY
+
+
+def backends() -> List[str]:
+    """
+    Get the names of the SLIP10-Secp256k1 backends importable here.
+
+    :return: The available backend names, fastest expected first.
+    :rtype: List[str]
+    """
+
+    return list(SLIP10_SECP256K1_BACKENDS.keys())
+
+
+def calibrate(rounds: int = 8) -> str:
+    """
+    Time a few scalar multiplications on every available SLIP10-Secp256k1 backend.
+
+    :param rounds: The number of multiplications timed per backend, defaults to 8.
+    :type rounds: int
+
+    :return: The name of the fastest backend.
+    :rtype: str
+    """
+
+    return calibrate_backends(SLIP10_SECP256K1_BACKENDS, rounds=rounds)
+
+
+def use(backend: Optional[str] = None) -> str:
+    """
+    Select the SLIP10-Secp256k1 backend used from now on.
+
+    ``SLIP10Secp256k1ECC`` is updated in place, and every loaded hdwallet module's
+    ``SLIP10Secp256k1Point``, ``SLIP10Secp256k1PublicKey`` and ``SLIP10Secp256k1PrivateKey`` names
+    bound to a backend class are rebound to the new backend's. Keys created before a switch keep their
+    original backend, so switch before deriving any.
+
+    :param backend: A name from :func:`backends`, or ``"auto"`` to :func:`calibrate`; defaults to the
+        ``HDWALLET_SECP256K1_BACKEND`` environment variable, else ``SLIP10_SECP256K1_CONST.USE``.
+    :type backend: Optional[str]
+
+    :return: The name of the backend now in use.
+    :rtype: str
+    """
+
+    if backend is None:
+        backend = os.environ.get("HDWALLET_SECP256K1_BACKEND") or SLIP10_SECP256K1_CONST.USE
+    return use_backend(SLIP10Secp256k1ECC, SLIP10_SECP256K1_BACKENDS, backend, aliases={
+        "SLIP10Secp256k1Point": "POINT",
+        "SLIP10Secp256k1PublicKey": "PUBLIC_KEY",
+        "SLIP10Secp256k1PrivateKey": "PRIVATE_KEY",
+    })
+
+
+use()
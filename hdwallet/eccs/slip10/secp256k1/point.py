@@ -5,16 +5,22 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import Any
-from ecdsa.ecdsa import curve_secp256k1
+from ecdsa.ecdsa import (
+    curve_secp256k1, generator_secp256k1
+)
 from ecdsa.ellipticcurve import (
     Point, PointJacobi
 )
 from ecdsa import keys
 
-import coincurve
+try:
+    import coincurve
+except ImportError:  # The ecdsa backend is always available
+    coincurve = None
 
 from ....consts import SLIP10_SECP256K1_CONST
 from ...iecc import IPoint
+from ..fixed_base import FixedBaseTable
 from ....utils import (
     bytes_to_integer, integer_to_bytes
 )
@@ -22,14 +28,14 @@ from ....utils import (
 
 class SLIP10Secp256k1PointCoincurve(IPoint):
 
-    public_key: coincurve.PublicKey
+    public_key: "coincurve.PublicKey"
 
-    def __init__(self, public_key: coincurve.PublicKey) -> None:
+    def __init__(self, public_key: "coincurve.PublicKey") -> None:
         """
         Initialize the SLIP10Secp256k1PublicKey instance with a given public key.
 
         :param public_key: The public key object representing a Secp256k1 public key.
-        :type public_key: coincurve.PublicKey
+        :type public_key: "coincurve.PublicKey"
 
         :return: None
         """
@@ -194,6 +200,10 @@ class SLIP10Secp256k1PointCoincurve(IPoint):
         return self * scalar
 
 
+# Multiples of the generator, built the first time it is multiplied
+GENERATOR_TABLE: FixedBaseTable = FixedBaseTable(generator_secp256k1)
+
+
 class SLIP10Secp256k1PointECDSA(IPoint):
 
     point: PointJacobi
@@ -362,6 +372,8 @@ class SLIP10Secp256k1PointECDSA(IPoint):
         :rtype: IPoint
         """
 
+        if self.point is generator_secp256k1:
+            return self.__class__(GENERATOR_TABLE.multiply(scalar))
         return self.__class__(self.point * scalar)
 
     def __rmul__(self, scalar: int) -> IPoint:
@@ -378,11 +390,5 @@ class SLIP10Secp256k1PointECDSA(IPoint):
         return self * scalar
 
 
-if SLIP10_SECP256K1_CONST.USE == "coincurve":
-    SLIP10Secp256k1Point = SLIP10Secp256k1PointCoincurve
-elif SLIP10_SECP256K1_CONST.USE == "ecdsa":
-    SLIP10Secp256k1Point = SLIP10Secp256k1PointECDSA
-else:
-    raise Exception(
-        f"Invalid SLIP10-Secp256k1 use, (expected: 'coincurve' or 'ecdsa', got: '{SLIP10_SECP256K1_CONST.USE}')"
-    )
+# Rebound to the selected backend's class by hdwallet.eccs.slip10.secp256k1.use
+SLIP10Secp256k1Point = SLIP10Secp256k1PointECDSA
@@ -4,18 +4,24 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, Iterable, List
+)
 from ecdsa import SigningKey
 from ecdsa import (
     curves, keys
 )
 
-import coincurve
+try:
+    import coincurve
+except ImportError:  # The ecdsa backend is always available
+    coincurve = None
 
 from ....consts import SLIP10_SECP256K1_CONST
 from ...iecc import (
     IPublicKey, IPrivateKey
 )
+from .point import GENERATOR_TABLE
 from .public_key import (
     SLIP10Secp256k1PublicKeyCoincurve, SLIP10Secp256k1PublicKeyECDSA
 )
@@ -23,14 +29,14 @@ from .public_key import (
 
 class SLIP10Secp256k1PrivateKeyCoincurve(IPrivateKey):
 
-    signing_key: coincurve.PrivateKey
+    signing_key: "coincurve.PrivateKey"
 
-    def __init__(self, private_key: coincurve.PrivateKey) -> None:
+    def __init__(self, private_key: "coincurve.PrivateKey") -> None:
         """
         Initializes an instance of SLIP10 Secp256k1 private key.
 
         :param private_key: The coincurve PrivateKey object representing the private key.
-        :type private_key: coincurve.PrivateKey
+        :type private_key: "coincurve.PrivateKey"
         """
 
         self.signing_key = private_key
@@ -107,6 +113,30 @@ class SLIP10Secp256k1PrivateKeyCoincurve(IPrivateKey):
 
         return SLIP10Secp256k1PublicKeyCoincurve(self.signing_key.public_key)
 
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, straight from libsecp256k1.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        public_keys: List[bytes] = []
+        for private_key in batch:
+            if len(private_key) != cls.length():
+                raise ValueError("Invalid private key bytes")
+            try:
+                public_keys.append(coincurve.PublicKey.from_secret(private_key).format(compressed))
+            except ValueError as ex:
+                raise ValueError("Invalid private key bytes") from ex
+        return public_keys
+
 
 class SLIP10Secp256k1PrivateKeyECDSA(IPrivateKey):
 
@@ -147,7 +177,7 @@ class SLIP10Secp256k1PrivateKeyECDSA(IPrivateKey):
 
         try:
             return cls(
-                SigningKey.from_string(
+                GENERATOR_TABLE.signing_key(
                     key_bytes, curve=curves.SECP256k1
                 )
             )
@@ -196,12 +226,22 @@ class SLIP10Secp256k1PrivateKeyECDSA(IPrivateKey):
 
         return SLIP10Secp256k1PublicKeyECDSA(self.signing_key.get_verifying_key())
 
+    @classmethod
+    def public_keys_from_private_bytes(cls, batch: Iterable[bytes], compressed: bool = True) -> List[bytes]:
+        """
+        Get the raw public keys of many private keys at once, from the generator table.
+
+        :param batch: The private key byte sequences.
+        :type batch: Iterable[bytes]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of ``batch``.
+        :rtype: List[bytes]
+        """
+
+        return GENERATOR_TABLE.public_keys(batch, compressed=compressed)
+
 
-if SLIP10_SECP256K1_CONST.USE == "coincurve":
-    SLIP10Secp256k1PrivateKey = SLIP10Secp256k1PrivateKeyCoincurve
-elif SLIP10_SECP256K1_CONST.USE == "ecdsa":
-    SLIP10Secp256k1PrivateKey = SLIP10Secp256k1PrivateKeyECDSA
-else:
-    raise Exception(
-        f"Invalid SLIP10-Secp256k1 use, (expected: 'coincurve' or 'ecdsa', got: '{SLIP10_SECP256K1_CONST.USE}')"
-    )
+# Rebound to the selected backend's class by hdwallet.eccs.slip10.secp256k1.use
+SLIP10Secp256k1PrivateKey = SLIP10Secp256k1PrivateKeyECDSA
@@ -4,34 +4,51 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, List, Optional, Union
+)
 from ecdsa import VerifyingKey
 from ecdsa.ecdsa import curve_secp256k1
 from ecdsa import (
     curves, ellipticcurve, keys
 )
 
-import coincurve
+try:
+    import coincurve
+except ImportError:  # The ecdsa backend is always available
+    coincurve = None
+
+try:
+    from coincurve._libsecp256k1 import (
+        ffi, lib
+    )
+    from coincurve.context import GLOBAL_CONTEXT
+    from coincurve.flags import (
+        EC_COMPRESSED, EC_UNCOMPRESSED
+    )
+except ImportError:  # Private coincurve modules, only the batch parsing needs them
+    ffi = None
 
 from ....consts import SLIP10_SECP256K1_CONST
 from ...iecc import (
     IPoint, IPublicKey
 )
+from ....utils import bytes_to_integer
 from .point import (
-    SLIP10Secp256k1PointCoincurve, SLIP10Secp256k1PointECDSA
+    SLIP10Secp256k1PointCoincurve, SLIP10Secp256k1PointECDSA, GENERATOR_TABLE
 )
 
 
 class SLIP10Secp256k1PublicKeyCoincurve(IPublicKey):
 
-    verify_key: coincurve.PublicKey
+    verify_key: "coincurve.PublicKey"
 
-    def __init__(self, public_key: coincurve.PublicKey) -> None:
+    def __init__(self, public_key: "coincurve.PublicKey") -> None:
         """
         Initialize the public key object.
 
         :param public_key: The coincurve PublicKey object representing the public key.
-        :type public_key: coincurve.PublicKey
+        :type public_key: "coincurve.PublicKey"
         """
 
         self.verify_key = public_key
@@ -64,6 +81,46 @@ class SLIP10Secp256k1PublicKeyCoincurve(IPublicKey):
         except ValueError as ex:
             raise ValueError("Invalid public key bytes") from ex
 
+    @classmethod
+    def from_bytes_many(
+        cls, public_keys: Union[bytes, bytearray, memoryview], length: Optional[int] = None, compressed: bool = True
+    ) -> List[bytes]:
+        """
+        Validate, decompress and normalize many public keys in one pass, parsing each record
+        in place and reusing one libsecp256k1 key and output buffer for the whole batch.
+
+        :param public_keys: The public keys, back to back in ``length`` byte records.
+        :type public_keys: Union[bytes, bytearray, memoryview]
+        :param length: The byte length of every record, defaults to the compressed length.
+        :type length: Optional[int]
+        :param compressed: Whether to return compressed public keys, defaults to True.
+        :type compressed: bool
+
+        :return: The raw public keys, in the order of the records.
+        :rtype: List[bytes]
+        """
+
+        if ffi is None:
+            return super().from_bytes_many(public_keys, length=length, compressed=compressed)
+        if length is None:
+            length = cls.compressed_length()
+        view: memoryview = cls._records(public_keys, length)
+        records = ffi.from_buffer(view)
+        public_key = ffi.new("secp256k1_pubkey *")
+        output_length: int = cls.compressed_length() if compressed else cls.uncompressed_length()
+        output = ffi.new(f"unsigned char [{output_length}]")
+        output_size = ffi.new("size_t *")
+        flags: int = EC_COMPRESSED if compressed else EC_UNCOMPRESSED
+
+        normalized: List[bytes] = []
+        for offset in range(0, len(view), length):
+            if not lib.secp256k1_ec_pubkey_parse(GLOBAL_CONTEXT.ctx, public_key, records + offset, length):
+                raise ValueError("Invalid public key bytes")
+            output_size[0] = output_length
+            lib.secp256k1_ec_pubkey_serialize(GLOBAL_CONTEXT.ctx, output, output_size, public_key, flags)
+            normalized.append(ffi.buffer(output, output_length)[:])
+        return normalized
+
     @classmethod
     def from_point(cls, point: IPoint) -> IPublicKey:
         """
@@ -137,6 +194,23 @@ class SLIP10Secp256k1PublicKeyCoincurve(IPublicKey):
 
         return self.verify_key.format(False)
 
+    def add_tweak(self, tweak: bytes) -> IPublicKey:
+        """
+        Add the generator multiple ``tweak * G`` to the public key point, directly on the
+        underlying coincurve key.
+
+        :param tweak: The big-endian scalar tweak bytes.
+        :type tweak: bytes
+
+        :return: The tweaked public key.
+        :rtype: IPublicKey
+        """
+
+        try:
+            return self.__class__(self.verify_key.add(tweak))
+        except ValueError as ex:
+            raise ValueError("Invalid public key tweak") from ex
+
     def point(self) -> IPoint:
         """
         Get the cryptographic point associated with the verifying key.
@@ -273,6 +347,29 @@ class SLIP10Secp256k1PublicKeyECDSA(IPublicKey):
 
         return self.verify_key.to_string("uncompressed")
 
+    def add_tweak(self, tweak: bytes) -> IPublicKey:
+        """
+        Add the generator multiple ``tweak * G`` to the public key point, keeping the result
+        in Jacobian coordinates and using the generator's fixed-base table.
+
+        :param tweak: The big-endian scalar tweak bytes.
+        :type tweak: bytes
+
+        :return: The tweaked public key.
+        :rtype: IPublicKey
+        """
+
+        point: ellipticcurve.PointJacobi = (
+            self.verify_key.pubkey.point + GENERATOR_TABLE.multiply(bytes_to_integer(tweak))
+        )
+        if point == ellipticcurve.INFINITY:
+            raise ValueError("Invalid public key tweak")
+        return self.__class__(
+            VerifyingKey.from_public_point(
+                point, curve=curves.SECP256k1, validate_point=False
+            )
+        )
+
     def point(self) -> IPoint:
         """
         Retrieves the point object associated with the public key.
@@ -284,11 +381,5 @@ class SLIP10Secp256k1PublicKeyECDSA(IPublicKey):
         return SLIP10Secp256k1PointECDSA(self.verify_key.pubkey.point)
 
 
-if SLIP10_SECP256K1_CONST.USE == "coincurve":
-    SLIP10Secp256k1PublicKey = SLIP10Secp256k1PublicKeyCoincurve
-elif SLIP10_SECP256K1_CONST.USE == "ecdsa":
-    SLIP10Secp256k1PublicKey = SLIP10Secp256k1PublicKeyECDSA
-else:
-    raise Exception(
-        f"Invalid SLIP10-Secp256k1 use, (expected: 'coincurve' or 'ecdsa', got: '{SLIP10_SECP256K1_CONST.USE}')"
-    )
+# Rebound to the selected backend's class by hdwallet.eccs.slip10.secp256k1.use
+SLIP10Secp256k1PublicKey = SLIP10Secp256k1PublicKeyECDSA
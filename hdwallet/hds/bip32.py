@@ -5,15 +5,15 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, List, Type
+    Optional, Union, List, Tuple, Type
 )
+from collections import OrderedDict
 from hashlib import sha256
 
 import hmac
 import hashlib
 import struct
 
-from ..libs.ripemd160 import ripemd160
 from ..libs.base58 import check_decode
 from ..eccs import (
     IPoint, IPublicKey, IPrivateKey, IEllipticCurveCryptography, KholawEd25519PrivateKey
@@ -29,7 +29,9 @@ from ..consts import (
     PUBLIC_KEY_TYPES, WIF_TYPES
 )
 from ..cryptocurrencies import Bitcoin
-from ..crypto import hmac_sha512
+from ..crypto import (
+    hmac_sha512, ripemd160
+)
 from ..wif import (
     private_key_to_wif, wif_to_private_key, get_wif_type
 )
@@ -40,7 +42,7 @@ from ..exceptions import (
     Error, AddressError, DerivationError, XPrivateKeyError, XPublicKeyError, PublicKeyError, PrivateKeyError, SeedError, WIFError
 )
 from ..utils import (
-    get_bytes, get_hmac, bytes_to_integer, integer_to_bytes, bytes_to_string, reset_bits, set_bits
+    get_bytes, get_hmac, bytes_to_integer, integer_to_bytes, bytes_to_string, reset_bits, set_bits, path_to_indexes
 )
 from .ihd import IHD
 
@@ -58,14 +60,17 @@ class BIP32HD(IHD):
     _public_key_type: str = PUBLIC_KEY_TYPES.COMPRESSED
     _wif_type: str = WIF_TYPES.WIF_COMPRESSED
     _wif_prefix: Optional[int] = None
-    _fingerprint: Optional[bytes] = None
     _parent_fingerprint: Optional[bytes] = None
+    _parent_public_key: Optional[IPublicKey] = None
     _strict: Optional[bool] = None
     _derivation: IDerivation
     _root_depth: int = 0
     _root_index: int = 0
     _depth: int = 0
     _index: int = 0
+    _cache_size: int = 128
+    _cache: "OrderedDict[tuple, tuple]"
+    _cache_root: Optional[bytes] = None
 
     def __init__(
         self, ecc: Type[IEllipticCurveCryptography], public_key_type: str = PUBLIC_KEY_TYPES.COMPRESSED, **kwargs
@@ -78,7 +83,9 @@ class BIP32HD(IHD):
         :param public_key_type: The type of public key to be used, either `PUBLIC_KEY_TYPES.COMPRESSED` or
                                 `PUBLIC_KEY_TYPES.UNCOMPRESSED`. Defaults to `PUBLIC_KEY_TYPES.COMPRESSED`.
         :type public_key_type: str
-        :param kwargs: Additional keyword arguments for custom derivation paths and indexes.
+        :param kwargs: Additional keyword arguments for custom derivation paths and indexes,
+                       and ``cache_size``, the maximum number of derived nodes kept in the
+                       derivation cache (0 disables caching). Defaults to 128.
         :type kwargs: dict
 
         :return: None
@@ -102,6 +109,8 @@ class BIP32HD(IHD):
         self._derivation = CustomDerivation(
             path=kwargs.get("path", None), indexes=kwargs.get("indexes", None)
         )
+        self._cache_size = kwargs.get("cache_size", 128)
+        self._cache = OrderedDict()
 
     @classmethod
     def name(cls) -> str:
@@ -374,8 +383,162 @@ class BIP32HD(IHD):
             raise DerivationError("Invalid derivation instance", expected=IDerivation, got=type(derivation))
 
         self._derivation = derivation
-        for index in self._derivation.indexes():
-            self.drive(index)
+        self.drive_indexes(self._derivation.indexes())
+        return self
+
+    def drive_indexes(self, indexes: List[int]) -> "BIP32HD":
+        """
+        Drives the BIP32HD instance through the given indexes, one child key per index.
+
+        When starting at the root key, intermediate nodes are kept in a bounded LRU cache
+        keyed by index prefix, so that sibling paths (e.g. ``m/44'/0'/0'/0/0`` and
+        ``m/44'/0'/0'/0/1``) resume from the longest cached prefix instead of re-deriving
+        every step from the root key.
+
+        :param indexes: The indexes to derive, in order.
+        :type indexes: List[int]
+
+        :return: The updated BIP32HD instance.
+        :rtype: BIP32HD
+        """
+
+        if not self._cache_size or not (
+            self._chain_code is not None and
+            self._chain_code is self._root_chain_code and
+            self._public_key is self._root_public_key
+        ):
+            for index in indexes:
+                self.drive(index)
+            return self
+
+        if self._cache_root is not self._root_chain_code:
+            self._cache.clear()
+            self._cache_root = self._root_chain_code
+
+        # Fingerprints depend on the public key type and depths on the starting depth
+        base: tuple = (self._public_key_type, self._depth)
+        indexes: Tuple[int, ...] = tuple(indexes)
+
+        start: int = 0
+        for length in range(len(indexes), 0, -1):
+            key: tuple = base + indexes[:length]
+            node: Optional[tuple] = self._cache.get(key)
+            if node is not None:
+                self._cache.move_to_end(key)
+                self._restore_node(node)
+                start = length
+                break
+
+        for length in range(start + 1, len(indexes) + 1):
+            self.drive(indexes[length - 1])
+            self._cache[base + indexes[:length]] = self._node()
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return self
+
+    def derive_range(
+        self, parent_path: Union[str, List[int], IDerivation], start: int, stop: int, hardened: bool = False
+    ) -> List[Tuple[bytes, bytes, Optional[bytes]]]:
+        """
+        Derives the children ``start`` to ``stop`` (exclusive) of one parent node in a single call.
+
+        The parent path is taken from the root key and driven once (through the derivation cache),
+        then every child is derived directly from the parent node. The current state of the
+        BIP32HD instance, including its derivation, is left untouched.
+
+        :param parent_path: The path of the parent node, as a path string like ``"m/44'/0'/0'/0"``,
+                            a list of indexes, or an `IDerivation` instance.
+        :type parent_path: Union[str, List[int], IDerivation]
+        :param start: The first child index to derive.
+        :type start: int
+        :param stop: The child index to stop at, not derived itself.
+        :type stop: int
+        :param hardened: Whether to derive hardened children. Defaults to False.
+        :type hardened: bool
+
+        :return: A list of ``(public_key, chain_code, private_key)`` raw bytes tuples, one per child.
+                 The public key follows the instance's public key type and the private key is None
+                 for public-only derivation.
+        :rtype: List[Tuple[bytes, bytes, Optional[bytes]]]
+        """
+
+        if isinstance(parent_path, IDerivation):
+            indexes: List[int] = parent_path.indexes()
+        elif isinstance(parent_path, str):
+            indexes: List[int] = path_to_indexes(parent_path)
+        else:
+            indexes: List[int] = list(parent_path)
+
+        if not 0 <= start <= stop <= 0x80000000:
+            raise DerivationError(
+                "Invalid derivation range", expected=f"0 <= start <= stop <= {0x80000000}", got=(start, stop)
+            )
+
+        state: tuple = self._node()
+        try:
+            if self._root_private_key:
+                self._private_key, self._public_key = self._root_private_key, self._root_public_key
+            elif self._root_public_key:
+                self._public_key = self._root_public_key
+            self._chain_code, self._parent_fingerprint, self._depth = (
+                self._root_chain_code, (integer_to_bytes(0x00) * 4), 0
+            )
+            parent: tuple = self.drive_indexes(indexes)._node()
+
+            offset: int = 0x80000000 if hardened else 0
+            uncompressed: bool = self._public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED
+            children: List[Tuple[bytes, bytes, Optional[bytes]]] = []
+            for index in range(start, stop):
+                self._restore_node(parent)
+                if self.drive(index + offset) is None:
+                    raise DerivationError(f"Computed child key at index {index} is not valid, very unlucky index")
+                children.append((
+                    self._public_key.raw_uncompressed() if uncompressed else self._public_key.raw_compressed(),
+                    self._chain_code,
+                    self._private_key.raw() if self._private_key else None
+                ))
+            return children
+        finally:
+            self._restore_node(state)
+
+    def _node(self) -> tuple:
+        """
+        Captures the current node state of the BIP32HD instance.
+
+        :return: The private key, public key, chain code, depth, index, parent fingerprint and parent public key.
+        :rtype: tuple
+        """
+
+        return (
+            self._private_key, self._public_key, self._chain_code,
+            self._depth, self._index, self._parent_fingerprint, self._parent_public_key
+        )
+
+    def _restore_node(self, node: tuple) -> None:
+        """
+        Restores a node state previously captured with `_node`.
+
+        :param node: The captured node state.
+        :type node: tuple
+
+        :return: None
+        """
+
+        (
+            self._private_key, self._public_key, self._chain_code,
+            self._depth, self._index, self._parent_fingerprint, self._parent_public_key
+        ) = node
+
+    def clear_cache(self) -> "BIP32HD":
+        """
+        Clears the derivation cache of the BIP32HD instance.
+
+        :return: The BIP32HD instance with an empty derivation cache.
+        :rtype: BIP32HD
+        """
+
+        self._cache.clear()
+        self._cache_root = None
         return self
 
     def update_derivation(self, derivation: IDerivation) -> "BIP32HD":
@@ -410,7 +573,7 @@ class BIP32HD(IHD):
             self._private_key, self._chain_code, self._parent_fingerprint = (
                 self._root_private_key, self._root_chain_code, (integer_to_bytes(0x00) * 4)
             )
-            self._public_key = self._private_key.public_key()
+            self._public_key = self._root_public_key
             self._derivation.clean()
             self._depth = 0
         elif self._root_public_key:
@@ -493,17 +656,15 @@ class BIP32HD(IHD):
                     )
                 )
 
-                self._private_key, self._chain_code, self._parent_fingerprint = (
+                self._parent_public_key, self._parent_fingerprint = self._public_key, None
+                self._private_key, self._chain_code = (
                     self._ecc.PRIVATE_KEY.from_bytes(
                         kl_bytes + kr_bytes
                     ),
-                    _hmacr,
-                    get_bytes(self.fingerprint())
+                    _hmacr
                 )
                 self._public_key = self._private_key.public_key()
-                self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
-                )
+                self._depth, self._index = (self._depth + 1), index
             else:
                 if index & 0x80000000:
                     raise DerivationError("Hardened derivation path is invalid for xpublic key")
@@ -531,13 +692,11 @@ class BIP32HD(IHD):
                 new_public_key: IPublicKey = self._ecc.PUBLIC_KEY.from_point(
                     new_public_key_point
                 )
-                self._parent_fingerprint = get_bytes(self.fingerprint())
+                self._parent_public_key, self._parent_fingerprint = self._public_key, None
                 self._chain_code, self._public_key = (
                     _hmacr, new_public_key
                 )
-                self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
-                )
+                self._depth, self._index = (self._depth + 1), index
 
             return self
 
@@ -565,13 +724,11 @@ class BIP32HD(IHD):
 
             new_private_key: IPrivateKey = self._ecc.PRIVATE_KEY.from_bytes(_hmacl)
 
-            self._parent_fingerprint = get_bytes(self.fingerprint())
+            self._parent_public_key, self._parent_fingerprint = self._public_key, None
             self._private_key, self._chain_code, self._public_key = (
                 new_private_key, _hmacr, new_private_key.public_key()
             )
-            self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
-            )
+            self._depth, self._index = (self._depth + 1), index
 
         elif self._ecc.NAME in [
             "SLIP10-Nist256p1", "SLIP10-Secp256k1"
@@ -616,28 +773,23 @@ class BIP32HD(IHD):
                     integer_to_bytes(0x00) * 32 + integer_to_bytes(key_int)
                 )[-32:])
 
-                self._parent_fingerprint = get_bytes(self.fingerprint())
+                self._parent_public_key, self._parent_fingerprint = self._public_key, None
                 self._private_key, self._chain_code, self._public_key = (
                     new_private_key, _hmacr, new_private_key.public_key()
                 )
-                self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
-                )
+                self._depth, self._index = (self._depth + 1), index
             else:
-                new_public_key_point: IPoint = (
-                    self._public_key.point() + (self._ecc.GENERATOR * bytes_to_integer(_hmacl))
-                )
-                new_public_key: IPublicKey = self._ecc.PUBLIC_KEY.from_point(
-                    new_public_key_point
-                )
+                # Tweak the underlying backend key directly, without IPoint round trips
+                try:
+                    new_public_key: IPublicKey = self._public_key.add_tweak(_hmacl)
+                except ValueError:
+                    return None
 
-                self._parent_fingerprint = get_bytes(self.fingerprint())
+                self._parent_public_key, self._parent_fingerprint = self._public_key, None
                 self._chain_code, self._public_key = (
                     _hmacr, new_public_key
                 )
-                self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
-                )
+                self._depth, self._index = (self._depth + 1), index
         return self
 
     def seed(self) -> Optional[str]:
@@ -665,7 +817,7 @@ class BIP32HD(IHD):
         :rtype: Optional[str]
         """
 
-        if not self.root_private_key():
+        if not self._root_private_key:
             return None
 
         return serialize(
@@ -675,10 +827,10 @@ class BIP32HD(IHD):
             depth=self._root_depth,
             parent_fingerprint=(integer_to_bytes(0x00) * 4),
             index=self._root_index,
-            chain_code=self.root_chain_code(),
-            key=("00" + self.root_private_key()),
+            chain_code=self._root_chain_code,
+            key=(integer_to_bytes(0x00) + self._root_private_key.raw()),
             encoded=encoded
-        ) if self.root_chain_code() else None
+        ) if self._root_chain_code else None
 
     def root_xpublic_key(
         self, version: Union[bytes, int] = Bitcoin.NETWORKS.MAINNET.XPUBLIC_KEY_VERSIONS.P2PKH, encoded: bool = True
@@ -702,12 +854,12 @@ class BIP32HD(IHD):
             depth=self._root_depth,
             parent_fingerprint=(integer_to_bytes(0x00) * 4),
             index=self._root_index,
-            chain_code=self.root_chain_code(),
-            key=self.root_public_key(
+            chain_code=self._root_chain_code,
+            key=self.root_public_key_bytes(
                 public_key_type=PUBLIC_KEY_TYPES.COMPRESSED
             ),
             encoded=encoded
-        ) if self.root_chain_code() else None
+        ) if self._root_chain_code else None
 
     def root_private_key(self) -> Optional[str]:
         """
@@ -719,6 +871,16 @@ class BIP32HD(IHD):
 
         return bytes_to_string(self._root_private_key.raw()) if self._root_private_key else None
 
+    def root_private_key_bytes(self) -> Optional[bytes]:
+        """
+        Retrieves the root private key as raw bytes.
+
+        :return: The root private key bytes, or None if not set.
+        :rtype: Optional[bytes]
+        """
+
+        return self._root_private_key.raw() if self._root_private_key else None
+
     def root_wif(self, wif_type: Optional[str] = None) -> Optional[str]:
         """
         Retrieves the root private key in WIF format.
@@ -744,8 +906,8 @@ class BIP32HD(IHD):
             _wif_type: str = self._wif_type
 
         return private_key_to_wif(
-            private_key=self.root_private_key(), wif_type=_wif_type, wif_prefix=self._wif_prefix
-        ) if self.root_private_key() else None
+            private_key=self._root_private_key.raw(), wif_type=_wif_type, wif_prefix=self._wif_prefix
+        ) if self._root_private_key else None
 
     def root_chain_code(self) -> Optional[str]:
         """
@@ -757,6 +919,16 @@ class BIP32HD(IHD):
 
         return bytes_to_string(self._root_chain_code) if self._root_chain_code else None
 
+    def root_chain_code_bytes(self) -> Optional[bytes]:
+        """
+        Retrieves the root chain code as raw bytes.
+
+        :return: The root chain code bytes, or None if the root chain code is not set.
+        :rtype: Optional[bytes]
+        """
+
+        return self._root_chain_code if self._root_chain_code else None
+
     def root_public_key(self, public_key_type: Optional[str] = None) -> Optional[str]:
         """
         Retrieves the root public key as a string.
@@ -768,24 +940,26 @@ class BIP32HD(IHD):
         :rtype: Optional[str]
         """
 
+        root_public_key: Optional[bytes] = self.root_public_key_bytes(public_key_type=public_key_type)
+        return bytes_to_string(root_public_key) if root_public_key else None
+
+    def root_public_key_bytes(self, public_key_type: Optional[str] = None) -> Optional[bytes]:
+        """
+        Retrieves the root public key as raw bytes.
+
+        :param public_key_type: The type of public key to retrieve. If None, defaults to the current object's public key type.
+        :type public_key_type: Optional[str]
+
+        :return: The root public key bytes, or None if the root public key is not set.
+        :rtype: Optional[bytes]
+        """
+
         if not self._root_public_key:
             return None
 
-        if public_key_type:
-            if public_key_type not in PUBLIC_KEY_TYPES.get_types():
-                raise Error(
-                    f"Invalid {self.name()} public key type",
-                    expected=PUBLIC_KEY_TYPES.get_types(),
-                    got=public_key_type
-                )
-            _public_key_type: str = public_key_type
-        else:
-            _public_key_type: str = self._public_key_type
-
-        if _public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED:
-            return bytes_to_string(self._root_public_key.raw_uncompressed())
-        elif _public_key_type == PUBLIC_KEY_TYPES.COMPRESSED:
-            return bytes_to_string(self._root_public_key.raw_compressed())
+        if self._get_public_key_type(public_key_type) == PUBLIC_KEY_TYPES.UNCOMPRESSED:
+            return self._root_public_key.raw_uncompressed()
+        return self._root_public_key.raw_compressed()
 
     def xprivate_key(
         self, version: Union[bytes, int] = Bitcoin.NETWORKS.MAINNET.XPRIVATE_KEY_VERSIONS.P2PKH, encoded: bool = True
@@ -802,7 +976,7 @@ class BIP32HD(IHD):
         :rtype: Optional[str]
         """
 
-        if not self.private_key():
+        if not self._private_key:
             return None
 
         return serialize(
@@ -810,12 +984,12 @@ class BIP32HD(IHD):
                 integer_to_bytes(version) if isinstance(version, int) else get_bytes(version)
             ),
             depth=self._depth,
-            parent_fingerprint=self.parent_fingerprint(),
+            parent_fingerprint=self.parent_fingerprint_bytes(),
             index=self._index,
-            chain_code=self.chain_code(),
-            key=("00" + self.private_key()),
+            chain_code=self._chain_code,
+            key=(integer_to_bytes(0x00) + self._private_key.raw()),
             encoded=encoded
-        ) if self.chain_code() else None
+        ) if self._chain_code else None
 
     def xpublic_key(
         self, version: Union[bytes, int] = Bitcoin.NETWORKS.MAINNET.XPUBLIC_KEY_VERSIONS.P2PKH, encoded: bool = True
@@ -837,14 +1011,12 @@ class BIP32HD(IHD):
                 integer_to_bytes(version) if isinstance(version, int) else get_bytes(version)
             ),
             depth=self._depth,
-            parent_fingerprint=self.parent_fingerprint(),
+            parent_fingerprint=self.parent_fingerprint_bytes(),
             index=self._index,
-            chain_code=self.chain_code(),
-            key=self.public_key(
-                public_key_type=PUBLIC_KEY_TYPES.COMPRESSED
-            ),
+            chain_code=self._chain_code,
+            key=self._public_key.raw_compressed(),
             encoded=encoded
-        ) if self.chain_code() else None
+        ) if self._chain_code else None
 
     def private_key(self) -> Optional[str]:
         """
@@ -856,6 +1028,16 @@ class BIP32HD(IHD):
 
         return bytes_to_string(self._private_key.raw()) if self._private_key else None
 
+    def private_key_bytes(self) -> Optional[bytes]:
+        """
+        Retrieves the private key as raw bytes.
+
+        :return: The private key bytes, or None if the private key is not set.
+        :rtype: Optional[bytes]
+        """
+
+        return self._private_key.raw() if self._private_key else None
+
     def wif(self, wif_type: Optional[str] = None) -> Optional[str]:
         """
         Converts the private key to a WIF (Wallet Import Format) string.
@@ -882,8 +1064,8 @@ class BIP32HD(IHD):
             _wif_type: str = self._wif_type
 
         return private_key_to_wif(
-            private_key=self.private_key(), wif_type=_wif_type, wif_prefix=self._wif_prefix
-        ) if self.private_key() else None
+            private_key=self._private_key.raw(), wif_type=_wif_type, wif_prefix=self._wif_prefix
+        ) if self._private_key else None
 
     def wif_type(self) -> Optional[str]:
         """
@@ -905,6 +1087,16 @@ class BIP32HD(IHD):
 
         return bytes_to_string(self._chain_code) if self._chain_code else None
 
+    def chain_code_bytes(self) -> Optional[bytes]:
+        """
+        Retrieves the chain code associated with the current instance as raw bytes.
+
+        :return: The chain code bytes if available, otherwise None.
+        :rtype: Optional[bytes]
+        """
+
+        return self._chain_code if self._chain_code else None
+
     def public_key(self, public_key_type: Optional[str] = None):
         """
         Retrieves the public key associated with the current instance.
@@ -917,21 +1109,44 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
-        if public_key_type:
-            if public_key_type not in PUBLIC_KEY_TYPES.get_types():
-                raise Error(
-                    f"Invalid {self.name()} public key type",
-                    expected=PUBLIC_KEY_TYPES.get_types(),
-                    got=public_key_type
-                )
-            _public_key_type: str = public_key_type
-        else:
-            _public_key_type: str = self._public_key_type
+        return bytes_to_string(self.public_key_bytes(public_key_type=public_key_type))
 
-        if _public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED:
-            return self.uncompressed()
-        elif _public_key_type == PUBLIC_KEY_TYPES.COMPRESSED:
-            return self.compressed()
+    def public_key_bytes(self, public_key_type: Optional[str] = None) -> bytes:
+        """
+        Retrieves the public key associated with the current instance as raw bytes.
+
+        :param public_key_type: Optional. Specifies the type of public key to return.
+                                If not provided, defaults to the type set during initialization.
+        :type public_key_type: Optional[str]
+
+        :return: The public key bytes based on the specified type.
+        :rtype: bytes
+        """
+
+        if self._get_public_key_type(public_key_type) == PUBLIC_KEY_TYPES.UNCOMPRESSED:
+            return self._public_key.raw_uncompressed()
+        return self._public_key.raw_compressed()
+
+    def _get_public_key_type(self, public_key_type: Optional[str] = None) -> str:
+        """
+        Validates the given public key type, falling back to the type set during initialization.
+
+        :param public_key_type: Optional. The public key type to validate.
+        :type public_key_type: Optional[str]
+
+        :return: The public key type to use.
+        :rtype: str
+        """
+
+        if not public_key_type:
+            return self._public_key_type
+        if public_key_type not in PUBLIC_KEY_TYPES.get_types():
+            raise Error(
+                f"Invalid {self.name()} public key type",
+                expected=PUBLIC_KEY_TYPES.get_types(),
+                got=public_key_type
+            )
+        return public_key_type
 
     def public_key_type(self) -> str:
         """
@@ -971,7 +1186,17 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
-        return bytes_to_string(ripemd160(sha256(get_bytes(self.public_key())).digest()))
+        return bytes_to_string(self.hash_bytes())
+
+    def hash_bytes(self) -> bytes:
+        """
+        Computes the hash of the public key using SHA-256 followed by RIPEMD-160, as raw bytes.
+
+        :return: The hash bytes of the public key.
+        :rtype: bytes
+        """
+
+        return ripemd160(sha256(self.public_key_bytes()).digest())
 
     def fingerprint(self) -> str:
         """
@@ -982,7 +1207,17 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
-        return self.hash()[:8]
+        return bytes_to_string(self.fingerprint_bytes())
+
+    def fingerprint_bytes(self) -> bytes:
+        """
+        Computes the fingerprint of the BIP32HD object as the first 4 bytes of the public key hash.
+
+        :return: The fingerprint bytes of the BIP32HD object.
+        :rtype: bytes
+        """
+
+        return self.hash_bytes()[:4]
 
     def parent_fingerprint(self) -> Optional[str]:
         """
@@ -992,7 +1227,26 @@ class BIP32HD(IHD):
         :rtype: Optional[str]
         """
 
-        return bytes_to_string(self._parent_fingerprint) if self._parent_fingerprint else None
+        parent_fingerprint: Optional[bytes] = self.parent_fingerprint_bytes()
+        return bytes_to_string(parent_fingerprint) if parent_fingerprint else None
+
+    def parent_fingerprint_bytes(self) -> Optional[bytes]:
+        """
+        Retrieves the parent fingerprint of the BIP32HD object as raw bytes, computing it
+        from the parent public key on first request.
+
+        :return: The parent fingerprint bytes if available, otherwise None.
+        :rtype: Optional[bytes]
+        """
+
+        if self._parent_fingerprint is None and self._parent_public_key is not None:
+            # Computed on demand, intermediate nodes of a derivation path never need it
+            self._parent_fingerprint = ripemd160(sha256(
+                self._parent_public_key.raw_uncompressed()
+                if self._public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED else
+                self._parent_public_key.raw_compressed()
+            ).digest())[:4]
+        return self._parent_fingerprint if self._parent_fingerprint else None
 
     def depth(self) -> int:
         """
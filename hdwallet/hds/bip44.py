@@ -148,8 +148,7 @@ class BIP44HD(BIP32HD):
 
         self.clean_derivation()
         self._derivation = derivation
-        for index in self._derivation.indexes():
-            self.drive(index)
+        self.drive_indexes(self._derivation.indexes())
         return self
 
     def address(
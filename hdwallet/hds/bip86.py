@@ -73,8 +73,7 @@ class BIP86HD(BIP44HD):
 
         self.clean_derivation()
         self._derivation = derivation
-        for index in self._derivation.indexes():
-            self.drive(index)
+        self.drive_indexes(self._derivation.indexes())
         return self
 
     def root_xprivate_key(
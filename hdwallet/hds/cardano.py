@@ -347,17 +347,15 @@ class CardanoHD(BIP32HD):
                 )
             )
 
-            self._private_key, self._chain_code, self._parent_fingerprint = (
+            self._parent_public_key, self._parent_fingerprint = self._public_key, None
+            self._private_key, self._chain_code = (
                 self._ecc.PRIVATE_KEY.from_bytes(
                     kl_bytes + kr_bytes
                 ),
-                _hmacr,
-                get_bytes(self.fingerprint())
+                _hmacr
             )
             self._public_key = self._private_key.public_key()
-            self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
-            )
+            self._depth, self._index = (self._depth + 1), index
         else:
             if index & 0x80000000:
                 raise DerivationError("Hardened derivation path is invalid for xpublic key")
@@ -389,13 +387,11 @@ class CardanoHD(BIP32HD):
             new_public_key: IPublicKey = self._ecc.PUBLIC_KEY.from_point(
                 new_public_key_point
             )
-            self._parent_fingerprint = get_bytes(self.fingerprint())
+            self._parent_public_key, self._parent_fingerprint = self._public_key, None
             self._chain_code, self._public_key = (
                 _hmacr, new_public_key
             )
-            self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
-            )
+            self._depth, self._index = (self._depth + 1), index
         return self
 
     def root_xprivate_key(
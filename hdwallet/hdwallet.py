@@ -5,8 +5,9 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, Any, Type, Tuple, List
+    Optional, Union, Any, Type, Tuple, List, Iterable, Iterator
 )
+from concurrent.futures import ProcessPoolExecutor
 
 from .libs.base58 import check_decode
 from .entropies import (
@@ -83,6 +84,11 @@ class HDWallet:
 
     _hd: IHD
 
+    # The constructor arguments and the last root initializer with its arguments, replayed by the
+    # ``dumps`` worker processes instead of pickling this wallet with its mnemonic and key cache
+    _settings: Tuple[Type[ICryptocurrency], Optional[Type[IHD]], Union[str, Type[INetwork]], Any, dict]
+    _root: Optional[Tuple[str, dict]] = None
+
     def __init__(
         self,
         cryptocurrency: Type[ICryptocurrency],
@@ -105,6 +111,7 @@ class HDWallet:
         :param kwargs: Additional keyword arguments.
         """
 
+        self._settings = (cryptocurrency, hd, network, address, dict(kwargs))
         if not issubclass(cryptocurrency, ICryptocurrency):
             raise Error(
                 "Invalid cryptocurrency sub-class", expected=Type[ICryptocurrency], got=type(cryptocurrency)
@@ -519,6 +526,7 @@ class HDWallet:
         self._hd.from_seed(
             seed=seed.seed(), passphrase=self.passphrase()
         )
+        self._root = ("from_seed", {"seed": seed})
         self._derivation = self._hd.derivation()
         return self
 
@@ -565,6 +573,7 @@ class HDWallet:
         self._hd.from_xprivate_key(
             xprivate_key=xprivate_key, encoded=encoded, strict=strict
         )
+        self._root = ("from_xprivate_key", {"xprivate_key": xprivate_key, "encoded": encoded, "strict": strict})
         return self
 
     def from_xpublic_key(self, xpublic_key: str, encoded: bool = True, strict: bool = False) -> "HDWallet":
@@ -616,6 +625,7 @@ class HDWallet:
         self._hd.from_xpublic_key(
             xpublic_key=xpublic_key, encoded=encoded, strict=strict
         )
+        self._root = ("from_xpublic_key", {"xpublic_key": xpublic_key, "encoded": encoded, "strict": strict})
         return self
 
     def from_derivation(self, derivation: IDerivation) -> "HDWallet":
@@ -688,6 +698,7 @@ class HDWallet:
         """
 
         self._hd.from_private_key(private_key=private_key)
+        self._root = ("from_private_key", {"private_key": private_key})
         return self
 
     def from_wif(self, wif: str) -> "HDWallet":
@@ -717,6 +728,7 @@ class HDWallet:
             raise Error(f"WIF isn't supported by {self._cryptocurrency.NAME} cryptocurrency")
 
         self._hd.from_wif(wif=wif)
+        self._root = ("from_wif", {"wif": wif})
         return self
 
     def from_public_key(self, public_key: str) -> "HDWallet":
@@ -747,6 +759,7 @@ class HDWallet:
         if self._hd.name() in ["Monero"]:
             raise Error(f"From public key isn't implemented for the {self._hd.name()} HD type")
         self._hd.from_public_key(public_key=public_key)
+        self._root = ("from_public_key", {"public_key": public_key})
         return self
 
     def from_spend_private_key(
@@ -774,6 +787,7 @@ class HDWallet:
             if self._hd.name() != "Monero":
                 raise Error("From spend private key only supported by Monero HD")
             self._hd.from_spend_private_key(spend_private_key=spend_private_key)
+            self._root = ("from_spend_private_key", {"spend_private_key": spend_private_key})
             return self
         except ValueError as error:
             raise PrivateKeyError("Invalid spend private key data") from error
@@ -808,6 +822,7 @@ class HDWallet:
         self._hd.from_watch_only(
             view_private_key=view_private_key, spend_public_key=spend_public_key
         )
+        self._root = ("from_watch_only", {"view_private_key": view_private_key, "spend_public_key": spend_public_key})
         return self
 
     def cryptocurrency(self) -> str:
@@ -1574,12 +1589,15 @@ class HDWallet:
                 )
             )
 
-    def dump(self, exclude: Optional[set] = None) -> dict:
+    def dump(self, exclude: Optional[set] = None, include: Optional[set] = None) -> dict:
         """
         Dump the state of the HD wallet and related information into a dictionary.
 
         :param exclude: Optional set of keys to exclude from the dump.
         :type exclude: Optional[set]
+        :param include: Optional set of keys to project the dump onto, either plain keys (``public_key``)
+            or nested keys (``at:path``, ``addresses.p2wpkh``). Only the included fields are computed.
+        :type include: Optional[set]
 
         :return: The dictionary containing the dumped information.
         :rtype: dict
@@ -1587,7 +1605,33 @@ class HDWallet:
 
         if exclude is None:
             exclude = { }
+        if include is not None:
+            include = {
+                key.replace("-", "_").replace(".", ":") for key in include
+            }
+
+        excluded: set = {
+            key.replace("-", "_") if isinstance(key, str) else key for key in exclude
+        }
 
+        def included(*keys: str) -> bool:
+            keys = tuple(key.replace("-", "_") for key in keys)
+            if keys[-1] in excluded or (keys[0] == "derivation" and "derivation" in excluded):
+                return False
+            if include is None:
+                return True
+            return (
+                keys[-1] in include or
+                any(key in include for key in keys[:-1]) or
+                (len(keys) > 1 and f"{keys[-2]}:{keys[-1]}" in include)
+            )
+
+        def project(fields: dict, *keys: str) -> dict:
+            return {
+                key: value() for key, value in fields.items() if included(*keys, key)
+            }
+
+        parents: Tuple[str, ...] = () if "root" in exclude else ("derivation",)
         derivation: dict = { }
 
         if self._derivation:
@@ -1595,131 +1639,144 @@ class HDWallet:
                 "BIP44", "BIP49", "BIP84", "BIP86"
             ]:
                 _at: dict = dict(
-                    path=self._derivation.path(),
-                    indexes=self._derivation.indexes(),
-                    depth=self.depth(),
-                    purpose=self._derivation.purpose(),
-                    coin_type=self._derivation.coin_type(),
-                    account=self._derivation.account(),
-                    change=self._derivation.change(),
-                    address=self._derivation.address()
+                    path=self._derivation.path,
+                    indexes=self._derivation.indexes,
+                    depth=self.depth,
+                    purpose=self._derivation.purpose,
+                    coin_type=self._derivation.coin_type,
+                    account=self._derivation.account,
+                    change=self._derivation.change,
+                    address=self._derivation.address
                 )
             elif self._derivation.name() == "CIP1852":
                 _at: dict = dict(
-                    path=self._derivation.path(),
-                    indexes=self._derivation.indexes(),
-                    depth=self.depth(),
-                    purpose=self._derivation.purpose(),
-                    coin_type=self._derivation.coin_type(),
-                    account=self._derivation.account(),
-                    role=self._derivation.role(),
-                    address=self._derivation.address()
+                    path=self._derivation.path,
+                    indexes=self._derivation.indexes,
+                    depth=self.depth,
+                    purpose=self._derivation.purpose,
+                    coin_type=self._derivation.coin_type,
+                    account=self._derivation.account,
+                    role=self._derivation.role,
+                    address=self._derivation.address
                 )
             elif self._derivation.name() == "Electrum":
                 _at: dict = dict(
-                    change=self._derivation.change(),
-                    address=self._derivation.address()
+                    change=self._derivation.change,
+                    address=self._derivation.address
                 )
             elif self._derivation.name() == "Monero":
                 _at: dict = dict(
-                    minor=self._derivation.minor(),
-                    major=self._derivation.major()
+                    minor=self._derivation.minor,
+                    major=self._derivation.major
                 )
             else:
                 _at: dict = dict(
-                    path=self._derivation.path(),
-                    indexes=self._derivation.indexes(),
-                    depth=self.depth(),
-                    index=self.index()
+                    path=self._derivation.path,
+                    indexes=self._derivation.indexes,
+                    depth=self.depth,
+                    index=self.index
+                )
+            _at: dict = project(_at, *parents, "at")
+            if _at and "at" not in exclude:
+                derivation.update(
+                    at=_at
                 )
-            derivation.update(
-                at=_at
-            )
 
         if self._hd.name() in [
             "Algorand", "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
         ]:
-            derivation.update(
-                xprivate_key=self.xprivate_key(),
-                xpublic_key=self.xpublic_key(),
-                private_key=self.private_key(),
-                wif=self.wif(),
-                chain_code=self.chain_code(),
-                public_key=self.public_key(),
-                uncompressed=self.uncompressed(),
-                compressed=self.compressed(),
-                hash=self.hash(),
-                fingerprint=self.fingerprint(),
-                parent_fingerprint=self.parent_fingerprint()
+            _derivation: dict = dict(
+                xprivate_key=self.xprivate_key,
+                xpublic_key=self.xpublic_key,
+                private_key=self.private_key,
+                wif=self.wif,
+                chain_code=self.chain_code,
+                public_key=self.public_key,
+                uncompressed=self.uncompressed,
+                compressed=self.compressed,
+                hash=self.hash,
+                fingerprint=self.fingerprint,
+                parent_fingerprint=self.parent_fingerprint
             )
             if self._hd.name() in ["Algorand", "Cardano"]:
-                del derivation["wif"]
-                del derivation["uncompressed"]
-                del derivation["compressed"]
+                del _derivation["wif"]
+                del _derivation["uncompressed"]
+                del _derivation["compressed"]
+            derivation.update(
+                project(_derivation, *parents)
+            )
 
             if (
                 self._cryptocurrency.ADDRESSES.length() > 1 or
                 self._cryptocurrency.NAME in ["Tezos"]
             ):
                 addresses: dict = { }
+                _address: Optional[str] = None
                 if self._cryptocurrency.NAME == "Avalanche":
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.C_CHAIN] = self.address(address="Ethereum")
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.P_CHAIN] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.C_CHAIN] = lambda: self.address(address="Ethereum")
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.P_CHAIN] = lambda: self.address(
                         address="Avalanche", address_type=self._cryptocurrency.ADDRESS_TYPES.P_CHAIN
                     )
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.X_CHAIN] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.X_CHAIN] = lambda: self.address(
                         address="Avalanche", address_type=self._cryptocurrency.ADDRESS_TYPES.X_CHAIN
                     )
                 elif self._cryptocurrency.NAME == "Binance":
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.CHAIN] = self.address(address="Cosmos")
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.SMART_CHAIN] = self.address(address="Ethereum")
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.CHAIN] = lambda: self.address(address="Cosmos")
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.SMART_CHAIN] = lambda: self.address(address="Ethereum")
                 elif self._cryptocurrency.NAME in ["Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash"]:
                     for address_type in self._cryptocurrency.ADDRESS_TYPES.get_address_types():
                         for address in self._cryptocurrency.ADDRESSES.get_addresses():
-                            addresses[f"{address_type}-{address.lower()}"] = ADDRESSES.address(name=address).encode(
-                                public_key=self.public_key(),
-                                public_key_address_prefix=getattr(
-                                    self._network, f"{address_type.upper()}_PUBLIC_KEY_ADDRESS_PREFIX"
-                                ),
-                                script_address_prefix=getattr(
-                                    self._network, f"{address_type.upper()}_SCRIPT_ADDRESS_PREFIX"
-                                ),
-                                public_key_type=self.public_key_type(),
-                                hrp=self._network.HRP
+                            addresses[f"{address_type}-{address.lower()}"] = (
+                                lambda address_type=address_type, address=address: ADDRESSES.address(name=address).encode(
+                                    public_key=self.public_key(),
+                                    public_key_address_prefix=getattr(
+                                        self._network, f"{address_type.upper()}_PUBLIC_KEY_ADDRESS_PREFIX"
+                                    ),
+                                    script_address_prefix=getattr(
+                                        self._network, f"{address_type.upper()}_SCRIPT_ADDRESS_PREFIX"
+                                    ),
+                                    public_key_type=self.public_key_type(),
+                                    hrp=self._network.HRP
+                                )
                             )
                 elif self._cryptocurrency.NAME == "Tezos":
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ1] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ1] = lambda: self.address(
                         address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ1
                     )
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ2] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ2] = lambda: self.address(
                         address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ2
                     )
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ3] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ3] = lambda: self.address(
                         address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ3
                     )
                 elif self._hd.name() == "BIP44":
-                    derivation["address"] = self.address(address="P2PKH")
+                    _address = "P2PKH"
                 elif self._hd.name() == "BIP49":
-                    derivation["address"] = self.address(address="P2WPKH-In-P2SH")
+                    _address = "P2WPKH-In-P2SH"
                 elif self._hd.name() == "BIP84":
-                    derivation["address"] = self.address(address="P2WPKH")
+                    _address = "P2WPKH"
                 elif self._hd.name() == "BIP86":
-                    derivation["address"] = self.address(address="P2TR")
+                    _address = "P2TR"
                 elif self._hd.name() == "BIP141":
                     if self._semantic == SEMANTICS.P2WPKH:
-                        derivation["address"] = self.address(address="P2WPKH")
+                        _address = "P2WPKH"
                     elif self._semantic == SEMANTICS.P2WPKH_IN_P2SH:
-                        derivation["address"] = self.address(address="P2WPKH-In-P2SH")
+                        _address = "P2WPKH-In-P2SH"
                     elif self._semantic == SEMANTICS.P2WSH:
-                        derivation["address"] = self.address(address="P2WSH")
+                        _address = "P2WSH"
                     elif self._semantic == SEMANTICS.P2WSH_IN_P2SH:
-                        derivation["address"] = self.address(address="P2WSH-In-P2SH")
+                        _address = "P2WSH-In-P2SH"
                 else:
                     for address in self._cryptocurrency.ADDRESSES.get_addresses():
-                        addresses[address.lower().replace("-", "_")] = self.address(address=address)
+                        addresses[address.lower().replace("-", "_")] = (
+                            lambda address=address: self.address(address=address)
+                        )
+                if _address and included(*parents, "address"):
+                    derivation["address"] = self.address(address=_address)
+                addresses: dict = project(addresses, *parents, "addresses")
                 if addresses:
                     derivation["addresses"] = addresses
-            else:
+            elif included(*parents, "address"):
                 if (
                     self._cryptocurrency.NAME == "Cardano" and
                     self._cardano_type in ["shelley-icarus", "shelley-ledger"]
@@ -1731,58 +1788,55 @@ class HDWallet:
                     derivation["address"] = self.address()
 
         elif self._hd.name() in ["Electrum-V1", "Electrum-V2"]:
-            derivation.update(
-                private_key=self.private_key(),
-                wif=self.wif(),
-                public_key=self.public_key(),
-                uncompressed=self.uncompressed(),
-                compressed=self.compressed(),
-                address=self.address()
-            )
+            derivation.update(project(dict(
+                private_key=self.private_key,
+                wif=self.wif,
+                public_key=self.public_key,
+                uncompressed=self.uncompressed,
+                compressed=self.compressed,
+                address=self.address
+            ), *parents))
         elif self._hd.name() == "Monero":
-            derivation.update(
-                sub_address=self.sub_address()
-            )
-
-        if "at" in exclude:
-            del derivation["at"]
+            derivation.update(project(dict(
+                sub_address=self.sub_address
+            ), *parents))
 
         if "root" in exclude:
             return exclude_keys(derivation, exclude)
 
         _root: dict = dict(
-            cryptocurrency=self.cryptocurrency(),
-            symbol=self.symbol(),
-            network=self.network(),
-            coin_type=self.coin_type(),
-            entropy=self.entropy(),
-            strength=self.strength(),
-            mnemonic=self.mnemonic(),
-            passphrase=self.passphrase(),
-            language=self.language(),
-            seed=self.seed(),
-            ecc=self.ecc(),
-            hd=self.hd()
+            cryptocurrency=self.cryptocurrency,
+            symbol=self.symbol,
+            network=self.network,
+            coin_type=self.coin_type,
+            entropy=self.entropy,
+            strength=self.strength,
+            mnemonic=self.mnemonic,
+            passphrase=self.passphrase,
+            language=self.language,
+            seed=self.seed,
+            ecc=self.ecc,
+            hd=self.hd
         )
         if self._hd.name() in [
             "Algorand", "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
         ]:
             if self._hd.name() == "Cardano":
                 _root.update(
-                    cardano_type=self.cardano_type()
+                    cardano_type=self.cardano_type
                 )
             _root.update(
-                semantic=self.semantic(),
-                root_xprivate_key=self.root_xprivate_key(),
-                root_xpublic_key=self.root_xpublic_key(),
-                root_private_key=self.root_private_key(),
-                root_wif=self.root_wif(),
-                root_chain_code=self.root_chain_code(),
-                root_public_key=self.root_public_key(),
-                path_key=self.path_key(),
-                strict=self.strict(),
-                public_key_type=self.public_key_type(),
-                wif_type=self.wif_type()
+                semantic=self.semantic,
+                root_xprivate_key=self.root_xprivate_key,
+                root_xpublic_key=self.root_xpublic_key,
+                root_private_key=self.root_private_key,
+                root_wif=self.root_wif,
+                root_chain_code=self.root_chain_code,
+                root_public_key=self.root_public_key,
+                path_key=self.path_key,
+                strict=self.strict,
+                public_key_type=self.public_key_type,
+                wif_type=self.wif_type
             )
             if self._hd.name() in ["Algorand", "Cardano"]:
                 del _root["root_wif"]
@@ -1796,43 +1850,50 @@ class HDWallet:
         elif self._hd.name() in ["Electrum-V1", "Electrum-V2"]:
             if self._hd.name() == "Electrum-V2":
                 _root.update(
-                    mode=self.mode(),
-                    mnemonic_type=self.mnemonic_type()
+                    mode=self.mode,
+                    mnemonic_type=self.mnemonic_type
                 )
             _root.update(
-                master_private_key=self.master_private_key(),
-                master_wif=self.master_wif(),
-                master_public_key=self.master_public_key(),
-                public_key_type=self.public_key_type(),
-                wif_type=self.wif_type()
+                master_private_key=self.master_private_key,
+                master_wif=self.master_wif,
+                master_public_key=self.master_public_key,
+                public_key_type=self.public_key_type,
+                wif_type=self.wif_type
             )
         elif self._hd.name() == "Monero":
             _root.update(
-                private_key=self.private_key(),
-                spend_private_key=self.spend_private_key(),
-                view_private_key=self.view_private_key(),
-                spend_public_key=self.spend_public_key(),
-                view_public_key=self.view_public_key(),
-                primary_address=self.primary_address(),
+                private_key=self.private_key,
+                spend_private_key=self.spend_private_key,
+                view_private_key=self.view_private_key,
+                spend_public_key=self.spend_public_key,
+                view_public_key=self.view_public_key,
+                primary_address=self.primary_address,
             )
             if self._kwargs.get("payment_id"):
                 _root.update(
-                    integrated_address=self.integrated_address(
+                    integrated_address=lambda: self.integrated_address(
                         payment_id=self._kwargs.get("payment_id")
                     )
                 )
+        _root: dict = project(_root)
 
-        if "derivation" not in exclude:
+        if "derivation" not in exclude and (include is None or derivation):
             _root["derivation"] = derivation
 
         return exclude_keys(_root, exclude)
 
-    def dumps(self, exclude: Optional[set] = None) -> Optional[Union[dict, List[dict]]]:
+    def dumps(
+        self, exclude: Optional[set] = None, workers: Optional[int] = None, include: Optional[set] = None
+    ) -> Optional[Union[dict, List[dict]]]:
         """
         Dump the state of multiple derivations of the HD wallet and related information into dictionaries.
 
         :param exclude: Optional set of keys to exclude from the dump.
         :type exclude: Optional[set]
+        :param workers: Optional number of worker processes to split the derivations across, default is None (sequential).
+        :type workers: Optional[int]
+        :param include: Optional set of keys to project the dumps onto, see ``dump``.
+        :type include: Optional[set]
 
         :return: Either a single dictionary or a list of dictionaries containing the dumped information,
                  depending on the number of derivations.
@@ -1841,93 +1902,236 @@ class HDWallet:
 
         if exclude is None:
             exclude = { }
-
-        _derivations: List[dict] = []
-
-        def drive(*args) -> List[str]:
-            def drive_helper(derivations, current_derivation: Optional[List[Tuple[int, bool]]] = None) -> List[str]:
-                if current_derivation is None:
-                    current_derivation = []
-                if not derivations:
-
-                    if self._derivation.name() in [
-                        "BIP44", "BIP49", "BIP84", "BIP86"
-                    ]:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            change=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif self._derivation.name() == "CIP1852":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            role=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif self._derivation.name() == "Electrum":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            change=current_derivation[0][0],
-                            address=current_derivation[1][0]
-                        )
-                    elif self._derivation.name() == "Monero":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            minor=current_derivation[0][0],
-                            major=current_derivation[1][0]
-                        )
-                    elif self._derivation.name() == "HDW":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            account=current_derivation[0][0],
-                            ecc=current_derivation[1][0],
-                            address=current_derivation[2][0]
-                        )
-                    else:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            path="m/" + "/".join(
-                                [str(item[0]) + "'" if item[1] else str(item[0]) for item in current_derivation]
-                            )
-                        )
-                    self.update_derivation(derivation=_derivation)
-                    _derivations.append(self.dump(exclude={"root", *exclude}))
-                    return [_derivation.path()]
-
-                path: List[str] = []
-                if len(derivations[0]) == 3:
-                    for value in range(derivations[0][0], derivations[0][1] + 1):
-                        path += drive_helper(
-                            derivations[1:], current_derivation + [(value, derivations[0][2])]
-                        )
-                else:
-                    path += drive_helper(
-                        derivations[1:], current_derivation + [derivations[0]]
-                    )
-                return path
-            return drive_helper(args)
+        if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int) or workers < 1):
+            raise Error(
+                "Invalid number of workers", expected="positive integer", got=workers
+            )
 
         if self._derivation is None:
             return None
 
-        drive(*self._derivation.derivations())
+        current_derivations: List[List[Tuple[int, bool]]] = list(self._current_derivations(
+            self._derivation.derivations()
+        ))
+        if workers is None or workers == 1 or len(current_derivations) < 2 or self._root is None:
+            _derivations: List[dict] = list(self._dump_derivations(
+                current_derivations=current_derivations, exclude=exclude, include=include
+            ))
+        else:
+            # Every worker process rebuilds this wallet once, from its settings, root and derivation only
+            size: int = -(-len(current_derivations) // (workers * 4))
+            chunks: List[List[List[Tuple[int, bool]]]] = [
+                current_derivations[index:index + size] for index in range(0, len(current_derivations), size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_dumps_initializer,
+                initargs=(self._settings, self._root, self._derivation)
+            ) as executor:
+                _derivations: List[dict] = [
+                    _dump for _dumps in executor.map(
+                        _dumps_chunk, chunks, [exclude] * len(chunks), [include] * len(chunks)
+                    ) for _dump in _dumps
+                ]
+            self.update_derivation(
+                derivation=self._derivation_from(current_derivation=current_derivations[-1])
+            )
 
         if "root" in exclude:
             return _derivations
 
-        _root: dict = self.dump(exclude={"derivation"})
+        _root: dict = self.dump(exclude={"derivation"}, include=include)
 
         if "derivations" not in exclude:
             _root["derivations"] = _derivations
 
         return exclude_keys(_root, exclude)
+
+    def iter_dumps(self, exclude: Optional[set] = None, include: Optional[set] = None) -> Iterator[dict]:
+        """
+        Lazily dump each derivation of the HD wallet, one dictionary at a time.
+
+        Unlike ``dumps``, no list of derivation dumps is accumulated, so arbitrarily large
+        derivation ranges are processed in constant memory. The root dump is available
+        separately through ``dump(exclude={"derivation"})``.
+
+        :param exclude: Optional set of keys to exclude from each dump.
+        :type exclude: Optional[set]
+        :param include: Optional set of keys to project each dump onto, see ``dump``.
+        :type include: Optional[set]
+
+        :return: An iterator over the derivation dumps, in derivation order.
+        :rtype: Iterator[dict]
+        """
+
+        if exclude is None:
+            exclude = { }
+
+        if self._derivation is None:
+            return iter(())
+
+        return self._dump_derivations(
+            current_derivations=self._current_derivations(self._derivation.derivations()),
+            exclude=exclude,
+            include=include
+        )
+
+    def _current_derivations(
+        self, derivations: List[Tuple[int, bool]], current_derivation: Optional[List[Tuple[int, bool]]] = None
+    ) -> Iterator[List[Tuple[int, bool]]]:
+        """
+        Expand the derivation ranges into every concrete derivation, in order.
+
+        :param derivations: The derivations of the current derivation, as returned by ``IDerivation.derivations()``.
+        :type derivations: List[Tuple[int, bool]]
+        :param current_derivation: The indexes expanded so far.
+        :type current_derivation: Optional[List[Tuple[int, bool]]]
+
+        :return: An iterator over the expanded derivations, each one a list of index and hardened pairs.
+        :rtype: Iterator[List[Tuple[int, bool]]]
+        """
+
+        if current_derivation is None:
+            current_derivation = []
+        if not derivations:
+            yield current_derivation
+        elif len(derivations[0]) == 3:
+            for value in range(derivations[0][0], derivations[0][1] + 1):
+                yield from self._current_derivations(
+                    derivations[1:], current_derivation + [(value, derivations[0][2])]
+                )
+        else:
+            yield from self._current_derivations(
+                derivations[1:], current_derivation + [derivations[0]]
+            )
+
+    def _derivation_from(self, current_derivation: List[Tuple[int, bool]]) -> IDerivation:
+        """
+        Build a derivation of the current derivation type from expanded indexes.
+
+        :param current_derivation: The list of index and hardened pairs.
+        :type current_derivation: List[Tuple[int, bool]]
+
+        :return: The derivation instance.
+        :rtype: IDerivation
+        """
+
+        if self._derivation.name() in [
+            "BIP44", "BIP49", "BIP84", "BIP86"
+        ]:
+            return DERIVATIONS.derivation(
+                name=self._derivation.name()
+            ).__call__(
+                coin_type=current_derivation[1][0],
+                account=current_derivation[2][0],
+                change=current_derivation[3][0],
+                address=current_derivation[4][0]
+            )
+        elif self._derivation.name() == "CIP1852":
+            return DERIVATIONS.derivation(
+                name=self._derivation.name()
+            ).__call__(
+                coin_type=current_derivation[1][0],
+                account=current_derivation[2][0],
+                role=current_derivation[3][0],
+                address=current_derivation[4][0]
+            )
+        elif self._derivation.name() == "Electrum":
+            return DERIVATIONS.derivation(
+                name=self._derivation.name()
+            ).__call__(
+                change=current_derivation[0][0],
+                address=current_derivation[1][0]
+            )
+        elif self._derivation.name() == "Monero":
+            return DERIVATIONS.derivation(
+                name=self._derivation.name()
+            ).__call__(
+                minor=current_derivation[0][0],
+                major=current_derivation[1][0]
+            )
+        elif self._derivation.name() == "HDW":
+            return DERIVATIONS.derivation(
+                name=self._derivation.name()
+            ).__call__(
+                account=current_derivation[0][0],
+                ecc=current_derivation[1][0],
+                address=current_derivation[2][0]
+            )
+        return DERIVATIONS.derivation(
+            name=self._derivation.name()
+        ).__call__(
+            path="m/" + "/".join(
+                [str(item[0]) + "'" if item[1] else str(item[0]) for item in current_derivation]
+            )
+        )
+
+    def _dump_derivations(
+        self, current_derivations: Iterable[List[Tuple[int, bool]]], exclude: set, include: Optional[set] = None
+    ) -> Iterator[dict]:
+        """
+        Dump each of the expanded derivations in order.
+
+        :param current_derivations: The expanded derivations to dump.
+        :type current_derivations: Iterable[List[Tuple[int, bool]]]
+        :param exclude: Set of keys to exclude from each dump.
+        :type exclude: set
+        :param include: Optional set of keys to project each dump onto.
+        :type include: Optional[set]
+
+        :return: An iterator over the derivation dumps.
+        :rtype: Iterator[dict]
+        """
+
+        for current_derivation in current_derivations:
+            self.update_derivation(
+                derivation=self._derivation_from(current_derivation=current_derivation)
+            )
+            yield self.dump(exclude={"root", *exclude}, include=include)
+
+
+_DUMPS_HDWALLET: Optional[HDWallet] = None
+
+
+def _dumps_initializer(settings: tuple, root: Tuple[str, dict], derivation: IDerivation) -> None:
+    """
+    Rebuild the wallet of a ``HDWallet.dumps`` worker process, once per process.
+
+    Only the constructor arguments, the root (seed, extended or single key) and the current
+    derivation cross the process boundary; no mnemonic, entropy or derived key cache does.
+
+    :param settings: The ``HDWallet`` constructor arguments.
+    :type settings: tuple
+    :param root: The root initializer name and its arguments.
+    :type root: Tuple[str, dict]
+    :param derivation: The derivation the wallet was on.
+    :type derivation: IDerivation
+    """
+
+    global _DUMPS_HDWALLET
+    cryptocurrency, hd, network, address, kwargs = settings
+    name, arguments = root
+    _DUMPS_HDWALLET = getattr(
+        HDWallet(cryptocurrency, hd=hd, network=network, address=address, **kwargs), name
+    )(**arguments).from_derivation(derivation=derivation)
+
+
+def _dumps_chunk(
+    current_derivations: List[List[Tuple[int, bool]]], exclude: set, include: Optional[set] = None
+) -> List[dict]:
+    """
+    Dump a chunk of expanded derivations in a ``HDWallet.dumps`` worker process.
+
+    :param current_derivations: The expanded derivations to dump.
+    :type current_derivations: List[List[Tuple[int, bool]]]
+    :param exclude: Set of keys to exclude from each dump.
+    :type exclude: set
+    :param include: Optional set of keys to project each dump onto.
+    :type include: Optional[set]
+
+    :return: The list of derivation dumps.
+    :rtype: List[dict]
+    """
+
+    return list(_DUMPS_HDWALLET._dump_derivations(
+        current_derivations=current_derivations, exclude=exclude, include=include
+    ))
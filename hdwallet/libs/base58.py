@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 
+from functools import lru_cache
 from hashlib import sha256
 from Crypto.Hash import keccak
-from typing import List
+from typing import (
+    Iterable, List, Tuple
+)
 
 
 __base58_alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
 
+@lru_cache(maxsize=None)
+def __tables(alphabet: str) -> Tuple[List[str], bytes]:
+    # Two-digit encode table (index 0..len(alphabet)**2-1 -> 2 chars) and a 256-byte decode translation
+    # table (byte -> digit value, 0xff for characters outside the alphabet), built once per alphabet
+    pairs: List[str] = [first + second for first in alphabet for second in alphabet]
+    digits: bytearray = bytearray(b"\xff" * 256)
+    for index, character in enumerate(alphabet.encode("ascii")):
+        digits[character] = index
+    return pairs, bytes(digits)
+
+
 def checksum_encode(address, crypto="eth"):
     out = ""
     keccak_256 = keccak.new(digest_bits=256)
@@ -42,16 +56,26 @@ def ensure_string(data):
 
 
 def encode(data, alphabet=__base58_alphabet):
-    enc = ""
-    val = string_to_int(data)
-    while val >= len(alphabet):
-        val, mod = divmod(val, len(alphabet))
-        enc = alphabet[mod] + enc
-    if val:
-        enc = alphabet[val] + enc
+    pairs, _ = __tables(alphabet)
+    base: int = len(alphabet)
+    stripped = data.lstrip(b"\0")
+    val = int.from_bytes(stripped, "big")
+
+    # Peel off two base58 digits per division; the reversed chunks are joined once at the end
+    enc = []
+    while val >= len(pairs):
+        val, mod = divmod(val, len(pairs))
+        enc.append(pairs[mod])
+    if val >= base:
+        enc.append(pairs[val])
+    elif val:
+        enc.append(alphabet[val])
+    enc.append(alphabet[0] * (len(data) - len(stripped)))
+    return "".join(reversed(enc))
+
 
-    n = len(data) - len(data.lstrip(b"\0"))
-    return alphabet[0] * n + enc
+def encode_many(datas: Iterable[bytes], alphabet: str = __base58_alphabet) -> List[str]:
+    return [encode(data, alphabet) for data in datas]
 
 
 def check_encode(raw, alphabet=__base58_alphabet):
@@ -59,24 +83,28 @@ def check_encode(raw, alphabet=__base58_alphabet):
     return encode(raw + chk, alphabet)
 
 
+def check_encode_many(raws: Iterable[bytes], alphabet: str = __base58_alphabet) -> List[str]:
+    return [check_encode(raw, alphabet) for raw in raws]
+
+
 def decode(data, alphabet=__base58_alphabet):
+    _, digits = __tables(alphabet)
+    base: int = len(alphabet)
     data = bytes(data, "ascii")
+    stripped = data.lstrip(alphabet[0].encode("ascii"))
 
+    values = stripped.translate(digits)
+    if 0xff in values:
+        raise ValueError("Invalid base58 character")
     val = 0
-    prefix = 0
-    for c in data:
-        val = (val * len(alphabet)) + alphabet.encode("utf-8").find(c)
-        if val == 0:
-            prefix += 1
+    for value in values:
+        val = (val * base) + value
 
-    dec = bytearray()
-    while val > 0:
-        val, mod = divmod(val, 256)
-        dec.append(mod)
+    return bytes(len(data) - len(stripped)) + val.to_bytes((val.bit_length() + 7) // 8, "big")
 
-    dec.extend(bytearray(prefix))
 
-    return bytes(dec[::-1])
+def decode_many(datas: Iterable[str], alphabet: str = __base58_alphabet) -> List[bytes]:
+    return [decode(data, alphabet) for data in datas]
 
 
 def check_decode(enc, alphabet=__base58_alphabet):
@@ -88,6 +116,10 @@ def check_decode(enc, alphabet=__base58_alphabet):
         return raw
 
 
+def check_decode_many(encs: Iterable[str], alphabet: str = __base58_alphabet) -> List[bytes]:
+    return [check_decode(enc, alphabet) for enc in encs]
+
+
 def pad(enc: str, pad_len: int) -> str:
     return enc.rjust(pad_len, __base58_alphabet[0])
 
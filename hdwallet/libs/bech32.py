@@ -20,19 +20,35 @@
 
 """Reference implementation for Bech32 and segwit addresses."""
 
+from functools import lru_cache
+
 
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+CHARSET_REVERSE = {x: i for i, x in enumerate(CHARSET)}
+
+BECH32_CONST = 1
+BECH32M_CONST = 0x2bc830a3
+
+GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
 
 
-def bech32_polymod(values):
-    """Internal function that computes the Bech32 checksum."""
-    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-    chk = 1
+# XOR of the generator words selected by each possible 5-bit top value, so the
+# polymod step is a single lookup instead of a 5-way conditional XOR.
+def _generator_word(top):
+    chk = 0
+    for i in range(5):
+        chk ^= GENERATOR[i] if ((top >> i) & 1) else 0
+    return chk
+
+
+GENERATOR_TABLE = [_generator_word(top) for top in range(32)]
+
+
+def bech32_polymod(values, chk=1):
+    """Internal function that computes the Bech32 checksum, optionally continuing from a prior state."""
+    table = GENERATOR_TABLE
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = (chk & 0x1ffffff) << 5 ^ value ^ table[chk >> 25]
     return chk
 
 
@@ -41,38 +57,49 @@ def bech32_hrp_expand(hrp):
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
-def bech32_verify_checksum(hrp, data):
+@lru_cache(maxsize=256)
+def bech32_hrp_state(hrp):
+    """Checksum state after absorbing the expanded HRP, cached per HRP."""
+    return bech32_polymod(bech32_hrp_expand(hrp))
+
+
+def bech32_verify_checksum(hrp, data, encoding=BECH32_CONST):
     """Verify a checksum given HRP and converted data characters."""
-    return bech32_polymod(bech32_hrp_expand(hrp) + data) == 1
+    return bech32_polymod(data, bech32_hrp_state(hrp)) == encoding
 
 
-def bech32_create_checksum(hrp, data):
+def bech32_create_checksum(hrp, data, encoding=BECH32_CONST):
     """Compute the checksum values given HRP and data."""
-    values = bech32_hrp_expand(hrp) + data
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
+    polymod = bech32_polymod(data + [0, 0, 0, 0, 0, 0], bech32_hrp_state(hrp)) ^ encoding
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
 
-def base_bech32_encode(hrp, data):
+def base_bech32_encode(hrp, data, encoding=BECH32_CONST):
     """Compute a Bech32 string given HRP and data values."""
-    combined = data + bech32_create_checksum(hrp, data)
+    combined = data + bech32_create_checksum(hrp, data, encoding)
     return hrp + '1' + ''.join([CHARSET[d] for d in combined])
 
 
-def base_bech32_decode(bech):
-    """Validate a Bech32 string, and determine HRP and data."""
+def bech32_split(bech, max_length=None):
+    """Split a Bech32 string into HRP and data values (checksum included), without verifying it."""
     if ((any(ord(x) < 33 or ord(x) > 126 for x in bech)) or
             (bech.lower() != bech and bech.upper() != bech)):
         return None, None
     bech = bech.lower()
     pos = bech.rfind('1')
-    if pos < 1 or pos + 7 > len(bech):  # or len(bech) > 90:
+    if pos < 1 or pos + 7 > len(bech) or (max_length is not None and len(bech) > max_length):
         return None, None
-    if not all(x in CHARSET for x in bech[pos+1:]):
+    try:
+        data = [CHARSET_REVERSE[x] for x in bech[pos+1:]]
+    except KeyError:
         return None, None
-    hrp = bech[:pos]
-    data = [CHARSET.find(x) for x in bech[pos+1:]]
-    if not bech32_verify_checksum(hrp, data):
+    return bech[:pos], data
+
+
+def base_bech32_decode(bech):
+    """Validate a Bech32 string, and determine HRP and data."""
+    hrp, data = bech32_split(bech)
+    if hrp is None or not bech32_verify_checksum(hrp, data):
         return None, None
     return hrp, data[:-6]
 
@@ -114,3 +141,8 @@ def bech32_encode(hrp, witprog):
     if base_bech32_decode(ret) == (None, None):
         return None
     return ret
+
+
+def bech32_encode_many(hrp, witprogs):
+    """Compute Bech32 strings for many data values sharing one HRP."""
+    return [bech32_encode(hrp, witprog) for witprog in witprogs]
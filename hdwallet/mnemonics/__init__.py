@@ -26,6 +26,9 @@ from .monero import (  # noqa: F401
     MoneroMnemonic, MONERO_MNEMONIC_WORDS, MONERO_MNEMONIC_LANGUAGES
 )
 from .imnemonic import IMnemonic
+from .recovery import (  # noqa: F401
+    recover, word_candidates
+)
 
 
 class MNEMONICS:
@@ -127,7 +130,7 @@ __all__: List[str] = [
     "ELECTRUM_V1_MNEMONIC_WORDS", "ELECTRUM_V1_MNEMONIC_LANGUAGES",
     "ELECTRUM_V2_MNEMONIC_WORDS", "ELECTRUM_V2_MNEMONIC_LANGUAGES", "ELECTRUM_V2_MNEMONIC_TYPES",
     "MONERO_MNEMONIC_WORDS", "MONERO_MNEMONIC_LANGUAGES",
-    "MNEMONICS"
+    "MNEMONICS", "recover", "word_candidates"
 ] + [
     cls.__name__ for cls in MNEMONICS.classes()
 ]
@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Union, Dict, List, Mapping, Optional
+    Union, Dict, Iterable, List, Mapping, Optional
 )
 
 from ...entropies import (
@@ -17,11 +17,9 @@ from ...exceptions import (
 )
 from ...utils import (
     get_bytes,
-    bytes_to_binary_string,
     bytes_to_string,
-    binary_string_to_integer,
-    integer_to_binary_string,
-    binary_string_to_bytes
+    bytes_to_integer,
+    integer_to_bytes
 )
 from ..imnemonic import IMnemonic
 
@@ -219,27 +217,54 @@ class BIP39Mnemonic(IMnemonic):
         :rtype: str
         """
 
-        entropy: bytes = get_bytes(entropy, unhexlify=True)
-        if not BIP39Entropy.is_valid_bytes_strength(len(entropy)):
-            raise EntropyError(
-                "Wrong entropy strength", expected=BIP39Entropy.strengths, got=(len(entropy) * 8)
-            )
+        return cls._encode_words(entropy=entropy, words_list=cls._encoding_words_list(language=language))
 
-        entropy_binary_string: str = bytes_to_binary_string(get_bytes(entropy), len(entropy) * 8)
-        entropy_hash_binary_string: str = bytes_to_binary_string(sha256(entropy), 32 * 8)
-        mnemonic_bin: str = entropy_binary_string + entropy_hash_binary_string[:len(entropy) // 4]
+    @classmethod
+    def encode_many(cls, entropies: Iterable[Union[str, bytes]], language: str) -> List[str]:
+        """
+        Encodes many entropies into mnemonic phrases, loading the words list only once.
 
-        mnemonic: List[str] = []
+        :param entropies: The entropies to encode into mnemonic phrases.
+        :type entropies: Iterable[Union[str, bytes]]
+        :param language: The language for the mnemonic phrases.
+        :type language: str
+
+        :return: The encoded mnemonic phrases, in input order.
+        :rtype: List[str]
+        """
+
+        words_list: List[str] = cls._encoding_words_list(language=language)
+        return [
+            cls._encode_words(entropy=entropy, words_list=words_list) for entropy in entropies
+        ]
+
+    @classmethod
+    def _encoding_words_list(cls, language: str) -> List[str]:
         words_list: List[str] = cls.get_words_list_by_language(language=language)  # Already NFC normalized
         if len(words_list) != cls.words_list_number:
             raise Error(
                 "Invalid number of loaded words list", expected=cls.words_list_number, got=len(words_list)
             )
+        return words_list
 
-        for index in range(len(mnemonic_bin) // cls.word_bit_length):
-            word_bin: str = mnemonic_bin[index * cls.word_bit_length:(index + 1) * cls.word_bit_length]
-            word_index: int = binary_string_to_integer(word_bin)
-            mnemonic.append(words_list[word_index])
+    @classmethod
+    def _encode_words(cls, entropy: Union[str, bytes], words_list: List[str]) -> str:
+        entropy: bytes = get_bytes(entropy, unhexlify=True)
+        if not BIP39Entropy.is_valid_bytes_strength(len(entropy)):
+            raise EntropyError(
+                "Wrong entropy strength", expected=BIP39Entropy.strengths, got=(len(entropy) * 8)
+            )
+
+        # The entropy bits, followed by the leading entropy bits / 32 of its SHA-256 hash as checksum
+        checksum_length: int = len(entropy) // 4
+        mnemonic_integer: int = (
+            (bytes_to_integer(entropy) << checksum_length) | (sha256(entropy)[0] >> (8 - checksum_length))
+        )
+        word_mask: int = (1 << cls.word_bit_length) - 1
+        mnemonic: List[str] = [
+            words_list[(mnemonic_integer >> shift) & word_mask]
+            for shift in range(len(entropy) * 8 + checksum_length - cls.word_bit_length, -1, -cls.word_bit_length)
+        ]
 
         # Words from wordlist are normalized NFC for display
         return " ".join(mnemonic)
@@ -291,35 +316,27 @@ class BIP39Mnemonic(IMnemonic):
         entropies: Mapping[Optional[str], str] = {}
         for language, word_indices in candidates.items():
             try:
-                mnemonic_bin: str = "".join(map(
-                    lambda word: integer_to_binary_string(
-                        word_indices[word], cls.word_bit_length
-                    ), words
-                ))
-            
-                mnemonic_bit_length: int = len(mnemonic_bin)
+                mnemonic_integer: int = 0
+                for word in words:
+                    mnemonic_integer = (mnemonic_integer << cls.word_bit_length) | word_indices[word]
+
+                mnemonic_bit_length: int = len(words) * cls.word_bit_length
                 checksum_length: int = mnemonic_bit_length // 33
-                checksum_bin: str = mnemonic_bin[-checksum_length:]
-                entropy: bytes = binary_string_to_bytes(
-                    mnemonic_bin[:-checksum_length], checksum_length * 8
+                checksum_integer: int = mnemonic_integer & ((1 << checksum_length) - 1)
+                entropy: bytes = integer_to_bytes(
+                    mnemonic_integer >> checksum_length, checksum_length * 4
                 )
-                entropy_hash_bin: str = bytes_to_binary_string(
-                    sha256(entropy), 32 * 8
-                )
-                checksum_bin_got: str = entropy_hash_bin[:checksum_length]
-                if checksum_bin != checksum_bin_got:
+                checksum_integer_got: int = sha256(entropy)[0] >> (8 - checksum_length)
+                if checksum_integer != checksum_integer_got:
                     raise ChecksumError(
-                        f"Invalid {language or '(custom word list)'} checksum", expected=checksum_bin, got=checksum_bin_got
+                        f"Invalid {language or '(custom word list)'} checksum",
+                        expected=f"{checksum_integer:0{checksum_length}b}",
+                        got=f"{checksum_integer_got:0{checksum_length}b}"
                     )
-            
+
                 if checksum:
-                    pad_bit_len: int = (
-                        mnemonic_bit_length
-                        if mnemonic_bit_length % 8 == 0 else
-                        mnemonic_bit_length + (8 - mnemonic_bit_length % 8)
-                    )
                     entropies[language] = bytes_to_string(
-                        binary_string_to_bytes(mnemonic_bin, pad_bit_len // 4)
+                        integer_to_bytes(mnemonic_integer, (mnemonic_bit_length + 7) // 8)
                     )
                 else:
                     entropies[language] = bytes_to_string(entropy)
@@ -338,3 +355,56 @@ class BIP39Mnemonic(IMnemonic):
             else:
                 return entropy
         raise exception
+
+    @classmethod
+    def decode_many(
+        cls,
+        mnemonics: Iterable[str],
+        language: Optional[str] = None,
+        checksum: bool = False,
+        words_list: Optional[List[str]] = None,
+        words_list_with_index: Optional[Mapping[str, int]] = None,
+    ) -> List[str]:
+        """
+        Decodes many mnemonic phrases into their corresponding entropies.
+
+        :param mnemonics: The mnemonic phrases to decode.
+        :type mnemonics: Iterable[str]
+        :param language: The preferred language of the mnemonic phrases
+        :type language: Optional[str]
+        :param checksum: Whether to include the checksum in the returned entropies.
+        :type checksum: bool
+        :param words_list: Optional list of words used to decode the mnemonics.
+        :type words_list: Optional[List[str]]
+        :param words_list_with_index: Optional dictionary mapping words to their indices for decoding.
+        :type words_list_with_index: Optional[dict]
+
+        :return: The decoded entropies, in input order.
+        :rtype: List[str]
+        """
+
+        return [
+            cls.decode(
+                mnemonic=mnemonic, language=language, checksum=checksum, words_list=words_list,
+                words_list_with_index=words_list_with_index
+            ) for mnemonic in mnemonics
+        ]
+
+    @classmethod
+    def is_valid_many(cls, mnemonics: Iterable[str], language: Optional[str] = None, **kwargs) -> List[bool]:
+        """
+        Checks if each of the given mnemonics is valid.
+
+        :param mnemonics: The mnemonics to check.
+        :type mnemonics: Iterable[str]
+        :param language: The preferred language of the mnemonics.
+        :type language: Optional[str]
+        :param kwargs: Additional keyword arguments.
+
+        :return: Whether each mnemonic is valid, in input order.
+        :rtype: List[bool]
+        """
+
+        return [
+            cls.is_valid(mnemonic=mnemonic, language=language, **kwargs) for mnemonic in mnemonics
+        ]
@@ -11,12 +11,13 @@ from collections import (
     abc
 )
 from typing import (
-    Any, Callable, Collection, Dict, Generator, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple, Union
+    Any, Callable, Collection, Dict, Generator, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple, Union
 )
 
 import os
 import string
 import unicodedata
+from bisect import bisect_left
 from functools import lru_cache
 from fractions import Fraction
 
@@ -243,7 +244,11 @@ def unmark( word_composed: str ) -> str:
 class WordIndices( abc.Mapping ):
     """A Mapping which holds a Sequence of Mnemonic words.
 
-    The underlying Trie is built during construction, but a WordIndices Mapping is not mutable.
+    Each word's canonical key (without its Unicode "Marks", where they can be aliased) is kept in a
+    flat sorted array alongside its word index, and looked up by bisection; the marked glyphs
+    accepted as aliases are kept per canonical prefix.  A WordIndices Mapping is not mutable.  The
+    equivalent Trie, with the unmarked glyphs aliased, is only built on demand for display and for
+    interactive symbol options.
 
     Acts like a basic { "word": index, ... } dict but with additional word flexibility.
 
@@ -265,35 +270,144 @@ class WordIndices( abc.Mapping ):
         <WordIndices>.keys()[int(index)]
 
     """
+
+    # Sorts after any glyph in a words list; bounds the range of keys starting with a prefix
+    _LAST: str = "\U0010ffff"
+
     def __init__(self, sequence: Sequence[str]):
         """Insert a sequence of Unicode words with a value equal to the enumeration, making the
         "unmarked" version an alias of the regular Unicode version.
 
+        As in the equivalent Trie, a marked glyph is aliased to its unmarked glyph at the node (ie.
+        canonical prefix) where it occurs, so it applies to every word continuing from that prefix.
+
         """
-        self._trie = Trie()
-        self._words: List[str] = []
-        for i, word in enumerate( sequence ):
-            self._words.append( word )
+        self._words: List[str] = list( sequence )
+        self._aliases: Dict[str, Dict[str, str]] = {}
+        keys: Dict[str, int] = {}
+        for i, word in enumerate( self._words ):
             word_unmarked = unmark( word )
 
             if word == word_unmarked or len( word ) != len( word_unmarked ):
                 # If the word has no marks, or if the unmarked word doesn't have the same number of
                 # glyphs, we can't "alias" it; insert the original word with NFC "combined" glyphs.
-                self._trie.insert( word, i )
+                key = self._canonical( word )
+            else:
+                key = word_unmarked
+                for length, (c, c_un) in enumerate( zip( word, word_unmarked )):
+                    if c != c_un:
+                        self._aliases.setdefault( word_unmarked[:length], {} )[c] = c_un
+            assert keys.setdefault( key, i ) == i, \
+                f"Attempt to re-insert {word!r}; already present with value {keys[key]!r}"
+        self._keys: List[str] = sorted( keys )
+        self._values: List[int] = [ keys[key] for key in self._keys ]
+        self._trie_cache: Optional[Trie] = None
+        for prefix, aliases in self._aliases.items():
+            for c, c_un in aliases.items():
+                lo = bisect_left( self._keys, prefix + c )
+                assert lo == len( self._keys ) or not self._keys[lo].startswith( prefix + c ), \
+                    f"Attempting to alias {c!r} to {c_un!r} but already exists as a non-alias"
+
+    def _canonical( self, key: str ) -> str:
+        """Replace each aliased (marked) glyph in 'key' with its unmarked glyph."""
+        if not self._aliases:
+            return key
+        canonical = ''
+        for c in key:
+            canonical += self._aliases.get( canonical, {} ).get( c, c )
+        return canonical
+
+    def _spellings( self, key: str ) -> List[str]:
+        """Every spelling of the canonical 'key', with each glyph optionally replaced by its aliases."""
+        spellings: List[str] = [ '' ]
+        for length, g in enumerate( key ):
+            glyphs = [ g ] + [ c for c, c_un in self._aliases.get( key[:length], {} ).items() if c_un == g ]
+            spellings = [ spelling + c for spelling in spellings for c in glyphs ]
+        return spellings
+
+    @classmethod
+    def from_arrays(
+        cls, words: Sequence[str], keys: Sequence[str], values: Sequence[int], aliases: Mapping[str, Mapping[str, str]]
+    ) -> "WordIndices":
+        """Restore a WordIndices from its serialized flat arrays (see .arrays), without rebuilding.
+
+        """
+        word_indices = cls.__new__( cls )
+        word_indices._words = list( words )
+        word_indices._keys = list( keys )
+        word_indices._values = list( values )
+        word_indices._aliases = { prefix: dict( glyphs ) for prefix, glyphs in aliases.items() }
+        word_indices._trie_cache = None
+        return word_indices
+
+    def arrays( self ) -> Tuple[List[str], List[str], List[int], Dict[str, Dict[str, str]]]:
+        """The serializable form: the canonical words, the sorted canonical keys and their indices, and
+        the aliased glyphs at each canonical prefix."""
+        return self._words, self._keys, self._values, self._aliases
+
+    def __reduce__( self ):
+        return self.__class__.from_arrays, self.arrays()
+
+    @property
+    def _trie( self ) -> Trie:
+        """The equivalent Trie, with each marked glyph aliased to its unmarked glyph's TrieNode."""
+        if self._trie_cache is not None:
+            return self._trie_cache
+        trie = Trie()
+        for i, word in enumerate( self._words ):
+            word_unmarked = unmark( word )
+
+            if word == word_unmarked or len( word ) != len( word_unmarked ):
+                trie.insert( word, i )
                 continue
 
             # Traverse the TrieNodes representing 'word_unmarked'.  Each glyph in word and
             # word_unmarked is joined by the TrieNode which contains it in .children, and we should
             # never get a None (lose the plot) because we've just inserted 'word'!  This will
             # "alias" each glyph with a mark, to the .children entry for the non-marked glyph.
-            self._trie.insert( word_unmarked, i )
-            for c, c_un, (_, _, n) in zip( word, word_unmarked, self._trie.find( word_unmarked )):
+            trie.insert( word_unmarked, i )
+            for c, c_un, (_, _, n) in zip( word, word_unmarked, trie.find( word_unmarked )):
                 assert n is not None
                 if c != c_un:
                     if c in n.children and c_un in n.children:
                         assert n.children[c_un] is n.children[c], \
                             f"Attempting to alias {c!r} to {c_un!r} but already exists as a non-alias"
                     n.children[c] = n.children[c_un]
+        self._trie_cache = trie
+        return trie
+
+    def _resolve( self, key: str ) -> Optional[int]:
+        """The position in the sorted keys that 'key' resolves to, if any.
+
+        As for a Trie search with completion: an accepted key resolves to itself; otherwise all keys
+        starting with 'key' must follow one path to the first (and shortest) of them, ie. it must be
+        a prefix of the last of them.  Marked and unmarked glyphs count as distinct paths.
+
+        """
+        key = self._canonical( key )
+        lo = bisect_left( self._keys, key )
+        if lo == len( self._keys ) or not self._keys[lo].startswith( key ):
+            return None
+        first = self._keys[lo]
+        if first == key:
+            return lo
+        hi = bisect_left( self._keys, key + self._LAST, lo )
+        if not self._keys[hi - 1].startswith( first ):
+            return None
+        if any( first[:length] in self._aliases for length in range( len( key ), len( first ))):
+            return None
+        return lo
+
+    def _following( self, position: int ) -> Set[str]:
+        """The set of glyphs (including aliases) that may follow the key at 'position'."""
+        key = self._keys[position]
+        following: Set[str] = set( self._aliases.get( key, {} ))
+        position += 1
+        while position < len( self._keys ) and self._keys[position].startswith( key ):
+            glyph = self._keys[position][len( key )]
+            following.add( glyph )
+            position = bisect_left( self._keys, key + glyph + self._LAST, position )
+        return following
 
     def __getitem__(self, key: Union[str, int]) -> Union[int, str]:
         """A Mapping from "word" to index, or the reverse.
@@ -302,8 +416,12 @@ class WordIndices( abc.Mapping ):
         simple, to make WordIndices work similarly to a Dict[str, int] of mnemonic word/index pairs.
 
         """
-        word, index, _ = self.get_details(key)
-        return index if isinstance( key, str ) else word
+        if isinstance( key, int ):
+            return self._words[key]
+        position = self._resolve( key )
+        if position is None:
+            raise KeyError(f"{key!r} does not match any word")
+        return self._values[position]
 
     def get_details(self, key: Union[int, str]) -> Tuple[str, int, Set[str]]:
         """Provide a word (or unique prefix) or an index, and returns a value Tuple consisting of:
@@ -319,12 +437,12 @@ class WordIndices( abc.Mapping ):
             # The key'th word (or IndexError)
             return self._words[key], key, set()
 
-        terminal, prefix, node = self._trie.search( key, complete=True )
-        if not terminal:
-            # We're nowhere in the Trie with this word
+        position = self._resolve( key )
+        if position is None:
+            # We're nowhere in the words with this key
             raise KeyError(f"{key!r} does not match any word")
-        assert node is not None
-        return self._words[node.value], node.value, set(node.children)
+        index = self._values[position]
+        return self._words[index], index, self._following( position )
 
     def __len__(self):
         return len( self._words )
@@ -342,26 +460,42 @@ class WordIndices( abc.Mapping ):
         return zip( self._words, self.values() )
 
     def unique(self):
-        """All full unique words in the Trie, with/without UTF-8 Marks."""
-        for word, _node in self._trie.scan():
-            yield word
+        """All full unique words, with/without UTF-8 Marks."""
+        for key in self._keys:
+            yield from self._spellings( key )
 
     def abbreviations(self):
-        """All unique abbreviations of words in the Trie, with/without UTF-8 Marks.
+        """All unique abbreviations of words, with/without UTF-8 Marks.
 
-        Scans the Trie, identifying each prefix that uniquely abbreviates a word.
+        Identifies each proper prefix of an accepted key that uniquely abbreviates a word.
 
         """
-        def unique( current ):
-            terminal = False
-            for terminal, _, complete in self._trie.complete( current ):
-                pass
-            return terminal
+        for abbrev, _ in self._canonical_indices():
+            if self._keys[bisect_left( self._keys, abbrev )] != abbrev:
+                yield from self._spellings( abbrev )
 
-        for abbrev, node in self._trie.scan( predicate=unique ):
-            if node.value is node.EMPTY:
-                # Only abbreviations (not terminal words) that led to a unique terminal word
-                yield abbrev
+    def indices(self) -> Generator[Tuple[str, int], None, None]:
+        """All accepted keys (full words and unique abbreviations, with/without UTF-8 Marks) and the
+        index each resolves to; ie. every 'str' key for which <WordIndices>[key] succeeds.
+
+        """
+        for key, value in self._canonical_indices():
+            for spelling in self._spellings( key ):
+                yield spelling, value
+
+    def _canonical_indices(self) -> Generator[Tuple[str, int], None, None]:
+        """The canonical keys and unique abbreviations, and the index each resolves to."""
+        seen: Set[str] = set()
+        for key, value in zip( self._keys, self._values ):
+            yield key, value
+            for length in range( len( key ) - 1, 0, -1 ):
+                prefix = key[:length]
+                if prefix in seen:
+                    break
+                seen.add( prefix )
+                position = self._resolve( prefix )
+                if position is not None and self._keys[position] != prefix:
+                    yield prefix, self._values[position]
 
     def options(self, *args, **kwargs):
         return self._trie.options(*args, **kwargs)
@@ -520,12 +654,24 @@ class IMnemonic(ABC):
 
         wordlist_path = cls.wordlist_path if wordlist_path is None else wordlist_path
 
-        # May provide a filesystem path str, or a List-like sequence of words
+        # May provide a filesystem path str (read and normalized once per process), or a List-like
+        # sequence of words
         if isinstance( wordlist_path[language], str ):
-            with open(os.path.join(os.path.dirname(__file__), wordlist_path[language]), "r", encoding="utf-8") as fin:
-                words_list_raw: List[str] = list( fin )
-        else:
-            words_list_raw: List[str] = list( wordlist_path[language] )
+            return list( cls._get_cached_words_list(language, wordlist_path[language]) )
+        return cls._normalize_words_list(language, wordlist_path[language])
+
+    @staticmethod
+    def _normalize_words_list(language: str, words_list_raw: Iterable[str]) -> List[str]:
+        """Standardize raw words list lines to NFC normalized, lower-cased words.
+
+        :param language: The language of the words list, for error reporting.
+        :type language: str
+        :param words_list_raw: The raw words list lines.
+        :type words_list_raw: Iterable[str]
+
+        :return: The words list, normalized to NFC form.
+        :rtype: List[str]
+        """
 
         # Ensure any words are provided in either NFKC or NFKD form.  This eliminates words lists
         # where the provided word is not in standard NFC or NFD form, down-cases them and removes
@@ -543,6 +689,37 @@ class IMnemonic(ABC):
 
         return words_list
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_cached_words_list(cls, language: str, path: str) -> Tuple[str, ...]:
+        """Read and normalize a packaged words list file, once per process.
+
+        :param language: The language of the words list.
+        :type language: str
+        :param path: The words list path, relative to this module.
+        :type path: str
+
+        :return: The words list, normalized to NFC form.
+        :rtype: Tuple[str, ...]
+        """
+        with open(os.path.join(os.path.dirname(__file__), path), "r", encoding="utf-8") as fin:
+            return tuple( cls._normalize_words_list(language, fin) )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_cached_path_word_indices(cls, language: str, path: str) -> WordIndices:
+        """Create and cache WordIndices for a packaged words list file, once per process.
+
+        :param language: The language of the words list.
+        :type language: str
+        :param path: The words list path, relative to this module.
+        :type path: str
+
+        :return: Cached WordIndices object
+        :rtype: WordIndices
+        """
+        return WordIndices(cls._get_cached_words_list(language, path))
+
     @classmethod
     @lru_cache(maxsize=32)
     def _get_cached_word_indices(cls, wordlist_tuple: tuple[str]) -> WordIndices:
@@ -577,10 +754,31 @@ class IMnemonic(ABC):
             words_list: List[str] = cls.get_words_list_by_language(
                 language=candidate, wordlist_path=wordlist_path
             )
-            # Convert to tuple for hashing, cache the WordIndices creation
-            word_indices = cls._get_cached_word_indices(tuple(words_list))
+            path: Union[str, List[str]] = (wordlist_path or cls.wordlist_path)[candidate]
+            if isinstance( path, str ):
+                # Packaged words list; its WordIndices are keyed by path, avoiding re-hashing the words
+                word_indices = cls._get_cached_path_word_indices(candidate, path)
+            else:
+                # Convert to tuple for hashing, cache the WordIndices creation
+                word_indices = cls._get_cached_word_indices(tuple(words_list))
             yield candidate, words_list, word_indices
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_cached_language_index(cls, language: str) -> Dict[str, int]:
+        """Build the index of a packaged language, once per process and only when it is probed.
+
+        Maps each full word, unmarked word and unique abbreviation to the index it resolves to, so a
+        mnemonic's words are looked up with plain dict probes instead of WordIndices bisections.
+
+        :param language: The packaged language to index.
+        :type language: str
+
+        :return: The word -> index index.
+        :rtype: Dict[str, int]
+        """
+        return dict(cls._get_cached_path_word_indices(language, cls.wordlist_path[language]).indices())
+
     @classmethod
     def rank_languages(
         cls,
@@ -593,6 +791,11 @@ class IMnemonic(ABC):
         Returns a sequence of their relative quality, and the Mapping of words/abbreviations to
         indices, and the language.  """
 
+        if wordlist_path is None and mnemonic:
+            # Packaged words lists; look the words up in each candidate language's cached index
+            yield from cls._rank_indexed_languages(mnemonic, language=language)
+            return
+
         language_indices: Dict[str, Mapping[str, int]] = {}
         quality: Dict[str, Fraction] = defaultdict(Fraction)  # What ratio of canonical language symbols were matched
         for candidate, words_list, words_indices in cls.wordlist_indices( wordlist_path=wordlist_path ):
@@ -640,6 +843,54 @@ class IMnemonic(ABC):
         for ratio, candidate in sorted(((v, k) for k, v in quality.items()), reverse=True):
             yield ratio, language_indices[candidate], candidate
 
+    @classmethod
+    def _rank_indexed_languages(
+        cls,
+        mnemonic: List[str],
+        language: Optional[str] = None,
+    ) -> Generator[Tuple[int, Mapping[str, int], str], None, None]:
+        """Ranks the packaged languages that satisfy the given mnemonic, as .rank_languages, by
+        looking its words up in each candidate language's index; an index is only built for a
+        language whose WordIndices accept the mnemonic's first word.
+
+        """
+
+        words_composed: List[str] = [ unicodedata.normalize( "NFKC", word ) for word in mnemonic ]
+
+        # Probe the preferred language first; it wins outright if every word resolves in it
+        candidates: List[str] = list( cls.languages )
+        if language in candidates:
+            candidates.remove( language )
+            candidates.insert( 0, language )
+
+        quality: Dict[str, Fraction] = {}
+        language_indices: Dict[str, Mapping[str, int]] = {}
+        for candidate in candidates:
+            words_indices = cls._get_cached_path_word_indices(candidate, cls.wordlist_path[candidate])
+            # Screen on the first word before building (or using) this language's index
+            if words_composed[0] not in words_indices:
+                continue
+            language_index: Dict[str, int] = cls._get_cached_language_index(candidate)
+            if not all( word in language_index for word in words_composed ):
+                continue
+            language_indices[candidate] = words_indices
+            # The quality of a match is the ratio of symbols provided that exactly match, vs. total
+            # symbols in the canonical words (see .rank_languages).
+            quality[candidate] = Fraction()
+            for word_composed in words_composed:
+                word_canonical = words_indices.keys()[language_index[word_composed]]
+                len_exact = sum( c1 == c2 for c1, c2 in zip( word_composed, word_canonical ))
+                quality[candidate] += Fraction( len_exact, len( word_canonical ))
+            if candidate == language:
+                yield quality[candidate], words_indices, candidate
+                return
+
+        if not quality:
+            raise MnemonicError(f"Invalid {cls.name()} mnemonic words")
+
+        for ratio, candidate in sorted(((v, k) for k, v in quality.items()), reverse=True):
+            yield ratio, language_indices[candidate], candidate
+
     @classmethod
     def find_language(
         cls,
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, Callable, Collection, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
+)
+from concurrent.futures import (
+    ProcessPoolExecutor, as_completed
+)
+from itertools import (
+    combinations, product
+)
+
+import copy
+
+from ..crypto import sha256
+from ..exceptions import (
+    Error, MnemonicError
+)
+from .bip39 import BIP39Mnemonic
+from .imnemonic import WordIndices
+
+# The candidate word indices for each position of a mnemonic
+Template = Tuple[Tuple[int, ...], ...]
+
+
+def word_candidates(
+    word: Optional[str],
+    language: str,
+    distance: int = 1,
+    mnemonic: Type[BIP39Mnemonic] = BIP39Mnemonic
+) -> List[str]:
+    """
+    Get the candidate words for a possibly misspelled mnemonic word.
+
+    A word (or unique abbreviation, with or without UTF-8 Marks) found in the words list is its own
+    only candidate.  Otherwise, every word within ``distance`` symbol insertions, deletions,
+    substitutions or transpositions is a candidate; the symbols tried at each step are only those
+    that ``collect`` reports may follow.  An unknown word (None or ``?``) may be any word.
+
+    :param word: The mnemonic word, abbreviation or misspelling; None or ``?`` if unknown.
+    :type word: Optional[str]
+    :param language: The language of the mnemonic.
+    :type language: str
+    :param distance: The maximum number of symbol edits, default is 1.
+    :type distance: int
+    :param mnemonic: The mnemonic class, default is BIP39Mnemonic.
+    :type mnemonic: Type[BIP39Mnemonic]
+
+    :return: The canonical candidate words, in words list order.
+    :rtype: List[str]
+    """
+
+    (_, words_list, word_indices), = mnemonic.wordlist_indices(language=language)
+    if word not in (None, "", "?"):
+        word = mnemonic.normalize([word])[0]
+    return [
+        words_list[index] for index in _word_candidates(
+            word=word, language=language, distance=distance, mnemonic=mnemonic, word_indices=word_indices
+        )
+    ]
+
+
+def recover(
+    mnemonic: Union[str, List[Optional[str]]],
+    language: Optional[str] = None,
+    distance: int = 1,
+    missing: int = 0,
+    swaps: bool = False,
+    addresses: Optional[Collection[str]] = None,
+    hdwallet: Optional[Any] = None,
+    derivation: Optional[Any] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    mnemonic_class: Type[BIP39Mnemonic] = BIP39Mnemonic
+) -> List[str]:
+    """
+    Recover the mnemonics matching a damaged mnemonic, and optionally any of a set of addresses.
+
+    Unknown words (None or ``?``) may be any word, and misspelled words any of their
+    ``word_candidates``.  Optionally, ``missing`` words may have been lost from unknown positions,
+    and any two words may have been swapped.  Every candidate is first checked against the mnemonic
+    checksum using integer bit operations; only those passing are derived with the ``hdwallet``
+    template (and ``derivation``, if any), and kept if they produce one of the ``addresses``.
+
+    :param mnemonic: The damaged mnemonic words.
+    :type mnemonic: Union[str, List[Optional[str]]]
+    :param language: The language of the mnemonic, default is the best matching language.
+    :type language: Optional[str]
+    :param distance: The maximum number of symbol edits in each misspelled word, default is 1.
+    :type distance: int
+    :param missing: The number of words lost from unknown positions, default is 0.
+    :type missing: int
+    :param swaps: Whether any two words may have been swapped, default is False.
+    :type swaps: bool
+    :param addresses: Optional target addresses; if None, every checksum-valid candidate is returned.
+    :type addresses: Optional[Collection[str]]
+    :param hdwallet: The HDWallet template (cryptocurrency, hd, network, passphrase, ...) used to derive addresses.
+    :type hdwallet: Optional[HDWallet]
+    :param derivation: Optional derivation (ranges) of the addresses, default is the hd's default derivation.
+    :type derivation: Optional[IDerivation]
+    :param workers: Optional number of worker processes to split the candidates across, default is None (sequential).
+    :type workers: Optional[int]
+    :param progress: Optional callback, receiving the number of candidates searched and the total.
+    :type progress: Optional[Callable[[int, int], None]]
+    :param mnemonic_class: The mnemonic class, default is BIP39Mnemonic.
+    :type mnemonic_class: Type[BIP39Mnemonic]
+
+    :return: The recovered mnemonics.
+    :rtype: List[str]
+    """
+
+    if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int) or workers < 1):
+        raise Error(
+            "Invalid number of workers", expected="positive integer", got=workers
+        )
+    if addresses is not None and hdwallet is None:
+        raise Error("Must provide an hdwallet template with addresses")
+
+    words: List[Optional[str]] = [
+        None if word in (None, "", "?") else mnemonic_class.normalize([word])[0]
+        for word in (mnemonic.split() if isinstance(mnemonic, str) else mnemonic)
+    ]
+    if len(words) + missing not in mnemonic_class.words_list:
+        raise MnemonicError(
+            "Invalid mnemonic words count", expected=mnemonic_class.words_list, got=len(words) + missing
+        )
+
+    language, words_list, word_indices = _recovery_language(
+        words=words, language=language, mnemonic=mnemonic_class
+    )
+    candidates: List[Tuple[int, ...]] = [
+        tuple(_word_candidates(
+            word=word, language=language, distance=distance, mnemonic=mnemonic_class, word_indices=word_indices
+        )) for word in words
+    ]
+    for word, indices in zip(words, candidates):
+        if not indices:
+            raise MnemonicError(f"No {language} candidates for mnemonic word {word!r}")
+
+    templates: List[Template] = list(_templates(
+        candidates=candidates, unknown=tuple(range(len(words_list))), missing=missing, swaps=swaps
+    ))
+    total: int = sum(_template_size(template) for template in templates)
+    context: tuple = (
+        mnemonic_class, language, words_list, hdwallet, derivation,
+        None if addresses is None else frozenset(addresses)
+    )
+
+    chunks: List[Template] = [
+        chunk for template in templates for chunk in _split(template, pieces=(workers or 1) * 4)
+    ]
+    recovered: List[List[str]] = [[] for _ in chunks]
+    searched: int = 0
+    if workers is None or workers == 1 or len(chunks) < 2:
+        context = copy.deepcopy(context)
+        for index, chunk in enumerate(chunks):
+            recovered[index] = _recover_template(template=chunk, context=context)
+            searched += _template_size(chunk)
+            if progress is not None:
+                progress(searched, total)
+    else:
+        # Every worker process is seeded once with the words list and the hdwallet template
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_recover_initializer, initargs=(context,)
+        ) as executor:
+            futures: Dict[Any, int] = {
+                executor.submit(_recover_chunk, chunk): index for index, chunk in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                index: int = futures[future]
+                recovered[index] = future.result()
+                searched += _template_size(chunks[index])
+                if progress is not None:
+                    progress(searched, total)
+
+    # The same mnemonic may be reached via different swaps or missing word positions
+    return list(dict.fromkeys(
+        mnemonic for mnemonics in recovered for mnemonic in mnemonics
+    ))
+
+
+def _recovery_language(
+    words: List[Optional[str]], language: Optional[str], mnemonic: Type[BIP39Mnemonic]
+) -> Tuple[str, List[str], WordIndices]:
+    """
+    Select the language whose words list holds the most known words; ties must be resolved by a
+    preferred language.
+    """
+
+    ranked: List[Tuple[int, str, List[str], WordIndices]] = sorted(
+        (
+            (sum(word in word_indices for word in words if word is not None), candidate, words_list, word_indices)
+            for candidate, words_list, word_indices in mnemonic.wordlist_indices(language=language)
+        ),
+        key=lambda ranking: -ranking[0]
+    )
+    if not ranked:
+        raise MnemonicError(f"Invalid {mnemonic.name()} language", expected=mnemonic.languages, got=language)
+    (score, candidate, words_list, word_indices), *others = ranked
+    ambiguous: List[str] = [other for other_score, other, _, _ in others if other_score == score]
+    if ambiguous:
+        raise MnemonicError(
+            f"Ambiguous languages {', '.join(ambiguous)} or {candidate} for mnemonic; specify a preferred language"
+        )
+    return candidate, words_list, word_indices
+
+
+def _word_candidates(
+    word: Optional[str], language: str, distance: int, mnemonic: Type[BIP39Mnemonic], word_indices: WordIndices
+) -> List[int]:
+    """
+    The word indices of each candidate for a possibly misspelled word, following ``collect``.
+    """
+
+    if word in (None, "", "?"):
+        return list(range(len(word_indices)))
+    if word in word_indices:
+        return [word_indices[word]]
+
+    # The (terminal, possible next symbols) after each prefix, or None if no word starts with it
+    states: Dict[str, Optional[Tuple[bool, Set[str]]]] = {}
+
+    def state(prefix: str) -> Optional[Tuple[bool, Set[str]]]:
+        if prefix not in states:
+            collect = mnemonic.collect(languages={language})
+            languages, terminal, possible = collect.send(None)
+            for symbol in prefix:
+                languages, terminal, possible = collect.send(symbol)
+            states[prefix] = (terminal, possible) if languages else None
+        return states[prefix]
+
+    found: Set[int] = set()
+    explored: Set[Tuple[str, str, int]] = set()
+
+    def explore(prefix: str, rest: str, edits: int) -> None:
+        if (prefix, rest, edits) in explored or state(prefix) is None:
+            return
+        explored.add((prefix, rest, edits))
+        _, possible = state(prefix)
+        if not rest:
+            if prefix in word_indices:  # A full word or unique abbreviation
+                found.add(word_indices[prefix])
+        elif rest[0] in possible:
+            explore(prefix + rest[0], rest[1:], edits)
+        if not edits:
+            return
+        if rest:
+            explore(prefix, rest[1:], edits - 1)  # An extra symbol
+            for symbol in possible - {rest[0]}:
+                explore(prefix + symbol, rest[1:], edits - 1)  # A wrong symbol
+            if len(rest) > 1 and rest[0] != rest[1]:
+                explore(prefix, rest[1] + rest[0] + rest[2:], edits - 1)  # Transposed symbols
+        for symbol in possible:
+            explore(prefix + symbol, rest, edits - 1)  # A missing symbol
+
+    explore("", word, distance)
+    return sorted(found)
+
+
+def _templates(
+    candidates: List[Tuple[int, ...]], unknown: Tuple[int, ...], missing: int, swaps: bool
+) -> Iterator[Template]:
+    """
+    Every arrangement of the candidates, with ``missing`` unknown words inserted and optionally two
+    of the words swapped.
+    """
+
+    length: int = len(candidates) + missing
+    seen: Set[Template] = set()
+    for positions in combinations(range(length), missing):
+        remaining: Iterator[Tuple[int, ...]] = iter(candidates)
+        template: List[Tuple[int, ...]] = [
+            unknown if position in positions else next(remaining) for position in range(length)
+        ]
+        arrangements: List[List[Tuple[int, ...]]] = [template]
+        if swaps:
+            for i, j in combinations(range(length), 2):
+                if template[i] != template[j]:
+                    swapped: List[Tuple[int, ...]] = list(template)
+                    swapped[i], swapped[j] = swapped[j], swapped[i]
+                    arrangements.append(swapped)
+        for arrangement in map(tuple, arrangements):
+            if arrangement not in seen:
+                seen.add(arrangement)
+                yield arrangement
+
+
+def _template_size(template: Template) -> int:
+    size: int = 1
+    for indices in template:
+        size *= len(indices)
+    return size
+
+
+def _split(template: Template, pieces: int) -> Iterator[Template]:
+    """
+    Split a template into about ``pieces`` templates, on its first ambiguous word before the last.
+    """
+
+    for position, indices in enumerate(template[:-1]):
+        if len(indices) > 1:
+            size: int = -(-len(indices) // pieces)
+            for start in range(0, len(indices), size):
+                yield template[:position] + (indices[start:start + size],) + template[position + 1:]
+            return
+    yield template
+
+
+def _checksum_valid(template: Template, word_bit_length: int) -> Iterator[Tuple[int, ...]]:
+    """
+    The word indices of every mnemonic in the template with a valid checksum.
+
+    The last word holds the low entropy bits followed by the checksum, so its candidates are grouped
+    by their entropy bits, and each group costs a single SHA-256.
+    """
+
+    words: int = len(template)
+    checksum_length: int = words * word_bit_length // 33
+    entropy_length: int = checksum_length * 4
+    checksum_shift: int = 8 - checksum_length
+    checksum_mask: int = (1 << checksum_length) - 1
+
+    lasts: Dict[int, Set[int]] = {}
+    for index in template[-1]:
+        lasts.setdefault(index >> checksum_length, set()).add(index & checksum_mask)
+
+    shifts: List[int] = [(words - 1 - position) * word_bit_length for position in range(words - 1)]
+    for indices in product(*template[:-1]):
+        mnemonic_integer: int = 0
+        for index, shift in zip(indices, shifts):
+            mnemonic_integer |= index << shift
+        entropy_integer: int = mnemonic_integer >> checksum_length
+        for high, checksums in lasts.items():
+            checksum: int = sha256((entropy_integer | high).to_bytes(entropy_length, "big"))[0] >> checksum_shift
+            if checksum in checksums:
+                yield indices + ((high << checksum_length) | checksum,)
+
+
+def _recover_template(template: Template, context: tuple) -> List[str]:
+    """
+    The checksum-valid mnemonics in the template that derive one of the target addresses, if any.
+    """
+
+    mnemonic_class, language, words_list, hdwallet, derivation, addresses = context
+    recovered: List[str] = []
+    for indices in _checksum_valid(template, word_bit_length=mnemonic_class.word_bit_length):
+        mnemonic: str = " ".join(words_list[index] for index in indices)
+        if addresses is None:
+            recovered.append(mnemonic)
+            continue
+        hdwallet.from_mnemonic(mnemonic_class(mnemonic=mnemonic, language=language))
+        if derivation is None:
+            derived: Collection[str] = [hdwallet.address()]
+        else:
+            # Walking the derivation ranges updates the derivation in place
+            hdwallet.from_derivation(derivation=copy.deepcopy(derivation))
+            derived = [_dump["address"] for _dump in hdwallet.iter_dumps(include={"address"})]
+        if not addresses.isdisjoint(derived):
+            recovered.append(mnemonic)
+    return recovered
+
+
+_RECOVERY_CONTEXT: Optional[tuple] = None
+
+
+def _recover_initializer(context: tuple) -> None:
+    """
+    Seed a ``recover`` worker process with its words list and hdwallet template, once per process.
+
+    :param context: The mnemonic class, language, words list, hdwallet, derivation and addresses.
+    :type context: tuple
+    """
+
+    global _RECOVERY_CONTEXT
+    _RECOVERY_CONTEXT = context
+
+
+def _recover_chunk(template: Template) -> List[str]:
+    """
+    Search a chunk of the candidates in a ``recover`` worker process.
+
+    :param template: The candidate word indices for each position.
+    :type template: Template
+
+    :return: The recovered mnemonics.
+    :rtype: List[str]
+    """
+
+    return _recover_template(template=template, context=_RECOVERY_CONTEXT)
@@ -9,6 +9,10 @@ from typing import (
 )
 
 from .iseed import ISeed
+from .pbkdf2 import PBKDF2Seed  # noqa: F401
+from .cache import (  # noqa: F401
+    SeedCache, SEED_CACHE
+)
 from ..exceptions import SeedError
 from .algorand import AlgorandSeed
 from .bip39 import BIP39Seed
@@ -115,7 +119,7 @@ class SEEDS:
 
 
 __all__: List[str] = [
-    "ISeed", "SEEDS"
+    "ISeed", "PBKDF2Seed", "SEEDS", "SeedCache", "SEED_CACHE"
 ] + [
     cls.__name__ for cls in SEEDS.classes()
 ]
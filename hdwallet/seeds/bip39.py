@@ -5,20 +5,23 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    List, Optional, Union
+    List, Optional, Tuple, Union
 )
 
 import unicodedata
 
-from ..crypto import pbkdf2_hmac_sha512
+from ..crypto import (
+    pbkdf2_hmac_sha512
+)
 from ..utils import bytes_to_string
 from ..mnemonics import (
     IMnemonic, BIP39Mnemonic
 )
-from .iseed import ISeed
+from .cache import cached_seed
+from .pbkdf2 import PBKDF2Seed
 
 
-class BIP39Seed(ISeed):
+class BIP39Seed(PBKDF2Seed):
     """
     This class generates a root extended private key from a given seed using the
     BIP39 standard. The BIP39 standard defines a method for generating mnemonic
@@ -30,7 +33,7 @@ class BIP39Seed(ISeed):
     HD wallets.
 
     .. note::
-        This class inherits from the ``ISeed`` class, thereby ensuring that all functions are accessible.
+        This class inherits from the ``PBKDF2Seed`` class, thereby ensuring that all functions are accessible.
 
     """
 
@@ -51,6 +54,7 @@ class BIP39Seed(ISeed):
         return "BIP39"
 
     @classmethod
+    @cached_seed
     def from_mnemonic(
         cls,
         mnemonic: Union[str, IMnemonic],
@@ -73,6 +77,29 @@ class BIP39Seed(ISeed):
         :rtype: str
 
         """
+        password, salt = cls._stretch_parameters(mnemonic=mnemonic, passphrase=passphrase, language=language)
+        return bytes_to_string(pbkdf2_hmac_sha512(
+            password=password, salt=salt, iteration_num=cls.seed_pbkdf2_rounds
+        ))
+
+    @classmethod
+    def _stretch_parameters(
+        cls, mnemonic: Union[str, IMnemonic], passphrase: Optional[str], language: Optional[str]
+    ) -> Tuple[str, str]:
+        """
+        Canonicalize a mnemonic and build the NFKD-normalized PBKDF2 password and salt for it.
+
+        :param mnemonic: The mnemonic phrase to be decoded.
+        :type mnemonic: Union[str, IMnemonic]
+        :param passphrase: An optional passphrase.
+        :type passphrase: Optional[str]
+        :param language: The preferred language, if known.
+        :type language: Optional[str]
+
+        :return: The PBKDF2 password and salt.
+        :rtype: Tuple[str, str]
+        """
+
         if not isinstance(mnemonic, IMnemonic):
             mnemonic = BIP39Mnemonic(mnemonic=mnemonic, language=language)
         assert isinstance(mnemonic, IMnemonic)
@@ -84,6 +111,4 @@ class BIP39Seed(ISeed):
         salt: str = unicodedata.normalize("NFKD", (
             (cls.seed_salt_modifier + passphrase) if passphrase else cls.seed_salt_modifier
         ))
-        return bytes_to_string(pbkdf2_hmac_sha512(
-            password=normalized_mnemonic, salt=salt, iteration_num=cls.seed_pbkdf2_rounds
-        ))
+        return normalized_mnemonic, salt
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, Callable, Optional
+)
+from collections import OrderedDict
+from functools import wraps
+
+import hashlib
+import hmac
+import inspect
+import os
+import threading
+
+from ..mnemonics import IMnemonic
+from ..exceptions import SeedError
+
+
+class SeedCache:
+    """
+    A process-local, size-bounded LRU cache of seeds derived from mnemonics.
+
+    Entries are keyed by an HMAC-SHA256 of the seed type and its inputs under a random
+    per-process key, so neither mnemonics nor passphrases are held in the cache. Cached
+    seeds are kept in mutable buffers that are overwritten with zeros when evicted or
+    cleared; the ``str`` copies handed out by ``get`` are immutable and cannot be wiped,
+    they live until garbage collected. The cache is disabled (``max_size`` 0) until resized.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        """
+        Initialize a seed cache.
+
+        :param max_size: The maximum number of seeds kept, 0 disables the cache.
+        :type max_size: int
+
+        :return: None
+        """
+
+        self._key: bytes = os.urandom(32)
+        self._lock: threading.Lock = threading.Lock()
+        self._seeds: "OrderedDict[bytes, bytearray]" = OrderedDict()
+        self._max_size: int = 0
+        self.resize(max_size=max_size)
+
+    def max_size(self) -> int:
+        """
+        Get the maximum number of seeds kept.
+
+        :return: The maximum cache size, 0 when disabled.
+        :rtype: int
+        """
+
+        return self._max_size
+
+    def resize(self, max_size: int) -> "SeedCache":
+        """
+        Set the maximum number of seeds kept, evicting the least recently used ones if needed.
+
+        :param max_size: The maximum number of seeds kept, 0 disables the cache.
+        :type max_size: int
+
+        :return: The seed cache.
+        :rtype: SeedCache
+        """
+
+        if isinstance(max_size, bool) or not isinstance(max_size, int) or max_size < 0:
+            raise SeedError(
+                "Invalid seed cache size", expected="non-negative integer", got=max_size
+            )
+        with self._lock:
+            self._max_size = max_size
+            while len(self._seeds) > self._max_size:
+                self._zeroize(self._seeds.popitem(last=False)[1])
+        return self
+
+    def clear(self) -> "SeedCache":
+        """
+        Zeroize and drop every cached seed.
+
+        :return: The seed cache.
+        :rtype: SeedCache
+        """
+
+        with self._lock:
+            while self._seeds:
+                self._zeroize(self._seeds.popitem()[1])
+        return self
+
+    def key(self, name: str, arguments: dict) -> bytes:
+        """
+        Compute the cache key of a seed type and its ``from_mnemonic`` arguments.
+
+        :param name: The seed type name.
+        :type name: str
+        :param arguments: The bound ``from_mnemonic`` arguments.
+        :type arguments: dict
+
+        :return: The keyed hash of the inputs.
+        :rtype: bytes
+        """
+
+        message: hmac.HMAC = hmac.new(self._key, name.encode("utf-8"), hashlib.sha256)
+        for argument, value in sorted(arguments.items()):
+            if isinstance(value, IMnemonic):
+                value = (value.name(), value.mnemonic(), value.language())
+            message.update(b"\x00" + argument.encode("utf-8") + b"\x00" + repr(value).encode("utf-8"))
+        return message.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Get a cached seed.
+
+        The seed is returned as a new immutable ``str``, like ``from_mnemonic`` returns it;
+        only the cached buffer itself is zeroized on eviction, not the copies handed out.
+
+        :param key: The cache key.
+        :type key: bytes
+
+        :return: The seed, or None if not cached.
+        :rtype: Optional[str]
+        """
+
+        with self._lock:
+            seed: Optional[bytearray] = self._seeds.get(key)
+            if seed is None:
+                return None
+            self._seeds.move_to_end(key)
+            return seed.decode("ascii")
+
+    def put(self, key: bytes, seed: str) -> None:
+        """
+        Cache a seed, evicting the least recently used one when full.
+
+        :param key: The cache key.
+        :type key: bytes
+        :param seed: The seed.
+        :type seed: str
+
+        :return: None
+        """
+
+        with self._lock:
+            if not self._max_size:
+                return
+            if key in self._seeds:
+                self._zeroize(self._seeds.pop(key))
+            self._seeds[key] = bytearray(seed.encode("ascii"))
+            if len(self._seeds) > self._max_size:
+                self._zeroize(self._seeds.popitem(last=False)[1])
+
+    def __len__(self) -> int:
+        return len(self._seeds)
+
+    @staticmethod
+    def _zeroize(seed: bytearray) -> None:
+        seed[:] = bytes(len(seed))
+
+
+SEED_CACHE: SeedCache = SeedCache()
+
+
+def cached_seed(from_mnemonic: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorate a seed class ``from_mnemonic`` so its result is memoized in ``SEED_CACHE``.
+
+    :param from_mnemonic: The undecorated ``from_mnemonic(cls, mnemonic, ...)`` function.
+    :type from_mnemonic: Callable[..., str]
+
+    :return: The memoizing ``from_mnemonic``.
+    :rtype: Callable[..., str]
+    """
+
+    signature: inspect.Signature = inspect.signature(from_mnemonic)
+
+    @wraps(from_mnemonic)
+    def wrapper(cls: Any, *args, **kwargs) -> str:
+        if not SEED_CACHE.max_size():
+            return from_mnemonic(cls, *args, **kwargs)
+
+        bound: inspect.BoundArguments = signature.bind(cls, *args, **kwargs)
+        bound.apply_defaults()
+        arguments: dict = dict(bound.arguments)
+        arguments.pop(next(iter(signature.parameters)))
+        for name, parameter in signature.parameters.items():
+            if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+                arguments.update(arguments.pop(name))
+
+        key: bytes = SEED_CACHE.key(name=cls.name(), arguments=arguments)
+        seed: Optional[str] = SEED_CACHE.get(key)
+        if seed is None:
+            seed = from_mnemonic(cls, *args, **kwargs)
+            SEED_CACHE.put(key, seed)
+        return seed
+
+    return wrapper
@@ -25,6 +25,7 @@ from ..utils import (
 from . import (
     ISeed, BIP39Seed
 )
+from .cache import cached_seed
 
 
 class CardanoSeed(ISeed):
@@ -134,6 +135,7 @@ class CardanoSeed(ISeed):
 
 
     @classmethod
+    @cached_seed
     def from_mnemonic(
         cls,
         mnemonic: Union[str, IMnemonic],
@@ -13,6 +13,7 @@ from ...mnemonics import (
     IMnemonic, ElectrumV1Mnemonic
 )
 from ...utils import bytes_to_string, encode
+from ..cache import cached_seed
 from ..iseed import ISeed
 
 
@@ -43,6 +44,7 @@ class ElectrumV1Seed(ISeed):
         return "Electrum-V1"
 
     @classmethod
+    @cached_seed
     def from_mnemonic(
         cls,
         mnemonic: Union[str, IMnemonic],
@@ -5,20 +5,23 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    List, Optional, Union
+    List, Optional, Tuple, Union
 )
 
 import unicodedata
 
-from ...crypto import pbkdf2_hmac_sha512
+from ...crypto import (
+    pbkdf2_hmac_sha512
+)
 from ...utils import bytes_to_string
 from ...mnemonics import (
     IMnemonic, ElectrumV2Mnemonic, ELECTRUM_V2_MNEMONIC_TYPES
 )
-from ..iseed import ISeed
+from ..cache import cached_seed
+from ..pbkdf2 import PBKDF2Seed
 
 
-class ElectrumV2Seed(ISeed):
+class ElectrumV2Seed(PBKDF2Seed):
     """
     This class generates a root extended private key from a given seed using the
     Electrum-V2 standard. The Electrum-V2 standard defines a method for generating mnemonic
@@ -26,7 +29,7 @@ class ElectrumV2Seed(ISeed):
     deterministic wallets.
 
     .. note::
-        This class inherits from the ``ISeed`` class, thereby ensuring that all functions are accessible.
+        This class inherits from the ``PBKDF2Seed`` class, thereby ensuring that all functions are accessible.
     """
 
     seed_salt_modifier: str = "electrum"
@@ -46,6 +49,7 @@ class ElectrumV2Seed(ISeed):
         return "Electrum-V2"
 
     @classmethod
+    @cached_seed
     def from_mnemonic(
         cls,
         mnemonic: Union[str, IMnemonic],
@@ -66,6 +70,35 @@ class ElectrumV2Seed(ISeed):
         :return: The derived seed as a string.
         :rtype: str
         """
+        password, salt = cls._stretch_parameters(mnemonic=mnemonic, passphrase=passphrase, language=language)
+        return bytes_to_string(pbkdf2_hmac_sha512(
+            password=password, salt=salt, iteration_num=cls.seed_pbkdf2_rounds
+        ))
+
+    @classmethod
+    def _stretch_parameters(
+        cls,
+        mnemonic: Union[str, IMnemonic],
+        passphrase: Optional[str],
+        language: Optional[str],
+        mnemonic_type=ELECTRUM_V2_MNEMONIC_TYPES.STANDARD
+    ) -> Tuple[str, str]:
+        """
+        Canonicalize an Electrum V2 mnemonic and build the NFKD-normalized PBKDF2 password and salt for it.
+
+        :param mnemonic: The mnemonic phrase to be decoded.
+        :type mnemonic: Union[str, IMnemonic]
+        :param passphrase: An optional passphrase.
+        :type passphrase: Optional[str]
+        :param language: The preferred language, if known.
+        :type language: Optional[str]
+        :param mnemonic_type: The type of Electrum V2 mnemonic, defaults to STANDARD.
+        :type mnemonic_type: str
+
+        :return: The PBKDF2 password and salt.
+        :rtype: Tuple[str, str]
+        """
+
         if not isinstance(mnemonic, IMnemonic):
             mnemonic = ElectrumV2Mnemonic(mnemonic=mnemonic, language=language)
         assert isinstance(mnemonic, ElectrumV2Mnemonic)
@@ -73,6 +106,4 @@ class ElectrumV2Seed(ISeed):
         salt: str = unicodedata.normalize("NFKD", (
             (cls.seed_salt_modifier + passphrase) if passphrase else cls.seed_salt_modifier
         ))
-        return bytes_to_string(pbkdf2_hmac_sha512(
-            password=unicodedata.normalize("NFKD", mnemonic.mnemonic()), salt=salt, iteration_num=cls.seed_pbkdf2_rounds
-        ))
+        return unicodedata.normalize("NFKD", mnemonic.mnemonic()), salt
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from abc import abstractmethod
+from typing import (
+    Any, Iterable, List, Optional, Tuple, Union
+)
+
+from ..crypto import pbkdf2_hmac_sha512_many
+from ..exceptions import SeedError
+from ..mnemonics import IMnemonic
+from ..utils import bytes_to_string
+from .iseed import ISeed
+
+
+class PBKDF2Seed(ISeed):
+    """
+    A seed stretched from its mnemonic with PBKDF2-HMAC-SHA512, which can also convert many
+    mnemonics at once.
+
+    .. note::
+        This class inherits from the ``ISeed`` class, thereby ensuring that all functions are accessible.
+    """
+
+    seed_salt_modifier: str
+    seed_pbkdf2_rounds: int
+
+    @classmethod
+    def from_mnemonics(
+        cls,
+        mnemonics: Iterable[Union[str, IMnemonic]],
+        passphrases: Optional[Union[str, Iterable[Optional[str]]]] = None,
+        language: Optional[str] = None,
+        workers: Optional[int] = None,
+        **kwargs: Any
+    ) -> List[str]:
+        """
+        Converts many mnemonic phrases to their seeds, running the PBKDF2 stretches on a thread pool.
+
+        :param mnemonics: The mnemonic phrases to be decoded.
+        :type mnemonics: Iterable[Union[str, IMnemonic]]
+        :param passphrases: One passphrase for every mnemonic, or a passphrase per mnemonic.
+        :type passphrases: Optional[Union[str, Iterable[Optional[str]]]]
+        :param language: The preferred language, if known.
+        :type language: Optional[str]
+        :param workers: Optional number of threads to spread the stretches over.
+        :type workers: Optional[int]
+        :param kwargs: Additional keyword arguments passed on to ``_stretch_parameters``.
+        :type kwargs: Any
+
+        :return: The seeds, in input order.
+        :rtype: List[str]
+        """
+
+        mnemonics = list(mnemonics)
+        if passphrases is None or isinstance(passphrases, str):
+            passphrases = [passphrases] * len(mnemonics)
+        else:
+            passphrases = list(passphrases)
+            if len(passphrases) != len(mnemonics):
+                raise SeedError(
+                    "Invalid number of passphrases", expected=len(mnemonics), got=len(passphrases)
+                )
+
+        parameters: List[Tuple[str, str]] = [
+            cls._stretch_parameters(mnemonic=mnemonic, passphrase=passphrase, language=language, **kwargs)
+            for mnemonic, passphrase in zip(mnemonics, passphrases)
+        ]
+        return [
+            bytes_to_string(seed) for seed in pbkdf2_hmac_sha512_many(
+                passwords=[password for password, _ in parameters],
+                salts=[salt for _, salt in parameters],
+                iteration_num=cls.seed_pbkdf2_rounds,
+                workers=workers
+            )
+        ]
+
+    @classmethod
+    @abstractmethod
+    def _stretch_parameters(
+        cls, mnemonic: Union[str, IMnemonic], passphrase: Optional[str], language: Optional[str], **kwargs: Any
+    ) -> Tuple[str, str]:
+        """
+        Canonicalize a mnemonic and build the normalized PBKDF2 password and salt for it.
+
+        :param mnemonic: The mnemonic phrase to be decoded.
+        :type mnemonic: Union[str, IMnemonic]
+        :param passphrase: An optional passphrase.
+        :type passphrase: Optional[str]
+        :param language: The preferred language, if known.
+        :type language: Optional[str]
+
+        :return: The PBKDF2 password and salt.
+        :rtype: Tuple[str, str]
+        """
+        pass
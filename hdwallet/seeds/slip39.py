@@ -12,6 +12,7 @@ from ..exceptions import EntropyError
 from ..mnemonics import IMnemonic
 from ..mnemonics.bip39 import BIP39Mnemonic
 from ..mnemonics.slip39 import SLIP39Mnemonic
+from .cache import cached_seed
 from .iseed import ISeed
 
 
@@ -41,6 +42,7 @@ class SLIP39Seed(ISeed):
         return "SLIP39"
 
     @classmethod
+    @cached_seed
     def from_mnemonic(
         cls,
         mnemonic: Union[str, IMnemonic],
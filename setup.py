@@ -52,12 +52,13 @@ setup(
         ]
     ),
     python_requires=">=3.9,<4",
-    packages=find_packages(exclude=["tests*"]),
+    packages=find_packages(exclude=["tests*", "benchmarks*"]),
     install_requires=get_requirements(name="requirements"),
     include_package_data=True,
     extras_require=dict(
         cli=get_requirements(name="requirements/cli"),
         docs=get_requirements(name="requirements/docs"),
+        openssl=get_requirements(name="requirements/openssl"),
         tests=get_requirements(name="requirements/tests")
     ),
     classifiers=[
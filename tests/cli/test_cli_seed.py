@@ -93,3 +93,31 @@ def test_cli_seed(data, cli_tester):
 
                     assert output["client"] == client
                     assert output["seed"] == seed
+
+
+def test_cli_seed_mnemonics_file(data, cli_tester):
+
+    for client in ["BIP39", "Electrum-V2"]:
+        if client == "Electrum-V2":
+            entries = [
+                data["seeds"][client][words]["standard"]["english"] for words in data["seeds"][client].keys()
+            ]
+        else:
+            entries = [
+                data["seeds"][client][words]["english"] for words in data["seeds"][client].keys()
+            ]
+
+        cli = cli_tester.invoke(
+            cli_main, [
+                "generate", "seed",
+                "--client", client,
+                "--language", "english",
+                "--passphrase", "hdwallet",
+                "--mnemonics-file", "-",
+                "--workers", "2",
+            ], input="\n".join(entry["mnemonic"] for entry in entries) + "\n"
+        )
+        outputs = json.loads(cli.output)
+
+        assert [output["client"] for output in outputs] == [client] * len(entries)
+        assert [output["seed"] for output in outputs] == [entry["passphrases"]["hdwallet"] for entry in entries]
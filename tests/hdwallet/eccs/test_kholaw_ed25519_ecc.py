@@ -5,9 +5,11 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from hashlib import sha512
 from nacl.signing import (
     SigningKey, VerifyKey
 )
+import pytest
 
 from hdwallet.eccs import (
     IPoint, IPublicKey, IPrivateKey
@@ -101,3 +103,21 @@ def test_kholaw_ed25519_ecc_private_key(data):
     assert isinstance(private_key.public_key(), KholawEd25519PublicKey)
     assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["Kholaw-Ed25519"]["uncompressed"]["public-key"])
     assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["Kholaw-Ed25519"]["compressed"]["public-key"])
+
+
+def test_kholaw_ed25519_ecc_public_keys_from_private_bytes(data):
+
+    private_keys = [get_bytes(data["eccs"]["Kholaw-Ed25519"]["private-key"])] + [
+        sha512(bytes([index])).digest() for index in range(16)
+    ]
+    for ecc in [KholawEd25519ECC]:
+        for public_key_type, compressed in [("uncompressed", False), ("compressed", True)]:
+            public_keys = ecc.public_keys_from_private_bytes(private_keys, compressed=compressed)
+            assert public_keys[0] == get_bytes(data["eccs"]["Kholaw-Ed25519"][public_key_type]["public-key"])
+            assert public_keys == [
+                getattr(ecc.PRIVATE_KEY.from_bytes(private_key).public_key(), f"raw_{public_key_type}")()
+                for private_key in private_keys
+            ]
+        assert ecc.public_keys_from_private_bytes([]) == []
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            ecc.public_keys_from_private_bytes(private_keys + [bytes(32)])
@@ -5,9 +5,11 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from hashlib import sha256
 from ed25519_blake2b import (
     SigningKey, VerifyingKey
 )
+import pytest
 
 from hdwallet.eccs import (
     IPoint, IPublicKey, IPrivateKey
@@ -100,3 +102,21 @@ def test_slip10_ed25519_blake2b_ecc_private_key(data):
     assert isinstance(private_key.public_key(), SLIP10Ed25519Blake2bPublicKey)
     assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Ed25519-Blake2b"]["uncompressed"]["public-key"])
     assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["SLIP10-Ed25519-Blake2b"]["compressed"]["public-key"])
+
+
+def test_slip10_ed25519_blake2b_ecc_public_keys_from_private_bytes(data):
+
+    private_keys = [get_bytes(data["eccs"]["SLIP10-Ed25519-Blake2b"]["private-key"])] + [
+        sha256(bytes([index])).digest() for index in range(16)
+    ]
+    for ecc in [SLIP10Ed25519Blake2bECC]:
+        for public_key_type, compressed in [("uncompressed", False), ("compressed", True)]:
+            public_keys = ecc.public_keys_from_private_bytes(private_keys, compressed=compressed)
+            assert public_keys[0] == get_bytes(data["eccs"]["SLIP10-Ed25519-Blake2b"][public_key_type]["public-key"])
+            assert public_keys == [
+                getattr(ecc.PRIVATE_KEY.from_bytes(private_key).public_key(), f"raw_{public_key_type}")()
+                for private_key in private_keys
+            ]
+        assert ecc.public_keys_from_private_bytes([]) == []
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            ecc.public_keys_from_private_bytes(private_keys + [bytes(31)])
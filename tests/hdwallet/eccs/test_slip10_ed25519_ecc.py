@@ -5,9 +5,11 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from hashlib import sha256
 from nacl.signing import (
     SigningKey, VerifyKey
 )
+import pytest
 
 from hdwallet.eccs import (
     IPoint, IPublicKey, IPrivateKey
@@ -101,3 +103,58 @@ def test_slip10_ed25519_ecc_private_key(data):
     assert isinstance(private_key.public_key(), SLIP10Ed25519PublicKey)
     assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Ed25519"]["uncompressed"]["public-key"])
     assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["SLIP10-Ed25519"]["compressed"]["public-key"])
+
+
+def test_slip10_ed25519_ecc_public_keys_from_private_bytes(data):
+
+    private_keys = [get_bytes(data["eccs"]["SLIP10-Ed25519"]["private-key"])] + [
+        sha256(bytes([index])).digest() for index in range(16)
+    ]
+    for ecc in [SLIP10Ed25519ECC]:
+        for public_key_type, compressed in [("uncompressed", False), ("compressed", True)]:
+            public_keys = ecc.public_keys_from_private_bytes(private_keys, compressed=compressed)
+            assert public_keys[0] == get_bytes(data["eccs"]["SLIP10-Ed25519"][public_key_type]["public-key"])
+            assert public_keys == [
+                getattr(ecc.PRIVATE_KEY.from_bytes(private_key).public_key(), f"raw_{public_key_type}")()
+                for private_key in private_keys
+            ]
+        assert ecc.public_keys_from_private_bytes([]) == []
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            ecc.public_keys_from_private_bytes(private_keys + [bytes(31)])
+
+
+def test_slip10_ed25519_ecc_public_key_from_bytes_many(data):
+
+    compressed = get_bytes(data["eccs"]["SLIP10-Ed25519"]["compressed"]["public-key"])
+    public_keys = [compressed] + SLIP10Ed25519ECC.public_keys_from_private_bytes(
+        [sha256(bytes([index])).digest() for index in range(16)]
+    )
+    assert SLIP10Ed25519PublicKey.from_bytes_many(b"".join(public_keys)) == public_keys
+    assert SLIP10Ed25519PublicKey.from_bytes_many(
+        memoryview(b"".join(public_key[1:] for public_key in public_keys)), length=32, compressed=False
+    ) == public_keys
+    # A small order point, rejected by libsodium yet on the curve
+    small_order = bytes([1] + [0] * 31)
+    assert SLIP10Ed25519PublicKey.from_bytes_many(small_order, length=32) == [
+        SLIP10Ed25519PublicKey.from_bytes(small_order).raw_compressed()
+    ]
+    assert SLIP10Ed25519PublicKey.from_bytes_many(b"") == []
+    with pytest.raises(ValueError, match="Invalid public key bytes"):
+        SLIP10Ed25519PublicKey.from_bytes_many(compressed + b"\x00" + bytes([2] + [0] * 31))
+    with pytest.raises(ValueError, match="Invalid public keys buffer length"):
+        SLIP10Ed25519PublicKey.from_bytes_many(compressed[:-1])
+    with pytest.raises(ValueError, match="Invalid public keys buffer length"):
+        SLIP10Ed25519PublicKey.from_bytes_many(compressed, length=0)
+
+
+def test_slip10_ed25519_ecc_public_key_add_tweak(data):
+
+    public_key = SLIP10Ed25519PublicKey.from_bytes(
+        get_bytes(data["eccs"]["SLIP10-Ed25519"]["compressed"]["public-key"])
+    )
+    tweak = sha256(b"tweak").digest()
+    tweaked_public_key = public_key.add_tweak(tweak)
+    assert isinstance(tweaked_public_key, SLIP10Ed25519PublicKey)
+    assert tweaked_public_key.point().raw() == (
+        public_key.point() + SLIP10Ed25519ECC.GENERATOR * int.from_bytes(tweak, "big")
+    ).raw()
@@ -5,9 +5,11 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from hashlib import sha256
 from nacl.signing import (
     SigningKey, VerifyKey
 )
+import pytest
 
 from hdwallet.eccs import (
     IPoint, IPublicKey, IPrivateKey
@@ -15,6 +17,7 @@ from hdwallet.eccs import (
 from hdwallet.eccs.slip10.ed25519.monero import (
     SLIP10Ed25519MoneroECC, SLIP10Ed25519MoneroPoint, SLIP10Ed25519MoneroPublicKey, SLIP10Ed25519MoneroPrivateKey
 )
+from hdwallet.libs.ed25519 import scalar_reduce
 from hdwallet.utils import get_bytes
 
 
@@ -101,3 +104,21 @@ def test_slip10_ed25519_monero_ecc_private_key(data):
     assert isinstance(private_key.public_key(), SLIP10Ed25519MoneroPublicKey)
     assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Ed25519-Monero"]["uncompressed"]["public-key"])
     assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["SLIP10-Ed25519-Monero"]["compressed"]["public-key"])
+
+
+def test_slip10_ed25519_monero_ecc_public_keys_from_private_bytes(data):
+
+    private_keys = [get_bytes(data["eccs"]["SLIP10-Ed25519-Monero"]["private-key"])] + [
+        scalar_reduce(sha256(bytes([index])).digest()) for index in range(16)
+    ]
+    for ecc in [SLIP10Ed25519MoneroECC]:
+        for public_key_type, compressed in [("uncompressed", False), ("compressed", True)]:
+            public_keys = ecc.public_keys_from_private_bytes(private_keys, compressed=compressed)
+            assert public_keys[0] == get_bytes(data["eccs"]["SLIP10-Ed25519-Monero"][public_key_type]["public-key"])
+            assert public_keys == [
+                getattr(ecc.PRIVATE_KEY.from_bytes(private_key).public_key(), f"raw_{public_key_type}")()
+                for private_key in private_keys
+            ]
+        assert ecc.public_keys_from_private_bytes([]) == []
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            ecc.public_keys_from_private_bytes(private_keys + [b"\xff" * 32])
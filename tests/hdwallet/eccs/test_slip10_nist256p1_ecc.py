@@ -5,17 +5,26 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from hashlib import sha256
 from ecdsa import (
-    SigningKey, VerifyingKey
+    SigningKey, VerifyingKey, curves
 )
 from ecdsa.ellipticcurve import PointJacobi
+import pytest
 
 from hdwallet.eccs import (
     IPoint, IPublicKey, IPrivateKey
 )
 from hdwallet.eccs.slip10.nist256p1 import (
-    SLIP10Nist256p1ECC, SLIP10Nist256p1Point, SLIP10Nist256p1PublicKey, SLIP10Nist256p1PrivateKey
+    SLIP10Nist256p1ECC, SLIP10Nist256p1Point, SLIP10Nist256p1PublicKey, SLIP10Nist256p1PrivateKey,
+    SLIP10Nist256p1ECCECDSA, SLIP10Nist256p1PointECDSA, SLIP10Nist256p1PublicKeyECDSA, SLIP10Nist256p1PrivateKeyECDSA,
+    SLIP10Nist256p1ECCCryptography, SLIP10Nist256p1PointCryptography, SLIP10Nist256p1PublicKeyCryptography,
+    SLIP10Nist256p1PrivateKeyCryptography, backends, use
 )
+from hdwallet.eccs.slip10 import fixed_base
+from hdwallet.addresses import neo
+from hdwallet.cryptocurrencies import Neo
+from hdwallet.exceptions import ECCError
 from hdwallet.utils import get_bytes
 
 
@@ -102,3 +111,177 @@ def test_slip10_nist256p1_ecc_private_key(data):
     assert isinstance(private_key.public_key(), SLIP10Nist256p1PublicKey)
     assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["uncompressed"]["public-key"])
     assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["compressed"]["public-key"])
+
+
+def test_slip10_nist256p1_ecc_public_key_add_tweak(data):
+
+    public_key = SLIP10Nist256p1PublicKey.from_bytes(
+        get_bytes(data["eccs"]["SLIP10-Nist256p1"]["compressed"]["public-key"])
+    )
+    for tweak in [1, 2, 0xdeadbeef]:
+        tweaked_public_key = public_key.add_tweak(tweak.to_bytes(32, "big"))
+        assert isinstance(tweaked_public_key, SLIP10Nist256p1PublicKey)
+        assert tweaked_public_key.raw_compressed() == SLIP10Nist256p1PublicKey.from_point(
+            public_key.point() + (SLIP10Nist256p1ECC.GENERATOR * tweak)
+        ).raw_compressed()
+
+
+def test_slip10_nist256p1_ecc_fixed_base():
+
+    order = SLIP10Nist256p1ECCECDSA.ORDER
+    generic = SLIP10Nist256p1PointECDSA.from_coordinates(
+        SLIP10Nist256p1ECCECDSA.GENERATOR.x(), SLIP10Nist256p1ECCECDSA.GENERATOR.y()
+    )
+    # The generator multiplies through its fixed-base table, any other point generically
+    for scalar in [1, 2, 127, 128, 129, 255, 256, 2 ** 255, order - 1, order - 128, order + 5, 0xdeadbeef]:
+        assert (SLIP10Nist256p1ECCECDSA.GENERATOR * scalar).raw() == (generic * scalar).raw()
+        signing_key = SigningKey.from_secret_exponent(scalar % order, curve=curves.NIST256p)
+        private_key = SLIP10Nist256p1PrivateKeyECDSA.from_bytes(signing_key.to_string())
+        assert private_key.public_key().raw_compressed() == signing_key.get_verifying_key().to_string("compressed")
+        assert private_key.underlying_object().privkey.secret_multiplier == scalar % order
+
+    for private_key in [bytes(32), order.to_bytes(32, "big"), bytes(33)]:
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            SLIP10Nist256p1PrivateKeyECDSA.from_bytes(private_key)
+
+
+def test_slip10_nist256p1_ecc_fixed_base_fallback(monkeypatch):
+
+    # Without the python-ecdsa internals the table falls back to the public API, with the same results
+    scalars = [1, 2, 255, 0xdeadbeef, SLIP10Nist256p1ECCECDSA.ORDER - 1]
+    private_keys = [scalar.to_bytes(32, "big") for scalar in scalars]
+    expected = (
+        [(SLIP10Nist256p1ECCECDSA.GENERATOR * scalar).raw() for scalar in scalars],
+        SLIP10Nist256p1ECCECDSA.public_keys_from_private_bytes(private_keys),
+        [SLIP10Nist256p1PrivateKeyECDSA.from_bytes(private_key).public_key().raw_compressed() for private_key in private_keys]
+    )
+    monkeypatch.setattr(fixed_base, "_JACOBIAN_INTERNALS", False)
+    monkeypatch.setattr(fixed_base, "_SIGNING_KEY_INTERNALS", False)
+    assert (
+        [(SLIP10Nist256p1ECCECDSA.GENERATOR * scalar).raw() for scalar in scalars],
+        SLIP10Nist256p1ECCECDSA.public_keys_from_private_bytes(private_keys),
+        [SLIP10Nist256p1PrivateKeyECDSA.from_bytes(private_key).public_key().raw_compressed() for private_key in private_keys]
+    ) == expected
+    for private_key in [bytes(32), bytes(33)]:
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            SLIP10Nist256p1PrivateKeyECDSA.from_bytes(private_key)
+
+
+requires_cryptography = pytest.mark.skipif(
+    "cryptography" not in backends(), reason="the cryptography package is not installed"
+)
+
+
+@requires_cryptography
+def test_slip10_nist256p1_ecc_point_cryptography(data):
+
+    generic = SLIP10Nist256p1PointECDSA.from_coordinates(
+        SLIP10Nist256p1ECCECDSA.GENERATOR.x(), SLIP10Nist256p1ECCECDSA.GENERATOR.y()
+    )
+    for public_key_type in ["uncompressed", "compressed"]:
+        point = SLIP10Nist256p1PointCryptography.from_bytes(
+            get_bytes(data["eccs"]["SLIP10-Nist256p1"][public_key_type]["point"]["encode"])
+        )
+        assert isinstance(point, IPoint)
+        assert isinstance(point, SLIP10Nist256p1PointCryptography)
+        assert point.x() == data["eccs"]["SLIP10-Nist256p1"][public_key_type]["point"]["x"]
+        assert point.y() == data["eccs"]["SLIP10-Nist256p1"][public_key_type]["point"]["y"]
+        assert point.raw() == point.raw_encoded() == get_bytes(data["eccs"]["SLIP10-Nist256p1"][public_key_type]["point"]["encode"])
+        assert point.raw_decoded() == get_bytes(data["eccs"]["SLIP10-Nist256p1"][public_key_type]["point"]["decode"])
+
+        # Multiples of any point come from OpenSSL, and must match python-ecdsa's
+        for number in range(2, 50):
+            point_add, point_mul, point_rmul = point + (point * (number - 1)), point * number, number * point
+            assert isinstance(point_mul, SLIP10Nist256p1PointCryptography)
+            assert point_add.raw() == point_mul.raw() == point_rmul.raw()
+        order = SLIP10Nist256p1ECCCryptography.ORDER
+        ecdsa_point = SLIP10Nist256p1PointECDSA.from_coordinates(point.x(), point.y())
+        for scalar in [1, 2, order - 2, order - 1, order + 5, 2 ** 255, 0xdeadbeef]:
+            assert (point * scalar).raw() == (ecdsa_point * scalar).raw()
+            assert (SLIP10Nist256p1ECCCryptography.GENERATOR * scalar).raw() == (generic * scalar).raw()
+
+
+@requires_cryptography
+def test_slip10_nist256p1_ecc_public_key_cryptography(data):
+
+    assert SLIP10Nist256p1PublicKeyCryptography.name() == data["eccs"]["SLIP10-Nist256p1"]["name"]
+    assert SLIP10Nist256p1PublicKeyCryptography.uncompressed_length() == data["eccs"]["SLIP10-Nist256p1"]["uncompressed"]["length"]
+    assert SLIP10Nist256p1PublicKeyCryptography.compressed_length() == data["eccs"]["SLIP10-Nist256p1"]["compressed"]["length"]
+    for public_key_type in ["uncompressed", "compressed"]:
+        public_key = SLIP10Nist256p1PublicKeyCryptography.from_bytes(
+            get_bytes(data["eccs"]["SLIP10-Nist256p1"][public_key_type]["public-key"])
+        )
+        assert isinstance(public_key, IPublicKey)
+        assert isinstance(public_key, SLIP10Nist256p1PublicKeyCryptography)
+        assert public_key.raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["uncompressed"]["public-key"])
+        assert public_key.raw_compressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["compressed"]["public-key"])
+        assert isinstance(public_key.point(), SLIP10Nist256p1PointCryptography)
+        assert SLIP10Nist256p1PublicKeyCryptography.from_point(public_key.point()).raw_compressed() == public_key.raw_compressed()
+    assert not SLIP10Nist256p1PublicKeyCryptography.is_valid_bytes(b"\x04" + bytes(64))
+    assert not SLIP10Nist256p1PublicKeyECDSA.is_valid_bytes(b"\x04" + bytes(64))
+
+    for tweak in [1, 2, 0xdeadbeef]:
+        assert public_key.add_tweak(tweak.to_bytes(32, "big")).raw_compressed() == SLIP10Nist256p1PublicKeyECDSA.from_bytes(
+            public_key.raw_compressed()
+        ).add_tweak(tweak.to_bytes(32, "big")).raw_compressed()
+
+
+@requires_cryptography
+def test_slip10_nist256p1_ecc_private_key_cryptography(data):
+
+    assert SLIP10Nist256p1PrivateKeyCryptography.name() == data["eccs"]["SLIP10-Nist256p1"]["name"]
+    assert SLIP10Nist256p1PrivateKeyCryptography.length() == data["eccs"]["SLIP10-Nist256p1"]["private-key-length"]
+    private_key = SLIP10Nist256p1PrivateKeyCryptography.from_bytes(
+        get_bytes(data["eccs"]["SLIP10-Nist256p1"]["private-key"])
+    )
+    assert isinstance(private_key, IPrivateKey)
+    assert isinstance(private_key, SLIP10Nist256p1PrivateKeyCryptography)
+    assert private_key.raw() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["private-key"])
+    assert isinstance(private_key.public_key(), SLIP10Nist256p1PublicKeyCryptography)
+    assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["uncompressed"]["public-key"])
+    assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["SLIP10-Nist256p1"]["compressed"]["public-key"])
+
+    for private_key in [bytes(32), SLIP10Nist256p1ECCCryptography.ORDER.to_bytes(32, "big"), bytes(33)]:
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            SLIP10Nist256p1PrivateKeyCryptography.from_bytes(private_key)
+
+
+@requires_cryptography
+def test_slip10_nist256p1_ecc_use(data):
+
+    backend = SLIP10Nist256p1ECC.BACKEND
+    assert backends() == ["cryptography", "ecdsa"]
+    try:
+        public_keys = {}
+        for name in backends():
+            assert use(name) == name == SLIP10Nist256p1ECC.BACKEND
+            assert Neo.ECC.PRIVATE_KEY is SLIP10Nist256p1ECC.PRIVATE_KEY
+            assert neo.SLIP10Nist256p1PublicKey is SLIP10Nist256p1ECC.PUBLIC_KEY
+            public_keys[name] = SLIP10Nist256p1ECC.PRIVATE_KEY.from_bytes(
+                get_bytes(data["eccs"]["SLIP10-Nist256p1"]["private-key"])
+            ).public_key().add_tweak((0xdeadbeef).to_bytes(32, "big")).raw_compressed()
+        assert public_keys["cryptography"] == public_keys["ecdsa"]
+        with pytest.raises(ECCError, match="Invalid SLIP10-Nist256p1 backend"):
+            use("openssl")
+    finally:
+        use(backend)
+
+
+def test_slip10_nist256p1_ecc_public_keys_from_private_bytes(data):
+
+    private_keys = [get_bytes(data["eccs"]["SLIP10-Nist256p1"]["private-key"])] + [
+        sha256(bytes([index])).digest() for index in range(16)
+    ]
+    for ecc in [SLIP10Nist256p1ECCECDSA, SLIP10Nist256p1ECC] + (
+        [SLIP10Nist256p1ECCCryptography] if "cryptography" in backends() else []
+    ):
+        for public_key_type, compressed in [("uncompressed", False), ("compressed", True)]:
+            public_keys = ecc.public_keys_from_private_bytes(private_keys, compressed=compressed)
+            assert public_keys[0] == get_bytes(data["eccs"]["SLIP10-Nist256p1"][public_key_type]["public-key"])
+            assert public_keys == [
+                getattr(ecc.PRIVATE_KEY.from_bytes(private_key).public_key(), f"raw_{public_key_type}")()
+                for private_key in private_keys
+            ]
+        assert ecc.public_keys_from_private_bytes([]) == []
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            ecc.public_keys_from_private_bytes(private_keys + [bytes(32)])
@@ -5,10 +5,12 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from hashlib import sha256
 from ecdsa import (
     SigningKey, VerifyingKey
 )
 from ecdsa.ellipticcurve import PointJacobi
+import pytest
 from coincurve import (
     PrivateKey, PublicKey
 )
@@ -16,7 +18,14 @@ from coincurve import (
 from hdwallet.eccs import (
     IPoint, IPublicKey, IPrivateKey
 )
-from hdwallet.eccs.slip10.secp256k1 import SLIP10Secp256k1ECC
+from hdwallet.eccs.slip10.secp256k1 import (
+    SLIP10Secp256k1ECC, SLIP10Secp256k1ECCCoincurve, SLIP10Secp256k1ECCECDSA, backends, calibrate, use
+)
+from hdwallet.exceptions import ECCError
+from hdwallet.addresses import p2pkh
+from hdwallet.cryptocurrencies import Bitcoin
+from hdwallet.derivations import CustomDerivation
+from hdwallet.hds import BIP32HD
 
 from hdwallet.eccs.slip10.secp256k1.point import (
     SLIP10Secp256k1PointECDSA, SLIP10Secp256k1PointCoincurve
@@ -199,3 +208,97 @@ def test_slip10_secp256k1_ecc_private_key(data):
     assert isinstance(private_key.public_key(), SLIP10Secp256k1PublicKeyECDSA)
     assert private_key.public_key().raw_uncompressed() == get_bytes(data["eccs"]["SLIP10-Secp256k1"]["uncompressed"]["public-key"])
     assert private_key.public_key().raw_compressed() == get_bytes(data["eccs"]["SLIP10-Secp256k1"]["compressed"]["public-key"])
+
+
+def test_slip10_secp256k1_ecc_public_key_add_tweak(data):
+
+    for ecc, public_key_class in [
+        (SLIP10Secp256k1ECCCoincurve, SLIP10Secp256k1PublicKeyCoincurve),
+        (SLIP10Secp256k1ECCECDSA, SLIP10Secp256k1PublicKeyECDSA)
+    ]:
+        public_key = public_key_class.from_bytes(
+            get_bytes(data["eccs"]["SLIP10-Secp256k1"]["compressed"]["public-key"])
+        )
+        for tweak in [1, 2, 0xdeadbeef]:
+            tweaked_public_key = public_key.add_tweak(tweak.to_bytes(32, "big"))
+            assert isinstance(tweaked_public_key, public_key_class)
+            assert tweaked_public_key.raw_compressed() == public_key_class.from_point(
+                public_key.point() + (ecc.GENERATOR * tweak)
+            ).raw_compressed()
+
+
+def test_slip10_secp256k1_ecc_use(data, monkeypatch):
+
+    backend = SLIP10Secp256k1ECC.BACKEND
+    assert backends() == ["coincurve", "ecdsa"]
+    assert calibrate(rounds=2) in backends()
+
+    xprivate_keys = {}
+    try:
+        for name in backends():
+            assert use(name) == name == SLIP10Secp256k1ECC.BACKEND
+            assert SLIP10Secp256k1ECC.PUBLIC_KEY is Bitcoin.ECC.PUBLIC_KEY
+            # Module level aliases follow the switch wherever they were imported
+            assert p2pkh.SLIP10Secp256k1PublicKey is SLIP10Secp256k1ECC.PUBLIC_KEY
+            bip32_hd: BIP32HD = BIP32HD(
+                ecc=Bitcoin.ECC, wif_prefix=Bitcoin.NETWORKS.MAINNET.WIF_PREFIX, cache_size=0
+            ).from_seed(seed=data["hds"]["BIP32"]["seed"])
+            bip32_hd.from_derivation(
+                derivation=CustomDerivation(path=data["hds"]["BIP32"]["derivation"]["path"])
+            )
+            assert isinstance(bip32_hd._private_key, SLIP10Secp256k1ECC.PRIVATE_KEY)
+            xprivate_keys[name] = (bip32_hd.xprivate_key(), bip32_hd.address(
+                address=Bitcoin.ADDRESSES.P2PKH, public_key_address_prefix=Bitcoin.NETWORKS.MAINNET.PUBLIC_KEY_ADDRESS_PREFIX
+            ))
+        assert xprivate_keys["coincurve"] == xprivate_keys["ecdsa"]
+
+        monkeypatch.setenv("HDWALLET_SECP256K1_BACKEND", "ecdsa")
+        assert use() == "ecdsa"
+        assert use("auto") in backends()
+        with pytest.raises(ECCError, match="Invalid SLIP10-Secp256k1 backend"):
+            use("openssl")
+    finally:
+        use(backend)
+
+
+def test_slip10_secp256k1_ecc_public_keys_from_private_bytes(data):
+
+    private_keys = [get_bytes(data["eccs"]["SLIP10-Secp256k1"]["private-key"])] + [
+        sha256(bytes([index])).digest() for index in range(16)
+    ]
+    for ecc in [SLIP10Secp256k1ECCCoincurve, SLIP10Secp256k1ECCECDSA, SLIP10Secp256k1ECC]:
+        for public_key_type, compressed in [("uncompressed", False), ("compressed", True)]:
+            public_keys = ecc.public_keys_from_private_bytes(private_keys, compressed=compressed)
+            assert public_keys[0] == get_bytes(data["eccs"]["SLIP10-Secp256k1"][public_key_type]["public-key"])
+            assert public_keys == [
+                getattr(ecc.PRIVATE_KEY.from_bytes(private_key).public_key(), f"raw_{public_key_type}")()
+                for private_key in private_keys
+            ]
+        assert ecc.public_keys_from_private_bytes([]) == []
+        with pytest.raises(ValueError, match="Invalid private key bytes"):
+            ecc.public_keys_from_private_bytes(private_keys + [bytes(32)])
+
+
+def test_slip10_secp256k1_ecc_public_key_from_bytes_many(data, monkeypatch):
+
+    compressed = get_bytes(data["eccs"]["SLIP10-Secp256k1"]["compressed"]["public-key"])
+    uncompressed = get_bytes(data["eccs"]["SLIP10-Secp256k1"]["uncompressed"]["public-key"])
+    private_keys = [sha256(bytes([index])).digest() for index in range(16)]
+    for public_key_cls in [SLIP10Secp256k1PublicKeyCoincurve, SLIP10Secp256k1PublicKeyECDSA]:
+        public_keys = [compressed] + SLIP10Secp256k1ECCCoincurve.public_keys_from_private_bytes(private_keys)
+        assert public_key_cls.from_bytes_many(b"".join(public_keys)) == public_keys
+        assert public_key_cls.from_bytes_many(memoryview(b"".join(public_keys)), compressed=False) == [
+            public_key_cls.from_bytes(public_key).raw_uncompressed() for public_key in public_keys
+        ]
+        assert public_key_cls.from_bytes_many(bytearray(uncompressed * 3), length=65) == [compressed] * 3
+        assert public_key_cls.from_bytes_many(b"") == []
+        with pytest.raises(ValueError, match="Invalid public key bytes"):
+            public_key_cls.from_bytes_many(compressed + b"\x02" + bytes(32))
+        with pytest.raises(ValueError, match="Invalid public keys buffer length"):
+            public_key_cls.from_bytes_many(compressed + compressed[:-1])
+        with pytest.raises(ValueError, match="Invalid public keys buffer length"):
+            public_key_cls.from_bytes_many(compressed, length=0)
+
+    # Without coincurve's private modules the batch parses key by key
+    monkeypatch.setattr("hdwallet.eccs.slip10.secp256k1.public_key.ffi", None)
+    assert SLIP10Secp256k1PublicKeyCoincurve.from_bytes_many(bytearray(uncompressed * 3), length=65) == [compressed] * 3
@@ -91,3 +91,74 @@ def test_bip32_hd(data):
         address=Cryptocurrency.ADDRESSES.P2WSH_IN_P2SH,
         script_address_prefix=Cryptocurrency.NETWORKS.MAINNET.SCRIPT_ADDRESS_PREFIX
     ) == data["hds"]["BIP32"]["derivation"]["addresses"]["p2wsh-in-p2sh"]
+
+
+def test_bip32_hd_derivation_cache(data):
+    cached_bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, wif_prefix=Cryptocurrency.NETWORKS.MAINNET.WIF_PREFIX, cache_size=4
+    ).from_seed(seed=data["hds"]["BIP32"]["seed"])
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, wif_prefix=Cryptocurrency.NETWORKS.MAINNET.WIF_PREFIX, cache_size=0
+    ).from_seed(seed=data["hds"]["BIP32"]["seed"])
+
+    for path in [
+        "m/44'/0'/0'/0/0", "m/44'/0'/0'/0/1", "m/44'/0'/0'/1/0", "m/44'/0'/0'", "m/44'/0'/0'/0/1", "m/0/1"
+    ]:
+        cached_bip32_hd.update_derivation(derivation=CustomDerivation(path=path))
+        bip32_hd.update_derivation(derivation=CustomDerivation(path=path))
+
+        assert cached_bip32_hd.xprivate_key() == bip32_hd.xprivate_key()
+        assert cached_bip32_hd.xpublic_key() == bip32_hd.xpublic_key()
+        assert cached_bip32_hd.depth() == bip32_hd.depth()
+        assert cached_bip32_hd.index() == bip32_hd.index()
+        assert cached_bip32_hd.parent_fingerprint() == bip32_hd.parent_fingerprint()
+        assert len(cached_bip32_hd._cache) <= 4
+
+    cached_bip32_hd.update_derivation(
+        derivation=CustomDerivation(path=data["hds"]["BIP32"]["derivation"]["path"])
+    )
+    assert cached_bip32_hd.xprivate_key() == data["hds"]["BIP32"]["derivation"]["xprivate-key"]
+    assert cached_bip32_hd.clear_cache()._cache == {}
+
+
+def test_bip32_hd_derive_range(data):
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, wif_prefix=Cryptocurrency.NETWORKS.MAINNET.WIF_PREFIX
+    ).from_seed(seed=data["hds"]["BIP32"]["seed"])
+    bip32_hd.from_derivation(
+        derivation=CustomDerivation(path=data["hds"]["BIP32"]["derivation"]["path"])
+    )
+
+    children = bip32_hd.derive_range("m/44'/0'/0'/0", 0, 3)
+    hardened_children = bip32_hd.derive_range([0x8000002c], 1, 2, hardened=True)
+
+    assert bip32_hd.path() == data["hds"]["BIP32"]["derivation"]["path"]
+    assert bip32_hd.xprivate_key() == data["hds"]["BIP32"]["derivation"]["xprivate-key"]
+
+    for path, (public_key, chain_code, private_key) in zip(
+        ["m/44'/0'/0'/0/0", "m/44'/0'/0'/0/1", "m/44'/0'/0'/0/2", "m/44'/1'"], children + hardened_children
+    ):
+        bip32_hd.update_derivation(derivation=CustomDerivation(path=path))
+        assert public_key.hex() == bip32_hd.public_key()
+        assert chain_code.hex() == bip32_hd.chain_code()
+        assert private_key.hex() == bip32_hd.private_key()
+
+
+def test_bip32_hd_bytes_accessors(data):
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, wif_prefix=Cryptocurrency.NETWORKS.MAINNET.WIF_PREFIX
+    ).from_seed(seed=data["hds"]["BIP32"]["seed"])
+    bip32_hd.from_derivation(
+        derivation=CustomDerivation(path=data["hds"]["BIP32"]["derivation"]["path"])
+    )
+
+    assert bip32_hd.root_private_key_bytes().hex() == bip32_hd.root_private_key()
+    assert bip32_hd.root_chain_code_bytes().hex() == bip32_hd.root_chain_code()
+    assert bip32_hd.root_public_key_bytes().hex() == bip32_hd.root_public_key()
+    assert bip32_hd.private_key_bytes().hex() == bip32_hd.private_key()
+    assert bip32_hd.chain_code_bytes().hex() == bip32_hd.chain_code()
+    assert bip32_hd.public_key_bytes().hex() == bip32_hd.public_key()
+    assert bip32_hd.public_key_bytes(public_key_type="uncompressed").hex() == bip32_hd.uncompressed()
+    assert bip32_hd.hash_bytes().hex() == bip32_hd.hash()
+    assert bip32_hd.fingerprint_bytes().hex() == bip32_hd.fingerprint()
+    assert bip32_hd.parent_fingerprint_bytes().hex() == bip32_hd.parent_fingerprint()
@@ -5,6 +5,8 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+import pickle
+
 from hdwallet import HDWallet
 from hdwallet.cryptocurrencies import CRYPTOCURRENCIES
 from hdwallet.derivations import DERIVATIONS
@@ -154,3 +156,37 @@ def test_bip44_from_mnemonic_uncompressed(data):
     del dump["derivations"]
     dump["derivation"] = data["hdwallet"]["BIP44"]["uncompressed"]["derivations"][-1].copy()
     assert hdwallet.dump() == dump
+
+
+def test_bip44_from_mnemonic_dumps_workers(data):
+
+    cryptocurrency = CRYPTOCURRENCIES.cryptocurrency(
+        data["hdwallet"]["BIP44"]["compressed"]["cryptocurrency"]
+    )
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=cryptocurrency,
+        hd=HDS.hd(
+            data["hdwallet"]["BIP44"]["compressed"]["hd"]
+        ),
+        network=data["hdwallet"]["BIP44"]["compressed"]["network"],
+        language=data["hdwallet"]["BIP44"]["compressed"]["language"].lower(),
+        public_key_type=data["hdwallet"]["BIP44"]["compressed"]["public_key_type"]
+    ).from_mnemonic(
+        mnemonic=BIP39Mnemonic(
+            mnemonic=data["hdwallet"]["BIP44"]["compressed"]["mnemonic"]
+        )
+    ).from_derivation(
+        derivation=DERIVATIONS.derivation(data["hdwallet"]["BIP44"]["derivation"]["name"])(
+            **data["hdwallet"]["BIP44"]["derivation"]["args"]
+        )
+    )
+
+    # The worker processes are only sent the settings, the seed and the derivation
+    name, arguments = hdwallet._root
+    assert name == "from_seed"
+    assert arguments["seed"].seed() == data["hdwallet"]["BIP44"]["compressed"]["seed"]
+    assert data["hdwallet"]["BIP44"]["compressed"]["mnemonic"].encode() not in pickle.dumps(
+        (hdwallet._settings, hdwallet._root, hdwallet._derivation)
+    )
+
+    assert hdwallet.dumps(workers=2) == data["hdwallet"]["BIP44"]["compressed"]
@@ -161,4 +161,106 @@ def test_bip44_from_seed_uncompressed(data):
 
     assert hdwallet.address(
         public_key_address_prefix=cryptocurrency.NETWORKS.MAINNET.PUBLIC_KEY_ADDRESS_PREFIX
-    ) == dump["derivation"]["address"]
\ No newline at end of file
+    ) == dump["derivation"]["address"]
+
+def test_bip44_from_seed_dumps_workers(data):
+
+    cryptocurrency = CRYPTOCURRENCIES.cryptocurrency(
+        data["hdwallet"]["BIP44"]["compressed"]["cryptocurrency"]
+    )
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=cryptocurrency,
+        hd=HDS.hd(
+            data["hdwallet"]["BIP44"]["compressed"]["hd"]
+        ),
+        network=data["hdwallet"]["BIP44"]["compressed"]["network"],
+        language=data["hdwallet"]["BIP44"]["compressed"]["language"].lower(),
+        public_key_type=data["hdwallet"]["BIP44"]["compressed"]["public_key_type"]
+    ).from_seed(
+        seed=BIP39Seed(
+            seed=data["hdwallet"]["BIP44"]["compressed"]["seed"]
+        )
+    ).from_derivation(
+        derivation=DERIVATIONS.derivation(data["hdwallet"]["BIP44"]["derivation"]["name"])(
+            **data["hdwallet"]["BIP44"]["derivation"]["args"]
+        )
+    )
+
+    dump = data["hdwallet"]["BIP44"]["compressed"].copy()
+    dump.update({
+        "entropy": None,
+        "strength": None,
+        "mnemonic": None,
+        "passphrase": None,
+        "language": None
+    })
+    assert hdwallet.dumps(workers=2) == dump
+
+    del dump["derivations"]
+    dump["derivation"] = data["hdwallet"]["BIP44"]["compressed"]["derivations"][-1].copy()
+
+    assert hdwallet.dump() == dump
+
+
+def test_bip44_from_seed_iter_dumps(data):
+
+    cryptocurrency = CRYPTOCURRENCIES.cryptocurrency(
+        data["hdwallet"]["BIP44"]["compressed"]["cryptocurrency"]
+    )
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=cryptocurrency,
+        hd=HDS.hd(
+            data["hdwallet"]["BIP44"]["compressed"]["hd"]
+        ),
+        network=data["hdwallet"]["BIP44"]["compressed"]["network"],
+        language=data["hdwallet"]["BIP44"]["compressed"]["language"].lower(),
+        public_key_type=data["hdwallet"]["BIP44"]["compressed"]["public_key_type"]
+    ).from_seed(
+        seed=BIP39Seed(
+            seed=data["hdwallet"]["BIP44"]["compressed"]["seed"]
+        )
+    ).from_derivation(
+        derivation=DERIVATIONS.derivation(data["hdwallet"]["BIP44"]["derivation"]["name"])(
+            **data["hdwallet"]["BIP44"]["derivation"]["args"]
+        )
+    )
+
+    dumps = hdwallet.iter_dumps()
+
+    assert next(dumps) == data["hdwallet"]["BIP44"]["compressed"]["derivations"][0]
+    assert list(dumps) == data["hdwallet"]["BIP44"]["compressed"]["derivations"][1:]
+
+
+def test_bip44_from_seed_dump_include(data):
+
+    cryptocurrency = CRYPTOCURRENCIES.cryptocurrency(
+        data["hdwallet"]["BIP44"]["compressed"]["cryptocurrency"]
+    )
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=cryptocurrency,
+        hd=HDS.hd(
+            data["hdwallet"]["BIP44"]["compressed"]["hd"]
+        ),
+        network=data["hdwallet"]["BIP44"]["compressed"]["network"],
+        language=data["hdwallet"]["BIP44"]["compressed"]["language"].lower(),
+        public_key_type=data["hdwallet"]["BIP44"]["compressed"]["public_key_type"]
+    ).from_seed(
+        seed=BIP39Seed(
+            seed=data["hdwallet"]["BIP44"]["compressed"]["seed"]
+        )
+    ).from_derivation(
+        derivation=DERIVATIONS.derivation(data["hdwallet"]["BIP44"]["derivation"]["name"])(
+            **data["hdwallet"]["BIP44"]["derivation"]["args"]
+        )
+    )
+
+    derivations = data["hdwallet"]["BIP44"]["compressed"]["derivations"]
+
+    assert hdwallet.dumps(exclude={"root"}, include={"at:path", "public-key"}) == [
+        {"at": {"path": derivation["at"]["path"]}, "public_key": derivation["public_key"]}
+        for derivation in derivations
+    ]
+    assert hdwallet.dump(include={"symbol", "derivation.address"}) == {
+        "symbol": data["hdwallet"]["BIP44"]["compressed"]["symbol"],
+        "derivation": {"address": derivations[-1]["address"]}
+    }
@@ -14,7 +14,7 @@ from hdwallet.mnemonics.bip39.mnemonic import (
     BIP39Mnemonic, BIP39_MNEMONIC_LANGUAGES, BIP39_MNEMONIC_WORDS
 )
 from hdwallet.exceptions import (
-    MnemonicError, EntropyError
+    MnemonicError, EntropyError, ChecksumError
 )
 
 
@@ -93,3 +93,78 @@ def test_bip39_mnemonics(data):
             entropy="cdf694ac868efd01673fc51e897c57a0bd428503080ad4c94c7d6f6d13f095fbc8",
             language=BIP39_MNEMONIC_LANGUAGES.ENGLISH
         )
+
+
+def test_bip39_wordlists_cached(monkeypatch):
+
+    english = BIP39Mnemonic.get_words_list_by_language(language="english")
+    (_, _, english_indices), = BIP39Mnemonic.wordlist_indices(language="english")
+    list(BIP39Mnemonic.wordlist_indices())
+
+    # Once loaded, packaged words lists and their indices never touch the filesystem again
+    def no_open(*args, **kwargs):
+        raise AssertionError("words list re-read from disk")
+
+    monkeypatch.setattr("builtins.open", no_open)
+    words_list = BIP39Mnemonic.get_words_list_by_language(language="english")
+    assert words_list == english and len(words_list) == 2048
+    words_list.append("mutated")
+    assert BIP39Mnemonic.get_words_list_by_language(language="english") == english
+
+    (_, _, word_indices), = BIP39Mnemonic.wordlist_indices(language="english")
+    assert word_indices is english_indices
+    assert BIP39Mnemonic.is_valid(
+        "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+    )
+
+
+def test_bip39_language_index():
+
+    # The per-language indices rank exactly as probing each language's WordIndices does
+    for mnemonic, language in [
+        ("abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about", None),
+        ("abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about", "french"),
+        ("aban aban aban aban aban aban aban aban aban aban aban abou", None),
+        ("essence capable figure noble distance fruit intact amateur surprise distance vague unique", None),
+        ("essence capable figure noble distance fruit intact amateur surprise distance vague unique", "english"),
+        ("epicerie epidemie epier epilogue epine episode", None),
+        ("épicerie épidémie épier épil épine épis", "french"),
+    ]:
+        words = BIP39Mnemonic.normalize(mnemonic)
+        indexed = BIP39Mnemonic.rank_languages(words, language=language)
+        probed = BIP39Mnemonic.rank_languages(
+            words, language=language, wordlist_path=dict(BIP39Mnemonic.wordlist_path)
+        )
+        assert [(ratio, candidate) for ratio, _, candidate in indexed] == \
+            [(ratio, candidate) for ratio, _, candidate in probed]
+
+    assert BIP39Mnemonic._get_cached_language_index("english")["abandon"] == 0
+    assert BIP39Mnemonic._get_cached_language_index("french")["abandon"] == 1
+    with pytest.raises(MnemonicError, match="Invalid BIP39 mnemonic words"):
+        list(BIP39Mnemonic.rank_languages(["abandon", "zzzzzz"]))
+
+
+def test_bip39_many():
+
+    entropies = [
+        "00000000000000000000000000000000",
+        "7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f",
+        "ffffffffffffffffffffffffffffffffffffffffffffffff",
+        "8080808080808080808080808080808080808080808080808080808080808080",
+    ]
+    mnemonics = BIP39Mnemonic.encode_many(entropies, language="english")
+    assert mnemonics == [BIP39Mnemonic.encode(entropy, language="english") for entropy in entropies]
+    assert mnemonics[0] == (
+        "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+    )
+    assert BIP39Mnemonic.decode_many(mnemonics) == entropies
+    assert BIP39Mnemonic.decode_many(mnemonics[:1], checksum=True) == ["0000000000000000000000000000000003"]
+
+    # The last word of the first mnemonic carries the 4-bit checksum 0b0011; "abandon" (index 0) fails
+    invalid = " ".join(["abandon"] * 12)
+    assert BIP39Mnemonic.is_valid_many([mnemonics[1], invalid, "zoo"]) == [True, False, False]
+    with pytest.raises(ChecksumError) as excinfo:
+        BIP39Mnemonic.decode_many([mnemonics[0], invalid], language="english")
+    assert str(excinfo.value) == "Invalid english checksum, (expected: 0000 | got: '0011')"
+    with pytest.raises(EntropyError, match="Wrong entropy strength"):
+        BIP39Mnemonic.encode_many(["00"], language="english")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import Bitcoin
+from hdwallet.derivations import BIP84Derivation
+from hdwallet.exceptions import (
+    Error, MnemonicError
+)
+from hdwallet.hds import BIP84HD
+from hdwallet.mnemonics import (
+    BIP39Mnemonic, recover, word_candidates
+)
+
+
+MNEMONIC = "army van defense carry jealous true garbage claim echo media make crunch"
+
+
+def test_word_candidates():
+
+    assert word_candidates("abandon", "english") == ["abandon"]
+    assert word_candidates("aban", "english") == ["abandon"]
+    assert word_candidates("abandn", "english") == ["abandon"]
+    assert word_candidates("abnadon", "english") == ["abandon"]
+    assert word_candidates("vann", "english") == ["banner", "cannon", "van", "vanish"]
+    assert word_candidates("epicerie", "french") == ["épicerie"]
+    assert word_candidates("épicrie", "french") == ["épicerie"]
+    assert word_candidates("zzzzzz", "english") == []
+    assert len(word_candidates("?", "english")) == 2048
+
+
+def test_recover():
+
+    words = MNEMONIC.split()
+    assert BIP39Mnemonic.is_valid(MNEMONIC)
+
+    # Every checksum-valid candidate is returned, without target addresses
+    recovered = recover(words[:5] + ["?"] + words[6:])
+    assert MNEMONIC in recovered and len(recovered) == 121
+    assert all(BIP39Mnemonic.is_valid(mnemonic) for mnemonic in recovered)
+    assert len(recover(words[:11] + [None])) == 128
+
+    assert recover(["army", "vann"] + words[2:]) == [
+        "army cannon defense carry jealous true garbage claim echo media make crunch", MNEMONIC
+    ]
+    assert MNEMONIC in recover([words[1], words[0]] + words[2:], swaps=True)
+    assert MNEMONIC in recover(words[:3] + words[4:], missing=1)
+
+    with pytest.raises(MnemonicError, match="Invalid mnemonic words count"):
+        recover(words[:10])
+    with pytest.raises(MnemonicError, match="No english candidates"):
+        recover(words[:11] + ["zzzzzz"])
+    with pytest.raises(Error, match="Invalid number of workers"):
+        recover(words, workers=0)
+
+
+def test_recover_addresses():
+
+    hdwallet = HDWallet(cryptocurrency=Bitcoin, hd=BIP84HD, network="mainnet")
+    address = HDWallet(cryptocurrency=Bitcoin, hd=BIP84HD, network="mainnet").from_mnemonic(
+        BIP39Mnemonic(MNEMONIC)
+    ).from_derivation(BIP84Derivation(address=3)).address()
+
+    damaged = MNEMONIC.split()
+    damaged[5] = "?"
+    for workers in [None, 2]:
+        progress = []
+        assert recover(
+            damaged, addresses={address}, hdwallet=hdwallet, derivation=BIP84Derivation(address=(0, 4)),
+            workers=workers, progress=lambda searched, total: progress.append((searched, total))
+        ) == [MNEMONIC]
+        assert progress[-1] == (2048, 2048)
+
+    # The default derivation only reaches the first address
+    assert recover(damaged, addresses={address}, hdwallet=hdwallet) == []
+    with pytest.raises(Error, match="Must provide an hdwallet"):
+        recover(damaged, addresses={address})
@@ -9,7 +9,11 @@ import json
 import os
 import pytest
 
+from hdwallet.seeds import (
+    SEEDS, PBKDF2Seed
+)
 from hdwallet.seeds.bip39 import BIP39Seed
+from hdwallet.exceptions import SeedError
 
 
 def test_bip39_seeds(data):
@@ -24,3 +28,32 @@ def test_bip39_seeds(data):
                 assert BIP39Seed.from_mnemonic(
                     mnemonic= data["seeds"]["BIP39"][words][lang]["mnemonic"], passphrase=passphrase
                 ) == data["seeds"]["BIP39"][words][lang]["passphrases"][passphrase]
+
+
+def test_bip39_seeds_from_mnemonics(data):
+
+    entries = [
+        data["seeds"]["BIP39"][words][lang]
+        for words in data["seeds"]["BIP39"].keys() for lang in data["seeds"]["BIP39"][words].keys()
+    ]
+    mnemonics = [entry["mnemonic"] for entry in entries]
+
+    for workers in [None, 4]:
+        assert BIP39Seed.from_mnemonics(mnemonics=mnemonics, workers=workers) == [
+            entry["non-passphrase-seed"] for entry in entries
+        ]
+        assert BIP39Seed.from_mnemonics(mnemonics=mnemonics, passphrases="hdwallet", workers=workers) == [
+            entry["passphrases"]["hdwallet"] for entry in entries
+        ]
+
+    assert BIP39Seed.from_mnemonics(
+        mnemonics=mnemonics[:2], passphrases=[None, "hdwallet"]
+    ) == [entries[0]["non-passphrase-seed"], entries[1]["passphrases"]["hdwallet"]]
+
+    with pytest.raises(SeedError, match="Invalid number of passphrases"):
+        BIP39Seed.from_mnemonics(mnemonics=mnemonics[:2], passphrases=["hdwallet"])
+
+    # Only the PBKDF2 stretched seeds convert mnemonics in batches
+    assert [seed.name() for seed in SEEDS.classes() if hasattr(seed, "from_mnemonics")] == [
+        seed.name() for seed in SEEDS.classes() if issubclass(seed, PBKDF2Seed)
+    ] == ["BIP39", "Electrum-V2"]
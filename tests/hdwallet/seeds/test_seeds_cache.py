@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from hdwallet.exceptions import SeedError
+from hdwallet.seeds import (
+    SEED_CACHE, BIP39Seed, CardanoSeed
+)
+
+
+def test_seed_cache(data):
+
+    mnemonic = data["seeds"]["BIP39"]["12"]["english"]["mnemonic"]
+    seed = data["seeds"]["BIP39"]["12"]["english"]["passphrases"]["hdwallet"]
+
+    assert SEED_CACHE.max_size() == 0
+    assert BIP39Seed.from_mnemonic(mnemonic=mnemonic, passphrase="hdwallet") == seed
+    assert len(SEED_CACHE) == 0
+
+    try:
+        SEED_CACHE.resize(max_size=2)
+        assert BIP39Seed.from_mnemonic(mnemonic=mnemonic, passphrase="hdwallet") == seed
+        assert BIP39Seed.from_mnemonic(mnemonic, "hdwallet") == seed
+        assert len(SEED_CACHE) == 1
+
+        assert BIP39Seed.from_mnemonic(mnemonic=mnemonic) == data["seeds"]["BIP39"]["12"]["english"]["non-passphrase-seed"]
+        assert CardanoSeed.from_mnemonic(mnemonic=mnemonic) != BIP39Seed.from_mnemonic(mnemonic=mnemonic)
+        assert len(SEED_CACHE) == 2
+
+        seeds = list(SEED_CACHE._seeds.values())
+        SEED_CACHE.clear()
+        assert len(SEED_CACHE) == 0
+        assert all(set(cached) == {0} for cached in seeds)
+
+        with pytest.raises(SeedError, match="Invalid seed cache size"):
+            SEED_CACHE.resize(max_size=-1)
+    finally:
+        SEED_CACHE.resize(max_size=0)
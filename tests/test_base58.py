@@ -10,7 +10,8 @@ import hashlib
 
 from hdwallet.libs.ripemd160 import ripemd160
 from hdwallet.libs.base58 import (
-    checksum_encode, check_encode, check_decode, decode, encode, string_to_int
+    checksum_encode, check_encode, check_encode_many, check_decode, check_decode_many,
+    decode, decode_many, encode, encode_many, string_to_int
 )
 
 
@@ -37,6 +38,13 @@ def test_base58():
 
     assert encode(decode("111233QC4")) == "111233QC4"
 
+    assert encode_many([b"", b"\0\0", unhexlify(RAW)]) == ["", "11", encode(unhexlify(RAW))]
+    assert decode_many(["111233QC4", ENCODED_RAW]) == [decode("111233QC4"), decode(ENCODED_RAW)]
+    assert check_decode_many(check_encode_many([unhexlify(RAW), b"\0"])) == [unhexlify(RAW), b"\0"]
+
+    with pytest.raises(ValueError, match="Invalid base58 character"):
+        decode("0OIl")
+
     # Ensure ETH address checksums are correct; these are Keccak hash of the lower-case hex address,
     # with hash results mapped onto the upper/lower case bits of the address.
     eth = "0xfc2077CA7F403cBECA41B1B0F62D91B5EA631B5E"
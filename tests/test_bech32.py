@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+from binascii import unhexlify
+
+from hdwallet.libs.bech32 import (
+    bech32_decode, bech32_encode, bech32_encode_many
+)
+from hdwallet.libs.segwit_bech32 import (
+    segwit_decode, segwit_encode, segwit_encode_many
+)
+
+
+P2WPKH_PROGRAM: bytes = unhexlify("751e76e8199196d454941c45d1b3a323f1433bd6")
+P2TR_PROGRAM: bytes = unhexlify("79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")
+
+
+def test_segwit_bech32():
+
+    assert segwit_encode("bc", 0, P2WPKH_PROGRAM) == "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4"
+    assert segwit_encode("bc", 1, P2TR_PROGRAM) == "bc1p0xlxvlhemja6c4dqv22uapctqupfhlxm9h8z3k2e72q4k9hcz7vqzk5jj0"
+    assert segwit_decode("bc", "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4") == (0, P2WPKH_PROGRAM)
+    assert segwit_decode("bc", "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t5") == (None, None)
+    assert segwit_decode("tb", "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4") == (None, None)
+
+    assert segwit_encode_many("bc", 0, [P2WPKH_PROGRAM, bytes(20)]) == [
+        segwit_encode("bc", 0, P2WPKH_PROGRAM), segwit_encode("bc", 0, bytes(20))
+    ]
+
+
+def test_bech32():
+
+    for hrp in ["cosmos", "addr", "inj"]:
+        address = bech32_encode(hrp, P2WPKH_PROGRAM)
+        assert address.startswith(hrp + "1")
+        assert bech32_decode(hrp, address)[1] == P2WPKH_PROGRAM
+        assert bech32_decode(hrp, address.upper())[1] == P2WPKH_PROGRAM
+        assert bech32_decode(hrp, address[:-1] + ("p" if address[-1] == "q" else "q")) == (None, None)
+
+    assert bech32_encode_many("cosmos", [P2WPKH_PROGRAM, P2TR_PROGRAM]) == [
+        bech32_encode("cosmos", P2WPKH_PROGRAM), bech32_encode("cosmos", P2TR_PROGRAM)
+    ]
@@ -655,5 +655,31 @@ def test_bip39_korean():
 각     오                                                      == 18
       자                                                      == 19"""
 
+def test_word_indices_arrays():
+    # The flat sorted arrays resolve exactly as a Trie search w/ completion, and pickle w/o rebuilding
+    import pickle
+
+    (_, french_nfc, french_indices), = BIP39Mnemonic.wordlist_indices(
+        dict(
+            french = BIP39Mnemonic.wordlist_path["french"]
+        )
+    )
+    trie = french_indices._trie
+    assert set(french_indices.unique()) == {word for word, _ in trie.scan()}
+    for word in french_nfc[:100]:
+        for length in range(1, len(word) + 1):
+            for key in (word[:length], unicodedata.normalize("NFKD", word[:length])):
+                terminal, _, node = trie.search(key, complete=True)
+                if not terminal:
+                    with pytest.raises(KeyError):
+                        french_indices.get_details(key)
+                    continue
+                assert french_indices.get_details(key) == (french_nfc[node.value], node.value, set(node.children))
+    assert french_indices["brebis"] == french_indices["brèbis"] == french_indices["brèb"] == french_nfc.index("brebis")
+
+    restored = pickle.loads(pickle.dumps(french_indices))
+    assert restored.arrays() == french_indices.arrays()
+    assert dict(restored.indices()) == dict(french_indices.indices())
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -9,8 +9,10 @@ import pytest
 from hdwallet.crypto import (
     hmac_sha256, hmac_sha512, blake2b, blake2b_32, blake2b_40, blake2b_160, blake2b_224, blake2b_256, blake2b_512,
     chacha20_poly1305_encrypt, chacha20_poly1305_decrypt, sha256, double_sha256, hash160, crc32, xmodem_crc, 
-    pbkdf2_hmac_sha512, kekkak256, ripemd160, sha512, sha512_256, sha3_256
+    pbkdf2_hmac_sha512, kekkak256, ripemd160, sha512, sha512_256, sha3_256, ripemd160_backend,
+    sha256_many, double_sha256_many, hash160_many, kekkak256_many, blake2b_many
 )
+from hdwallet.libs.ripemd160 import ripemd160 as python_ripemd160
 
 # def test_hmac_sha256():
 #     assert hmac_sha256("key", "data") == b'todo_mock'
@@ -71,8 +73,26 @@ from hdwallet.crypto import (
 # def test_kekkak256():
 #     assert kekkak256("data") == b'todo_mock'
 
-# def test_ripemd160():
-#     assert ripemd160("data") == b'todo_mock'
+def test_ripemd160():
+    assert ripemd160_backend() in ["hashlib", "pycryptodome", "python"]
+    assert ripemd160(b"").hex() == "9c1185a5c5e9fc54612808977ee8f548b2258d31"
+    assert ripemd160(b"abc").hex() == "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"
+    for data in [b"\x02" * 33, b"\x04" * 65, bytes(range(256))]:
+        assert ripemd160(data) == python_ripemd160(data)
+        assert hash160(data) == python_ripemd160(sha256(data))
+
+
+def test_hash_many():
+    datas = [b"", b"\x02" * 33, b"\x04" * 65, bytes(range(256))]
+    for workers in [None, 3]:
+        assert sha256_many(datas, workers=workers) == [sha256(data) for data in datas]
+        assert sha256_many(datas, prefix=b"tag", workers=workers) == [sha256(b"tag" + data) for data in datas]
+        assert double_sha256_many(datas, workers=workers) == [double_sha256(data) for data in datas]
+        assert hash160_many(datas, workers=workers) == [hash160(data) for data in datas]
+        assert kekkak256_many(datas, prefix=b"SubAddr\x00", workers=workers) == [
+            kekkak256(b"SubAddr\x00" + data) for data in datas
+        ]
+        assert blake2b_many(datas, 28, workers=workers) == [blake2b_224(data) for data in datas]
 
 # def test_sha512():
 #     assert sha512("data") == b'todo_mock'